@@ -10,10 +10,23 @@ __version__ = "0.1.0"
 __author__ = "Fabián Abarca"
 __email__ = "ensinergia@gmail.com"
 
-# Core imports for easy access
-from .api import DatabusClient
-from .gtfs import GTFSProcessor, GTFSValidator
-from .validation import ValidationReport, ValidationRule
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api import DatabusClient
+    from .gtfs import GTFSProcessor, GTFSValidator
+    from .validation import ValidationReport, ValidationRule
+
+# Core classes are imported lazily on first access (PEP 562) so that
+# ``import databus`` does not pull in pandas and pydantic up front
+_LAZY_IMPORTS = {
+    "DatabusClient": ".api",
+    "GTFSProcessor": ".gtfs",
+    "GTFSValidator": ".gtfs",
+    "ValidationReport": ".validation",
+    "ValidationRule": ".validation",
+}
 
 __all__ = [
     "DatabusClient",
@@ -22,3 +35,15 @@ __all__ = [
     "ValidationReport",
     "ValidationRule",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,13 +1,22 @@
 """Databús API client module."""
 
 from .client import DatabusClient
+from .async_client import AsyncDatabusClient
 from .models import Feed, Agency, Route, Stop, Trip
+from .records import FeedRecord, AgencyRecord, RouteRecord, StopRecord, StopTable, TripRecord
 
 __all__ = [
     "DatabusClient",
+    "AsyncDatabusClient",
     "Feed",
     "Agency", 
     "Route",
     "Stop",
     "Trip",
+    "FeedRecord",
+    "AgencyRecord",
+    "RouteRecord",
+    "StopRecord",
+    "StopTable",
+    "TripRecord",
 ]
@@ -0,0 +1,427 @@
+"""Asynchronous Databús API client for concurrent access to transit data APIs."""
+
+import asyncio
+import logging
+import os
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union, Any
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .endpoints import (
+    AGENCIES_ENDPOINT,
+    FEEDS_ENDPOINT,
+    FEED_DOWNLOAD_ENDPOINT,
+    FEED_ENDPOINT,
+    ROUTES_ENDPOINT,
+    STOPS_ENDPOINT,
+    TRIPS_ENDPOINT,
+    endpoint_url,
+    query_params,
+)
+from .models import Feed, Agency, Route, Stop, Trip
+from .records import RouteRecord, StopRecord, TripRecord
+from ..utils.exceptions import DatabusAPIError, DatabusConnectionError, FeedDownloadError
+from ..utils.serialization import json_loads
+
+
+logger = logging.getLogger(__name__)
+
+# Delay used when a 429 response has no usable Retry-After header
+_DEFAULT_RETRY_DELAY = 1.0
+
+
+def _retry_after_delay(value: Optional[str]) -> float:
+    """Get the delay in seconds requested by a Retry-After header.
+    
+    The header holds either a number of seconds or an HTTP-date.
+    
+    Args:
+        value: Retry-After header value, if any
+    
+    Returns:
+        Non-negative delay in seconds
+    """
+    if value is None:
+        return _DEFAULT_RETRY_DELAY
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return _DEFAULT_RETRY_DELAY
+    
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class AsyncDatabusClient:
+    """Asynchronous client for interacting with Databús APIs.
+    
+    Mirrors the :class:`DatabusClient` API on top of a single pooled
+    ``aiohttp.ClientSession`` so independent endpoint calls can run
+    concurrently on one event loop. Requires the ``async`` extra.
+    
+    Args:
+        base_url: Base URL for the Databús API
+        api_key: Optional API key for authenticated requests
+        timeout: Request timeout in seconds
+        max_retries: Maximum number of retries for rate-limited downloads
+        limit: Maximum number of simultaneous connections
+        limit_per_host: Maximum number of simultaneous connections per host
+    
+    Example:
+        >>> async with AsyncDatabusClient("https://api.databus.cr") as client:
+        ...     bundle = await client.get_feed_bundle("costa-rica-gtfs")
+        >>> len(bundle["stops"])
+    """
+    
+    def __init__(
+        self,
+        base_url: str = "https://api.databus.cr",
+        api_key: Optional[str] = None,
+        timeout: int = 30,
+        max_retries: int = 3,
+        limit: int = 32,
+        limit_per_host: int = 16,
+    ):
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncDatabusClient requires aiohttp. "
+                "Install it with: pip install 'databus[async]'"
+            )
+        
+        self.base_url = base_url.rstrip("/")
+        self._base = self.base_url + "/"
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.session = None
+        
+        # Set default headers
+        self.headers = {
+            "User-Agent": "databus-python-sdk/0.1.0",
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+        if self.api_key:
+            self.headers["Authorization"] = f"Bearer {self.api_key}"
+    
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Get the shared session, creating it inside the running event loop."""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=85,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self.session
+    
+    async def close(self) -> None:
+        """Close the underlying session and release pooled connections."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+    
+    async def __aenter__(self) -> "AsyncDatabusClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+    
+    def _url(self, endpoint: str) -> str:
+        """Build the absolute URL for an endpoint, keeping any base URL path."""
+        return endpoint_url(self._base, endpoint)
+    
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Make HTTP request to API endpoint."""
+        url = self._url(endpoint)
+        
+        try:
+            async with self._get_session().request(
+                method,
+                url,
+                params=params or None,
+                json=data,
+            ) as response:
+                response.raise_for_status()
+                return json_loads(await response.read())
+        
+        except aiohttp.ClientConnectionError as e:
+            raise DatabusConnectionError(f"Failed to connect to {url}: {e}")
+        except asyncio.TimeoutError as e:
+            raise DatabusConnectionError(f"Request timed out: {e}")
+        except aiohttp.ClientResponseError as e:
+            raise DatabusAPIError(f"API request failed: {e}", status_code=e.status)
+        except aiohttp.ClientError as e:
+            raise DatabusAPIError(f"Request failed: {e}")
+        except ValueError as e:
+            raise DatabusAPIError(f"Invalid JSON response from {url}: {e}")
+    
+    async def get_feeds(
+        self,
+        country: Optional[str] = None,
+        validate: bool = True,
+    ) -> List[Feed]:
+        """Get list of available GTFS feeds.
+        
+        Args:
+            country: Filter feeds by country code (e.g., 'CR', 'GT')
+            validate: Validate each record; pass False to skip validation
+                for trusted payloads
+        
+        Returns:
+            List of Feed objects
+        """
+        params = query_params(country=country)
+        
+        data = await self._make_request("GET", FEEDS_ENDPOINT, params=params)
+        return [Feed.from_dict(feed_data, validate=validate) for feed_data in data.get("feeds", [])]
+    
+    async def get_feed(self, feed_id: str) -> Feed:
+        """Get specific GTFS feed by ID.
+        
+        Args:
+            feed_id: Feed identifier
+        
+        Returns:
+            Feed object
+        """
+        data = await self._make_request("GET", FEED_ENDPOINT.format(feed_id))
+        return Feed.from_dict(data)
+    
+    async def get_agencies(self, feed_id: str, validate: bool = True) -> List[Agency]:
+        """Get agencies for a specific feed.
+        
+        Args:
+            feed_id: Feed identifier
+            validate: Validate each record; pass False to skip validation
+                for trusted payloads
+        
+        Returns:
+            List of Agency objects
+        """
+        data = await self._make_request("GET", AGENCIES_ENDPOINT.format(feed_id))
+        return [Agency.from_dict(agency_data, validate=validate) for agency_data in data.get("agencies", [])]
+    
+    async def get_routes(
+        self,
+        feed_id: str,
+        agency_id: Optional[str] = None,
+        route_type: Optional[int] = None,
+        validate: bool = True,
+        as_record: bool = False,
+    ) -> List[Union[Route, RouteRecord]]:
+        """Get routes for a specific feed.
+        
+        Args:
+            feed_id: Feed identifier
+            agency_id: Filter by agency ID
+            route_type: Filter by GTFS route type
+            validate: Validate each record; pass False to skip validation
+                for trusted payloads
+            as_record: Return lightweight read-only RouteRecord objects
+                instead of validated models
+        
+        Returns:
+            List of Route objects
+        """
+        params = query_params(agency_id=agency_id, route_type=route_type)
+        
+        data = await self._make_request("GET", ROUTES_ENDPOINT.format(feed_id), params=params)
+        if as_record:
+            return [RouteRecord.from_dict(route_data) for route_data in data.get("routes", [])]
+        return [Route.from_dict(route_data, validate=validate) for route_data in data.get("routes", [])]
+    
+    async def get_stops(
+        self,
+        feed_id: str,
+        bbox: Optional[List[float]] = None,
+        route_id: Optional[str] = None,
+        validate: bool = True,
+        as_record: bool = False,
+    ) -> List[Union[Stop, StopRecord]]:
+        """Get stops for a specific feed.
+        
+        Args:
+            feed_id: Feed identifier
+            bbox: Bounding box as [min_lon, min_lat, max_lon, max_lat]
+            route_id: Filter by route ID
+            validate: Validate each record; pass False to skip validation
+                for trusted payloads
+            as_record: Return lightweight read-only StopRecord objects
+                instead of validated models
+        
+        Returns:
+            List of Stop objects
+        """
+        params = query_params(bbox=",".join(map(str, bbox)) if bbox else None, route_id=route_id)
+        
+        data = await self._make_request("GET", STOPS_ENDPOINT.format(feed_id), params=params)
+        if as_record:
+            return [StopRecord.from_dict(stop_data) for stop_data in data.get("stops", [])]
+        return [Stop.from_dict(stop_data, validate=validate) for stop_data in data.get("stops", [])]
+    
+    async def get_trips(
+        self,
+        feed_id: str,
+        route_id: Optional[str] = None,
+        service_id: Optional[str] = None,
+        validate: bool = True,
+        as_record: bool = False,
+    ) -> List[Union[Trip, TripRecord]]:
+        """Get trips for a specific feed.
+        
+        Args:
+            feed_id: Feed identifier
+            route_id: Filter by route ID
+            service_id: Filter by service ID
+            validate: Validate each record; pass False to skip validation
+                for trusted payloads
+            as_record: Return lightweight read-only TripRecord objects
+                instead of validated models
+        
+        Returns:
+            List of Trip objects
+        """
+        params = query_params(route_id=route_id, service_id=service_id)
+        
+        data = await self._make_request("GET", TRIPS_ENDPOINT.format(feed_id), params=params)
+        if as_record:
+            return [TripRecord.from_dict(trip_data) for trip_data in data.get("trips", [])]
+        return [Trip.from_dict(trip_data, validate=validate) for trip_data in data.get("trips", [])]
+    
+    async def get_feed_bundle(self, feed_id: str) -> Dict[str, List[Any]]:
+        """Fetch agencies, routes, stops and trips for a feed concurrently.
+        
+        Args:
+            feed_id: Feed identifier
+        
+        Returns:
+            Dictionary mapping table names to lists of model objects
+        """
+        agencies, routes, stops, trips = await asyncio.gather(
+            self.get_agencies(feed_id),
+            self.get_routes(feed_id),
+            self.get_stops(feed_id),
+            self.get_trips(feed_id),
+        )
+        
+        return {
+            "agencies": agencies,
+            "routes": routes,
+            "stops": stops,
+            "trips": trips,
+        }
+    
+    async def download_feed(self, feed_id: str, output_path: str) -> str:
+        """Download GTFS feed as ZIP file.
+        
+        Rate-limited (HTTP 429) responses are retried after the delay given
+        by the ``Retry-After`` header, up to ``max_retries`` times.
+        
+        Args:
+            feed_id: Feed identifier
+            output_path: Path to save the downloaded file
+            
+        Returns:
+            Path to downloaded file
+        """
+        url = self._url(FEED_DOWNLOAD_ENDPOINT.format(feed_id))
+        # Write to a temporary file so a failed or cancelled download never
+        # leaves a truncated archive at output_path
+        part_path = f"{output_path}.part"
+        
+        try:
+            for attempt in range(self.max_retries + 1):
+                async with self._get_session().get(url, headers={"Accept-Encoding": "identity"}) as response:
+                    if response.status == 429 and attempt < self.max_retries:
+                        delay = _retry_after_delay(response.headers.get("Retry-After"))
+                        logger.warning(f"Rate limited downloading {feed_id}, retrying in {delay}s")
+                        await asyncio.sleep(delay)
+                        continue
+                    
+                    response.raise_for_status()
+                    
+                    with open(part_path, "wb") as f:
+                        async for chunk in response.content.iter_chunked(1 << 20):
+                            f.write(chunk)
+                    break
+            
+            os.replace(part_path, output_path)
+            logger.info(f"Downloaded feed {feed_id} to {output_path}")
+            return output_path
+        
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise DatabusAPIError(f"Failed to download feed: {e}")
+        finally:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+    
+    async def download_feeds(
+        self,
+        feed_ids: Iterable[str],
+        output_dir: Union[str, Path],
+        concurrency: int = 5,
+    ) -> Dict[str, str]:
+        """Download several GTFS feeds concurrently.
+        
+        Args:
+            feed_ids: Feed identifiers to download
+            output_dir: Directory to save the downloaded files
+            concurrency: Maximum number of simultaneous downloads
+            
+        Returns:
+            Dictionary mapping feed IDs to downloaded file paths
+        
+        Raises:
+            FeedDownloadError: If any download failed, once all of them have
+                finished; it carries the paths of the successful downloads
+                and the exception of each failed one
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def download(feed_id: str) -> str:
+            async with semaphore:
+                return await self.download_feed(feed_id, str(output_dir / f"{feed_id}.zip"))
+        
+        feed_ids = list(feed_ids)
+        outcomes = await asyncio.gather(
+            *(download(feed_id) for feed_id in feed_ids), return_exceptions=True
+        )
+        
+        results = {}
+        failures = {}
+        for feed_id, outcome in zip(feed_ids, outcomes):
+            if isinstance(outcome, BaseException):
+                failures[feed_id] = outcome
+            else:
+                results[feed_id] = outcome
+        
+        if failures:
+            raise FeedDownloadError(results, failures)
+        return results
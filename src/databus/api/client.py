@@ -1,19 +1,102 @@
 """Databús API client for programmatic access to transit data APIs."""
 
+import copy
 import logging
-from typing import Dict, List, Optional, Union, Any
-from urllib.parse import urljoin
+import os
+import re
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union, Any
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+from .endpoints import (
+    AGENCIES_ENDPOINT,
+    FEEDS_ENDPOINT,
+    FEED_DOWNLOAD_ENDPOINT,
+    FEED_ENDPOINT,
+    FEED_STATS_ENDPOINT,
+    ROUTES_ENDPOINT,
+    STOPS_ENDPOINT,
+    TRIPS_ENDPOINT,
+    endpoint_url,
+    query_params,
+)
 from .models import Feed, Agency, Route, Stop, Trip
-from ..utils.exceptions import DatabusAPIError, DatabusConnectionError
+from .records import RouteRecord, StopRecord, StopTable, TripRecord
+from ..utils.exceptions import DatabusAPIError, DatabusConnectionError, FeedDownloadError
+from ..utils.serialization import json_loads
 
 
 logger = logging.getLogger(__name__)
 
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+# Feed archives are already compressed; ask the server not to re-encode them
+_DOWNLOAD_HEADERS = {"Accept-Encoding": "identity"}
+
+# Transport exceptions, mapped onto the SDK's own error types
+_CONNECT_ERRORS = (requests.exceptions.ConnectionError,)
+_TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+_HTTP_ERRORS = (requests.exceptions.HTTPError,)
+_REQUEST_ERRORS = (requests.exceptions.RequestException,)
+if httpx is not None:
+    _CONNECT_ERRORS += (httpx.ConnectError,)
+    _TIMEOUT_ERRORS += (httpx.TimeoutException,)
+    _HTTP_ERRORS += (httpx.HTTPStatusError,)
+    _REQUEST_ERRORS += (httpx.HTTPError,)
+
+
+def _build_adapter(max_retries: int, pool_connections: int, pool_maxsize: int) -> HTTPAdapter:
+    """Build a pooled HTTP adapter that retries idempotent requests."""
+    retry_strategy = Retry(
+        total=max_retries,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"HEAD", "GET", "OPTIONS"}),
+    )
+    return HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry_strategy,
+        pool_block=False,
+    )
+
+
+# (max_retries, pool_connections, pool_maxsize) served by the shared adapter
+_DEFAULT_POOL_SETTINGS = (3, 32, 64)
+_SHARED_ADAPTER = _build_adapter(*_DEFAULT_POOL_SETTINGS)
+
+_shared_client: Optional["DatabusClient"] = None
+_shared_client_lock = threading.Lock()
+
+
+def _preallocate(f, headers) -> None:
+    """Reserve disk space for a download whose size is known up front."""
+    if not hasattr(os, "posix_fallocate") or headers.get("Content-Encoding", "identity") != "identity":
+        return
+    try:
+        os.posix_fallocate(f.fileno(), 0, int(headers["Content-Length"]))
+    except (KeyError, TypeError, ValueError, OSError):
+        pass
+
 
 class DatabusClient:
     """Client for interacting with Databús APIs.
@@ -26,6 +109,15 @@ class DatabusClient:
         api_key: Optional API key for authenticated requests
         timeout: Request timeout in seconds
         max_retries: Maximum number of retry attempts
+        pool_connections: Number of host connection pools to cache
+        pool_maxsize: Maximum number of connections kept alive per pool
+        cache_size: Maximum number of GET responses kept in the response
+            cache (0 disables caching)
+        cache_ttl: Seconds a cached response is served without revalidation
+            when the server sends no ``Cache-Control: max-age``
+        transport: HTTP backend, either ``"requests"`` or ``"httpx"``; the
+            latter negotiates HTTP/2 so concurrent calls are multiplexed
+            over a single connection (requires the ``http2`` extra)
         
     Example:
         >>> client = DatabusClient("https://api.databus.cr")
@@ -39,21 +131,31 @@ class DatabusClient:
         api_key: Optional[str] = None,
         timeout: int = 30,
         max_retries: int = 3,
+        pool_connections: int = 32,
+        pool_maxsize: int = 64,
+        cache_size: int = 128,
+        cache_ttl: int = 300,
+        transport: str = "requests",
     ):
+        if transport not in ("requests", "httpx"):
+            raise ValueError(f"Unsupported transport: {transport}")
+        if transport == "httpx" and httpx is None:
+            raise ImportError(
+                "The httpx transport requires httpx with HTTP/2 support. "
+                "Install it with: pip install 'databus[http2]'"
+            )
+        
         self.base_url = base_url.rstrip("/")
+        self._base = self.base_url + "/"
         self.api_key = api_key
         self.timeout = timeout
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.transport = transport
         
-        # Configure session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=max_retries,
-            status_forcelist=[429, 500, 502, 503, 504],
-            method_whitelist=["HEAD", "GET", "OPTIONS"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # LRU cache of decoded GET responses, revalidated with ETag/Last-Modified
+        self._cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         
         # Set default headers
         headers = {
@@ -63,9 +165,100 @@ class DatabusClient:
         }
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
-            
+        
+        if transport == "httpx":
+            # HTTP/2 multiplexes concurrent requests over one connection
+            self.session = httpx.Client(
+                timeout=timeout,
+                headers=headers,
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=max_retries,
+                    limits=httpx.Limits(
+                        max_connections=pool_maxsize,
+                        max_keepalive_connections=pool_connections,
+                        keepalive_expiry=85.0,
+                    ),
+                ),
+            )
+            return
+        
+        # Configure a pooled keep-alive session with retry strategy; clients
+        # using the default pool settings share one adapter and its sockets
+        self.session = requests.Session()
+        self._shares_adapter = (max_retries, pool_connections, pool_maxsize) == _DEFAULT_POOL_SETTINGS
+        if self._shares_adapter:
+            adapter = _SHARED_ADAPTER
+        else:
+            adapter = _build_adapter(max_retries, pool_connections, pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # Advertise every content coding urllib3 can decode (brotli and
+        # zstd are included when their optional packages are installed)
+        headers["Accept-Encoding"] = ACCEPT_ENCODING
+        headers["Connection"] = "keep-alive"
         self.session.headers.update(headers)
     
+    @classmethod
+    def shared(cls) -> "DatabusClient":
+        """Get a process-wide client with the default settings.
+        
+        Returns:
+            The shared DatabusClient instance, created on first use
+        """
+        global _shared_client
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = cls()
+            return _shared_client
+    
+    def close(self) -> None:
+        """Close the underlying session and release pooled connections."""
+        if getattr(self, "_shares_adapter", False):
+            # Leave the shared adapter's pools open for other clients
+            self.session.adapters.clear()
+        self.session.close()
+    
+    def __enter__(self) -> "DatabusClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def clear_cache(self) -> None:
+        """Discard all cached API responses."""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def _url(self, endpoint: str) -> str:
+        """Build the absolute URL for an endpoint, keeping any base URL path."""
+        return endpoint_url(self._base, endpoint)
+    
+    def _store_cached_response(self, key: tuple, response: requests.Response, result: Any) -> None:
+        """Store a decoded GET response in the cache honoring Cache-Control."""
+        cache_control = str(response.headers.get("Cache-Control") or "")
+        if "no-store" in cache_control:
+            return
+        
+        if "no-cache" in cache_control:
+            ttl = 0
+        else:
+            max_age = _MAX_AGE_PATTERN.search(cache_control)
+            ttl = int(max_age.group(1)) if max_age else self.cache_ttl
+        
+        with self._cache_lock:
+            previous = self._cache.get(key, {})
+            self._cache[key] = {
+                "data": result,
+                "etag": response.headers.get("ETag") or previous.get("etag"),
+                "last_modified": response.headers.get("Last-Modified") or previous.get("last_modified"),
+                "expires": time.monotonic() + ttl,
+            }
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
     def _make_request(
         self,
         method: str,
@@ -74,43 +267,86 @@ class DatabusClient:
         data: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Make HTTP request to API endpoint."""
-        url = urljoin(self.base_url + "/", endpoint.lstrip("/"))
+        url = self._url(endpoint)
+        
+        cache_key = None
+        cached = None
+        headers = {}
+        if method.upper() == "GET" and self.cache_size > 0:
+            cache_key = (url, tuple(sorted((params or {}).items())))
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+            
+            if cached is not None:
+                # Callers get their own copy so mutating a response cannot
+                # change what later calls see
+                if cached["expires"] > time.monotonic():
+                    return copy.deepcopy(cached["data"])
+                
+                # Stale entry: revalidate with a conditional GET
+                if cached["etag"]:
+                    headers["If-None-Match"] = cached["etag"]
+                if cached["last_modified"]:
+                    headers["If-Modified-Since"] = cached["last_modified"]
+        elif method.upper() != "GET":
+            self.clear_cache()
         
         try:
             response = self.session.request(
                 method=method,
                 url=url,
-                params=params,
+                params=params or None,
                 json=data,
+                headers=headers or None,
                 timeout=self.timeout,
             )
+            
+            if cached is not None and response.status_code == 304:
+                self._store_cached_response(cache_key, response, cached["data"])
+                return copy.deepcopy(cached["data"])
+            
             response.raise_for_status()
-            return response.json()
+            result = json_loads(response.content)
+            
+            if cache_key is not None:
+                self._store_cached_response(cache_key, response, copy.deepcopy(result))
             
-        except requests.exceptions.ConnectionError as e:
+            return result
+            
+        except _CONNECT_ERRORS as e:
             raise DatabusConnectionError(f"Failed to connect to {url}: {e}")
-        except requests.exceptions.Timeout as e:
+        except _TIMEOUT_ERRORS as e:
             raise DatabusConnectionError(f"Request timed out: {e}")
-        except requests.exceptions.HTTPError as e:
-            raise DatabusAPIError(f"API request failed: {e}")
-        except requests.exceptions.RequestException as e:
+        except _HTTP_ERRORS as e:
+            response = getattr(e, "response", None)
+            raise DatabusAPIError(
+                f"API request failed: {e}",
+                status_code=response.status_code if response is not None else None,
+            )
+        except _REQUEST_ERRORS as e:
             raise DatabusAPIError(f"Request failed: {e}")
+        except ValueError as e:
+            raise DatabusAPIError(f"Invalid JSON response from {url}: {e}")
     
-    def get_feeds(self, country: Optional[str] = None) -> List[Feed]:
+    def get_feeds(
+        self,
+        country: Optional[str] = None,
+        validate: bool = True,
+    ) -> List[Feed]:
         """Get list of available GTFS feeds.
         
         Args:
             country: Filter feeds by country code (e.g., 'CR', 'GT')
+            validate: Validate each record; pass False to skip validation
+                for trusted payloads
             
         Returns:
             List of Feed objects
         """
-        params = {}
-        if country:
-            params["country"] = country
+        params = query_params(country=country)
             
-        data = self._make_request("GET", "/feeds", params=params)
-        return [Feed.from_dict(feed_data) for feed_data in data.get("feeds", [])]
+        data = self._make_request("GET", FEEDS_ENDPOINT, params=params)
+        return [Feed.from_dict(feed_data, validate=validate) for feed_data in data.get("feeds", [])]
     
     def get_feed(self, feed_id: str) -> Feed:
         """Get specific GTFS feed by ID.
@@ -121,95 +357,254 @@ class DatabusClient:
         Returns:
             Feed object
         """
-        data = self._make_request("GET", f"/feeds/{feed_id}")
+        data = self._make_request("GET", FEED_ENDPOINT.format(feed_id))
         return Feed.from_dict(data)
     
-    def get_agencies(self, feed_id: str) -> List[Agency]:
+    def get_feed_stats(self, feed_id: str) -> Dict[str, Any]:
+        """Get summary statistics for a feed from the API.
+        
+        Returns the same counts as GTFSProcessor.get_feed_stats() without
+        downloading the feed itself.
+        
+        Args:
+            feed_id: Feed identifier
+            
+        Returns:
+            Dictionary with feed statistics
+        """
+        return self._make_request("GET", FEED_STATS_ENDPOINT.format(feed_id))
+    
+    def get_agencies(self, feed_id: str, validate: bool = True) -> List[Agency]:
         """Get agencies for a specific feed.
         
         Args:
             feed_id: Feed identifier
+            validate: Validate each record; pass False to skip validation
+                for trusted payloads
             
         Returns:
             List of Agency objects
         """
-        data = self._make_request("GET", f"/feeds/{feed_id}/agencies")
-        return [Agency.from_dict(agency_data) for agency_data in data.get("agencies", [])]
+        data = self._make_request("GET", AGENCIES_ENDPOINT.format(feed_id))
+        return [Agency.from_dict(agency_data, validate=validate) for agency_data in data.get("agencies", [])]
     
     def get_routes(
         self,
         feed_id: str,
         agency_id: Optional[str] = None,
         route_type: Optional[int] = None,
-    ) -> List[Route]:
+        validate: bool = True,
+        as_record: bool = False,
+    ) -> List[Union[Route, RouteRecord]]:
         """Get routes for a specific feed.
         
         Args:
             feed_id: Feed identifier
             agency_id: Filter by agency ID
             route_type: Filter by GTFS route type
+            validate: Validate each record; pass False to skip validation
+                for trusted payloads
+            as_record: Return lightweight read-only RouteRecord objects
+                instead of validated models
             
         Returns:
             List of Route objects
         """
-        params = {}
-        if agency_id:
-            params["agency_id"] = agency_id
-        if route_type is not None:
-            params["route_type"] = route_type
+        params = query_params(agency_id=agency_id, route_type=route_type)
             
-        data = self._make_request("GET", f"/feeds/{feed_id}/routes", params=params)
-        return [Route.from_dict(route_data) for route_data in data.get("routes", [])]
+        data = self._make_request("GET", ROUTES_ENDPOINT.format(feed_id), params=params)
+        if as_record:
+            return [RouteRecord.from_dict(route_data) for route_data in data.get("routes", [])]
+        return [Route.from_dict(route_data, validate=validate) for route_data in data.get("routes", [])]
     
     def get_stops(
         self,
         feed_id: str,
         bbox: Optional[List[float]] = None,
         route_id: Optional[str] = None,
-    ) -> List[Stop]:
+        validate: bool = True,
+        as_record: bool = False,
+    ) -> List[Union[Stop, StopRecord]]:
         """Get stops for a specific feed.
         
         Args:
             feed_id: Feed identifier
             bbox: Bounding box as [min_lon, min_lat, max_lon, max_lat]
             route_id: Filter by route ID
+            validate: Validate each record; pass False to skip validation
+                for trusted payloads
+            as_record: Return lightweight read-only StopRecord objects
+                instead of validated models
             
         Returns:
             List of Stop objects
         """
-        params = {}
-        if bbox:
-            params["bbox"] = ",".join(map(str, bbox))
-        if route_id:
-            params["route_id"] = route_id
+        params = query_params(bbox=",".join(map(str, bbox)) if bbox else None, route_id=route_id)
+            
+        data = self._make_request("GET", STOPS_ENDPOINT.format(feed_id), params=params)
+        if as_record:
+            return [StopRecord.from_dict(stop_data) for stop_data in data.get("stops", [])]
+        return [Stop.from_dict(stop_data, validate=validate) for stop_data in data.get("stops", [])]
+    
+    def get_stops_table(
+        self,
+        feed_id: str,
+        bbox: Optional[List[float]] = None,
+        route_id: Optional[str] = None,
+    ) -> StopTable:
+        """Get stops for a specific feed as a column-oriented table.
+        
+        Builds NumPy arrays directly from the response without creating
+        one object per stop; use StopTable.within_bbox() for further
+        spatial filtering.
+        
+        Args:
+            feed_id: Feed identifier
+            bbox: Bounding box as [min_lon, min_lat, max_lon, max_lat]
+            route_id: Filter by route ID
             
-        data = self._make_request("GET", f"/feeds/{feed_id}/stops", params=params)
-        return [Stop.from_dict(stop_data) for stop_data in data.get("stops", [])]
+        Returns:
+            StopTable with one array per stop field
+        """
+        params = query_params(bbox=",".join(map(str, bbox)) if bbox else None, route_id=route_id)
+        
+        data = self._make_request("GET", STOPS_ENDPOINT.format(feed_id), params=params)
+        return StopTable.from_dicts(data.get("stops", []))
     
     def get_trips(
         self,
         feed_id: str,
         route_id: Optional[str] = None,
         service_id: Optional[str] = None,
-    ) -> List[Trip]:
+        validate: bool = True,
+        as_record: bool = False,
+    ) -> List[Union[Trip, TripRecord]]:
         """Get trips for a specific feed.
         
         Args:
             feed_id: Feed identifier
             route_id: Filter by route ID
             service_id: Filter by service ID
+            validate: Validate each record; pass False to skip validation
+                for trusted payloads
+            as_record: Return lightweight read-only TripRecord objects
+                instead of validated models
             
         Returns:
             List of Trip objects
         """
-        params = {}
-        if route_id:
-            params["route_id"] = route_id
-        if service_id:
-            params["service_id"] = service_id
+        params = query_params(route_id=route_id, service_id=service_id)
+            
+        data = self._make_request("GET", TRIPS_ENDPOINT.format(feed_id), params=params)
+        if as_record:
+            return [TripRecord.from_dict(trip_data) for trip_data in data.get("trips", [])]
+        return [Trip.from_dict(trip_data, validate=validate) for trip_data in data.get("trips", [])]
+    
+    def _iter_items(
+        self,
+        endpoint: str,
+        key: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over the items of a list endpoint as they are decoded.
+        
+        Streams and incrementally parses the response body when ijson is
+        installed; otherwise falls back to a buffered request.
+        """
+        if ijson is None or self.transport != "requests":
+            yield from self._make_request("GET", endpoint, params=params).get(key, [])
+            return
+        
+        url = self._url(endpoint)
+        
+        try:
+            with self.session.get(url, params=params, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, f"{key}.item", use_float=True)
+                
+        except _CONNECT_ERRORS as e:
+            raise DatabusConnectionError(f"Failed to connect to {url}: {e}")
+        except _TIMEOUT_ERRORS as e:
+            raise DatabusConnectionError(f"Request timed out: {e}")
+        except _HTTP_ERRORS as e:
+            raise DatabusAPIError(f"API request failed: {e}")
+        except _REQUEST_ERRORS as e:
+            raise DatabusAPIError(f"Request failed: {e}")
+        except ijson.JSONError as e:
+            raise DatabusAPIError(f"Invalid JSON response from {url}: {e}")
+    
+    def iter_routes(
+        self,
+        feed_id: str,
+        agency_id: Optional[str] = None,
+        route_type: Optional[int] = None,
+        validate: bool = True,
+    ) -> Iterator[Route]:
+        """Iterate over routes for a specific feed without buffering the response.
+        
+        Args:
+            feed_id: Feed identifier
+            agency_id: Filter by agency ID
+            route_type: Filter by GTFS route type
+            validate: Validate each record; pass False to skip validation
+                for trusted payloads
             
-        data = self._make_request("GET", f"/feeds/{feed_id}/trips", params=params)
-        return [Trip.from_dict(trip_data) for trip_data in data.get("trips", [])]
+        Yields:
+            Route objects
+        """
+        params = query_params(agency_id=agency_id, route_type=route_type)
+        
+        for route_data in self._iter_items(ROUTES_ENDPOINT.format(feed_id), "routes", params):
+            yield Route.from_dict(route_data, validate=validate)
+    
+    def iter_stops(
+        self,
+        feed_id: str,
+        bbox: Optional[List[float]] = None,
+        route_id: Optional[str] = None,
+        validate: bool = True,
+    ) -> Iterator[Stop]:
+        """Iterate over stops for a specific feed without buffering the response.
+        
+        Args:
+            feed_id: Feed identifier
+            bbox: Bounding box as [min_lon, min_lat, max_lon, max_lat]
+            route_id: Filter by route ID
+            validate: Validate each record; pass False to skip validation
+                for trusted payloads
+            
+        Yields:
+            Stop objects
+        """
+        params = query_params(bbox=",".join(map(str, bbox)) if bbox else None, route_id=route_id)
+        
+        for stop_data in self._iter_items(STOPS_ENDPOINT.format(feed_id), "stops", params):
+            yield Stop.from_dict(stop_data, validate=validate)
+    
+    def iter_trips(
+        self,
+        feed_id: str,
+        route_id: Optional[str] = None,
+        service_id: Optional[str] = None,
+        validate: bool = True,
+    ) -> Iterator[Trip]:
+        """Iterate over trips for a specific feed without buffering the response.
+        
+        Args:
+            feed_id: Feed identifier
+            route_id: Filter by route ID
+            service_id: Filter by service ID
+            validate: Validate each record; pass False to skip validation
+                for trusted payloads
+            
+        Yields:
+            Trip objects
+        """
+        params = query_params(route_id=route_id, service_id=service_id)
+        
+        for trip_data in self._iter_items(TRIPS_ENDPOINT.format(feed_id), "trips", params):
+            yield Trip.from_dict(trip_data, validate=validate)
         
     def download_feed(self, feed_id: str, output_path: str) -> str:
         """Download GTFS feed as ZIP file.
@@ -221,18 +616,86 @@ class DatabusClient:
         Returns:
             Path to downloaded file
         """
-        url = urljoin(self.base_url + "/", f"/feeds/{feed_id}/download")
+        url = self._url(FEED_DOWNLOAD_ENDPOINT.format(feed_id))
+        # Write to a temporary file so a failed download never leaves a
+        # truncated archive at output_path
+        part_path = f"{output_path}.part"
         
         try:
-            response = self.session.get(url, stream=True, timeout=self.timeout)
-            response.raise_for_status()
-            
-            with open(output_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            if self.transport == "httpx":
+                with self.session.stream("GET", url, headers=_DOWNLOAD_HEADERS) as response:
+                    response.raise_for_status()
+                    with open(part_path, "wb") as f:
+                        for chunk in response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+            else:
+                with self.session.get(url, headers=_DOWNLOAD_HEADERS, stream=True, timeout=self.timeout) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
                     
+                    with open(part_path, "wb") as f:
+                        _preallocate(f, response.headers)
+                        shutil.copyfileobj(response.raw, f, length=_DOWNLOAD_CHUNK_SIZE)
+                        f.truncate()
+            
+            os.replace(part_path, output_path)
             logger.info(f"Downloaded feed {feed_id} to {output_path}")
             return output_path
             
-        except requests.exceptions.RequestException as e:
+        except _REQUEST_ERRORS as e:
             raise DatabusAPIError(f"Failed to download feed: {e}")
+        finally:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+    
+    def download_feeds(
+        self,
+        feed_ids: Iterable[str],
+        output_dir: Union[str, Path],
+        concurrency: int = 5,
+        progress_callback: Optional[Callable[[str, str], None]] = None,
+    ) -> Dict[str, str]:
+        """Download several GTFS feeds concurrently.
+        
+        Downloads share the client's connection pool. Rate-limited (HTTP 429)
+        responses are retried by the session's retry strategy, which honors
+        the ``Retry-After`` header.
+        
+        Args:
+            feed_ids: Feed identifiers to download
+            output_dir: Directory to save the downloaded files
+            concurrency: Maximum number of simultaneous downloads
+            progress_callback: Optional callable invoked with
+                ``(feed_id, path)`` as each download completes
+            
+        Returns:
+            Dictionary mapping feed IDs to downloaded file paths
+        
+        Raises:
+            FeedDownloadError: If any download failed, once all of them have
+                finished; it carries the paths of the successful downloads
+                and the exception of each failed one
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        results = {}
+        failures = {}
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                executor.submit(self.download_feed, feed_id, str(output_dir / f"{feed_id}.zip")): feed_id
+                for feed_id in feed_ids
+            }
+            for future in as_completed(futures):
+                feed_id = futures[future]
+                try:
+                    results[feed_id] = future.result()
+                except Exception as e:
+                    failures[feed_id] = e
+                    continue
+                if progress_callback:
+                    progress_callback(feed_id, results[feed_id])
+        
+        if failures:
+            raise FeedDownloadError(results, failures)
+        return results
@@ -0,0 +1,44 @@
+"""Databús API endpoint paths shared by the sync and async clients."""
+
+from typing import Any, Dict
+
+
+# Endpoint templates, formatted with the feed ID
+FEEDS_ENDPOINT = "/feeds"
+FEED_ENDPOINT = "/feeds/{}"
+FEED_STATS_ENDPOINT = "/feeds/{}/stats"
+FEED_DOWNLOAD_ENDPOINT = "/feeds/{}/download"
+AGENCIES_ENDPOINT = "/feeds/{}/agencies"
+ROUTES_ENDPOINT = "/feeds/{}/routes"
+STOPS_ENDPOINT = "/feeds/{}/stops"
+TRIPS_ENDPOINT = "/feeds/{}/trips"
+
+
+def endpoint_url(base: str, endpoint: str) -> str:
+    """Build the absolute URL for an endpoint, keeping any base URL path.
+    
+    Args:
+        base: Base URL ending with a slash
+        endpoint: Endpoint path relative to the base URL
+    
+    Returns:
+        Absolute URL of the endpoint
+    
+    Raises:
+        ValueError: If the endpoint is an absolute URL
+    """
+    if "://" in endpoint:
+        raise ValueError(f"Expected a relative endpoint, got {endpoint}")
+    return base + endpoint.lstrip("/")
+
+
+def query_params(**params: Any) -> Dict[str, Any]:
+    """Build a query string mapping, dropping unset parameters.
+    
+    Args:
+        **params: Query parameters; None values are omitted
+    
+    Returns:
+        Dictionary of query parameters to send
+    """
+    return {key: value for key, value in params.items() if value is not None}
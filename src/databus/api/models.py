@@ -5,6 +5,13 @@ from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field, validator
 
 
+# Allowed values for enumerated GTFS fields
+_VALID_ROUTE_TYPES = frozenset({0, 1, 2, 3, 4, 5, 6, 7, 11, 12})
+_VALID_LOCATION_TYPES = frozenset({0, 1, 2, 3, 4})
+_VALID_ACCESSIBILITY_VALUES = frozenset({0, 1, 2})
+_VALID_DIRECTION_IDS = frozenset({0, 1})
+
+
 class Feed(BaseModel):
     """Represents a GTFS feed in the Databús system."""
     
@@ -23,8 +30,16 @@ class Feed(BaseModel):
     status: str = Field(default="active", description="Feed status")
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Feed":
-        """Create Feed instance from dictionary."""
+    def from_dict(cls, data: Dict[str, Any], validate: bool = True) -> "Feed":
+        """Create Feed instance from dictionary.
+        
+        Args:
+            data: Field values keyed by field name
+            validate: Run field validation; pass False to build the instance
+                without validation or type coercion from a trusted payload
+        """
+        if not validate:
+            return cls.model_construct(**data)
         return cls(**data)
 
 
@@ -41,8 +56,16 @@ class Agency(BaseModel):
     agency_email: Optional[str] = Field(None, description="Agency email")
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Agency":
-        """Create Agency instance from dictionary."""
+    def from_dict(cls, data: Dict[str, Any], validate: bool = True) -> "Agency":
+        """Create Agency instance from dictionary.
+        
+        Args:
+            data: Field values keyed by field name
+            validate: Run field validation; pass False to build the instance
+                without validation or type coercion from a trusted payload
+        """
+        if not validate:
+            return cls.model_construct(**data)
         return cls(**data)
 
 
@@ -63,14 +86,21 @@ class Route(BaseModel):
     @validator('route_type')
     def validate_route_type(cls, v):
         """Validate GTFS route type."""
-        valid_types = {0, 1, 2, 3, 4, 5, 6, 7, 11, 12}
-        if v not in valid_types:
+        if v not in _VALID_ROUTE_TYPES:
             raise ValueError(f"Invalid route type: {v}")
         return v
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Route":
-        """Create Route instance from dictionary."""
+    def from_dict(cls, data: Dict[str, Any], validate: bool = True) -> "Route":
+        """Create Route instance from dictionary.
+        
+        Args:
+            data: Field values keyed by field name
+            validate: Run field validation; pass False to build the instance
+                without validation or type coercion from a trusted payload
+        """
+        if not validate:
+            return cls.model_construct(**data)
         return cls(**data)
 
 
@@ -94,20 +124,28 @@ class Stop(BaseModel):
     @validator('location_type')
     def validate_location_type(cls, v):
         """Validate GTFS location type."""
-        if v is not None and v not in {0, 1, 2, 3, 4}:
+        if v is not None and v not in _VALID_LOCATION_TYPES:
             raise ValueError(f"Invalid location type: {v}")
         return v
     
     @validator('wheelchair_boarding')
     def validate_wheelchair_boarding(cls, v):
         """Validate wheelchair boarding value."""
-        if v is not None and v not in {0, 1, 2}:
+        if v is not None and v not in _VALID_ACCESSIBILITY_VALUES:
             raise ValueError(f"Invalid wheelchair boarding value: {v}")
         return v
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Stop":
-        """Create Stop instance from dictionary."""
+    def from_dict(cls, data: Dict[str, Any], validate: bool = True) -> "Stop":
+        """Create Stop instance from dictionary.
+        
+        Args:
+            data: Field values keyed by field name
+            validate: Run field validation; pass False to build the instance
+                without validation or type coercion from a trusted payload
+        """
+        if not validate:
+            return cls.model_construct(**data)
         return cls(**data)
 
 
@@ -128,27 +166,35 @@ class Trip(BaseModel):
     @validator('direction_id')
     def validate_direction_id(cls, v):
         """Validate direction ID."""
-        if v is not None and v not in {0, 1}:
+        if v is not None and v not in _VALID_DIRECTION_IDS:
             raise ValueError(f"Invalid direction ID: {v}")
         return v
     
     @validator('wheelchair_accessible')
     def validate_wheelchair_accessible(cls, v):
         """Validate wheelchair accessibility value."""
-        if v is not None and v not in {0, 1, 2}:
+        if v is not None and v not in _VALID_ACCESSIBILITY_VALUES:
             raise ValueError(f"Invalid wheelchair accessible value: {v}")
         return v
     
     @validator('bikes_allowed')
     def validate_bikes_allowed(cls, v):
         """Validate bikes allowed value."""
-        if v is not None and v not in {0, 1, 2}:
+        if v is not None and v not in _VALID_ACCESSIBILITY_VALUES:
             raise ValueError(f"Invalid bikes allowed value: {v}")
         return v
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Trip":
-        """Create Trip instance from dictionary."""
+    def from_dict(cls, data: Dict[str, Any], validate: bool = True) -> "Trip":
+        """Create Trip instance from dictionary.
+        
+        Args:
+            data: Field values keyed by field name
+            validate: Run field validation; pass False to build the instance
+                without validation or type coercion from a trusted payload
+        """
+        if not validate:
+            return cls.model_construct(**data)
         return cls(**data)
 
 
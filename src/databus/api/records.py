@@ -0,0 +1,219 @@
+"""Lightweight read-only records for Databús API data structures.
+
+These mirror the Pydantic models in :mod:`databus.api.models` but skip
+validation entirely and use slotted, frozen dataclasses, which keeps
+per-instance memory low when materializing large API responses.
+"""
+
+import sys
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Optional, Dict, Any, FrozenSet, List, Sequence
+
+import numpy as np
+
+
+# Slotted dataclasses are only available on Python 3.10+
+_RECORD_OPTIONS = {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> FrozenSet[str]:
+    """Get the field names declared by a record class."""
+    return frozenset(f.name for f in fields(cls))
+
+
+def _from_dict(cls: type, data: Dict[str, Any]) -> Any:
+    """Create a record from a dictionary, ignoring unknown keys."""
+    names = _field_names(cls)
+    return cls(**{key: value for key, value in data.items() if key in names})
+
+
+@dataclass(**_RECORD_OPTIONS)
+class FeedRecord:
+    """Read-only GTFS feed record."""
+    
+    id: str
+    name: str
+    country_code: str
+    description: Optional[str] = None
+    region: Optional[str] = None
+    city: Optional[str] = None
+    operator: Optional[str] = None
+    url: Optional[str] = None
+    download_url: Optional[str] = None
+    last_updated: Optional[str] = None
+    file_size: Optional[int] = None
+    version: Optional[str] = None
+    status: str = "active"
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FeedRecord":
+        """Create FeedRecord instance from dictionary."""
+        return _from_dict(cls, data)
+
+
+@dataclass(**_RECORD_OPTIONS)
+class AgencyRecord:
+    """Read-only transit agency record."""
+    
+    agency_name: str
+    agency_url: str
+    agency_timezone: str
+    agency_id: Optional[str] = None
+    agency_lang: Optional[str] = None
+    agency_phone: Optional[str] = None
+    agency_fare_url: Optional[str] = None
+    agency_email: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AgencyRecord":
+        """Create AgencyRecord instance from dictionary."""
+        return _from_dict(cls, data)
+
+
+@dataclass(**_RECORD_OPTIONS)
+class RouteRecord:
+    """Read-only transit route record."""
+    
+    route_id: str
+    route_type: int
+    agency_id: Optional[str] = None
+    route_short_name: Optional[str] = None
+    route_long_name: Optional[str] = None
+    route_desc: Optional[str] = None
+    route_url: Optional[str] = None
+    route_color: Optional[str] = None
+    route_text_color: Optional[str] = None
+    route_sort_order: Optional[int] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RouteRecord":
+        """Create RouteRecord instance from dictionary."""
+        return _from_dict(cls, data)
+
+
+@dataclass(**_RECORD_OPTIONS)
+class StopRecord:
+    """Read-only transit stop record."""
+    
+    stop_id: str
+    stop_name: str
+    stop_lat: float
+    stop_lon: float
+    stop_code: Optional[str] = None
+    stop_desc: Optional[str] = None
+    zone_id: Optional[str] = None
+    stop_url: Optional[str] = None
+    location_type: Optional[int] = None
+    parent_station: Optional[str] = None
+    stop_timezone: Optional[str] = None
+    wheelchair_boarding: Optional[int] = None
+    platform_code: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StopRecord":
+        """Create StopRecord instance from dictionary."""
+        return _from_dict(cls, data)
+
+
+@dataclass(**_RECORD_OPTIONS)
+class TripRecord:
+    """Read-only transit trip record."""
+    
+    route_id: str
+    service_id: str
+    trip_id: str
+    trip_headsign: Optional[str] = None
+    trip_short_name: Optional[str] = None
+    direction_id: Optional[int] = None
+    block_id: Optional[str] = None
+    shape_id: Optional[str] = None
+    wheelchair_accessible: Optional[int] = None
+    bikes_allowed: Optional[int] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TripRecord":
+        """Create TripRecord instance from dictionary."""
+        return _from_dict(cls, data)
+
+
+class StopTable:
+    """Column-oriented table of transit stops backed by NumPy arrays.
+    
+    Holds one array per field instead of one object per stop, so spatial
+    queries over many stops run as vectorized array operations.
+    
+    Args:
+        stop_id: Stop identifiers
+        stop_name: Stop names
+        stop_lat: Stop latitudes
+        stop_lon: Stop longitudes
+        stop_code: Optional rider-facing stop codes
+    """
+    
+    __slots__ = ("stop_id", "stop_name", "stop_lat", "stop_lon", "stop_code")
+    
+    def __init__(
+        self,
+        stop_id: np.ndarray,
+        stop_name: np.ndarray,
+        stop_lat: np.ndarray,
+        stop_lon: np.ndarray,
+        stop_code: np.ndarray,
+    ):
+        self.stop_id = stop_id
+        self.stop_name = stop_name
+        self.stop_lat = stop_lat
+        self.stop_lon = stop_lon
+        self.stop_code = stop_code
+    
+    @classmethod
+    def from_dicts(cls, data: Sequence[Dict[str, Any]]) -> "StopTable":
+        """Create a StopTable from a sequence of stop dictionaries."""
+        count = len(data)
+        return cls(
+            stop_id=np.array([d["stop_id"] for d in data], dtype=object),
+            stop_name=np.array([d["stop_name"] for d in data], dtype=object),
+            stop_lat=np.fromiter((d["stop_lat"] for d in data), dtype=np.float64, count=count),
+            stop_lon=np.fromiter((d["stop_lon"] for d in data), dtype=np.float64, count=count),
+            stop_code=np.array([d.get("stop_code") for d in data], dtype=object),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.stop_id)
+    
+    def _take(self, index: np.ndarray) -> "StopTable":
+        """Select rows by boolean mask or integer index."""
+        return StopTable(*(getattr(self, name)[index] for name in self.__slots__))
+    
+    def within_bbox(self, bbox: List[float]) -> "StopTable":
+        """Get the stops inside a bounding box.
+        
+        Args:
+            bbox: Bounding box as [min_lon, min_lat, max_lon, max_lat]
+        
+        Returns:
+            New StopTable containing only the stops inside the box
+        """
+        min_lon, min_lat, max_lon, max_lat = bbox
+        mask = (
+            (self.stop_lat >= min_lat) & (self.stop_lat <= max_lat)
+            & (self.stop_lon >= min_lon) & (self.stop_lon <= max_lon)
+        )
+        return self._take(mask)
+    
+    def to_records(self) -> List[StopRecord]:
+        """Convert the table back into a list of StopRecord objects."""
+        return [
+            StopRecord(
+                stop_id=stop_id,
+                stop_name=stop_name,
+                stop_lat=float(stop_lat),
+                stop_lon=float(stop_lon),
+                stop_code=stop_code,
+            )
+            for stop_id, stop_name, stop_lat, stop_lon, stop_code in zip(
+                self.stop_id, self.stop_name, self.stop_lat, self.stop_lon, self.stop_code
+            )
+        ]
@@ -2,25 +2,61 @@
 
 import logging
 import sys
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.progress import track
 
 from .. import __version__
-from ..api import DatabusClient
-from ..gtfs import GTFSProcessor, GTFSValidator
 from ..utils.config import config
-from ..utils.exceptions import DatabusError
+from ..utils.exceptions import DatabusAPIError, DatabusError
 from ..utils.helpers import format_file_size
+from ..utils.serialization import json_dumps, write_json_array
 
+if TYPE_CHECKING:
+    from rich.console import Console
+    from ..api import DatabusClient
+    from ..gtfs import GTFSProcessor
 
-console = Console()
+
+# Heavy dependencies (rich, pandas, pydantic) are imported inside the
+# commands that need them so --help and --version start quickly
+_console = None
 logger = logging.getLogger(__name__)
 
+_DEFAULT_CACHE_DIR = Path.home() / ".cache" / "databus" / "feeds"
+
+
+def get_console() -> "Console":
+    """Get the shared rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+def get_client(ctx: click.Context) -> "DatabusClient":
+    """Get the API client shared by all commands of this invocation.
+    
+    The client is created on first use and stored on the root context so
+    its pooled connections are reused; it is closed when the CLI exits.
+    """
+    from ..api import DatabusClient
+    
+    root = ctx.find_root()
+    obj = root.ensure_object(dict)
+    if obj.get("client") is None:
+        client = DatabusClient(
+            base_url=config.get("api.base_url"),
+            api_key=config.get("api.api_key"),
+            timeout=config.get("api.timeout")
+        )
+        root.call_on_close(client.close)
+        obj["client"] = client
+    return obj["client"]
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Set up logging configuration."""
@@ -65,98 +101,172 @@ def api() -> None:
 @click.option("--country", help="Filter feeds by country code")
 @click.option("--format", "output_format", type=click.Choice(["table", "json"]), 
               default="table", help="Output format")
-def feeds(country: Optional[str], output_format: str) -> None:
+@click.pass_context
+def feeds(ctx: click.Context, country: Optional[str], output_format: str) -> None:
     """List available GTFS feeds."""
+    from rich.table import Table
+    
+    console = get_console()
+    
     try:
-        client = DatabusClient(
-            base_url=config.get("api.base_url"),
-            api_key=config.get("api.api_key"),
-            timeout=config.get("api.timeout")
-        )
+        client = get_client(ctx)
         
         with console.status("Fetching feeds..."):
             feed_list = client.get_feeds(country=country)
         
         if output_format == "json":
-            import json
-            feed_data = [feed.dict() for feed in feed_list]
-            console.print(json.dumps(feed_data, indent=2, default=str))
+            # Stream straight to stdout instead of building the whole document
+            sys.stdout.flush()
+            write_json_array((feed.model_dump(mode="json") for feed in feed_list), sys.stdout.buffer)
+            sys.stdout.buffer.flush()
         else:
             # Display as table
             table = Table(title="GTFS Feeds")
-            table.add_column("ID", style="cyan")
+            table.add_column("ID", style="cyan", no_wrap=True)
             table.add_column("Name", style="bold")
-            table.add_column("Country", style="green")
+            table.add_column("Country", style="green", no_wrap=True)
             table.add_column("Operator")
-            table.add_column("Size", justify="right")
-            table.add_column("Updated", style="dim")
+            table.add_column("Size", justify="right", no_wrap=True)
+            table.add_column("Updated", style="dim", no_wrap=True)
             
-            for feed in feed_list:
-                size_str = format_file_size(feed.file_size) if feed.file_size else "N/A"
-                updated_str = feed.last_updated.strftime("%Y-%m-%d") if feed.last_updated else "N/A"
-                
-                table.add_row(
+            rows = [
+                (
                     feed.id,
                     feed.name,
                     feed.country_code,
                     feed.operator or "N/A",
-                    size_str,
-                    updated_str
+                    format_file_size(feed.file_size) if feed.file_size else "N/A",
+                    feed.last_updated.strftime("%Y-%m-%d") if feed.last_updated else "N/A",
                 )
+                for feed in feed_list
+            ]
+            for row in rows:
+                table.add_row(*row)
             
             console.print(table)
             console.print(f"\nTotal feeds: {len(feed_list)}")
-            
+    
     except DatabusError as e:
         console.print(f"[red]Error: {e}[/red]")
         sys.exit(1)
 
 
 @api.command()
-@click.argument("feed_id")
-@click.option("--output", "-o", type=click.Path(), help="Output file path")
-def download(feed_id: str, output: Optional[str]) -> None:
-    """Download a GTFS feed."""
+@click.argument("feed_ids", nargs=-1, required=True)
+@click.option("--output", "-o", type=click.Path(), 
+              help="Output file path (output directory when downloading several feeds)")
+@click.option("--concurrency", type=int, default=5, show_default=True,
+              help="Maximum number of simultaneous downloads")
+@click.pass_context
+def download(ctx: click.Context, feed_ids: Tuple[str, ...], output: Optional[str], concurrency: int) -> None:
+    """Download one or more GTFS feeds."""
+    from rich.progress import Progress
+    
+    console = get_console()
+    
     try:
-        client = DatabusClient(
-            base_url=config.get("api.base_url"),
-            api_key=config.get("api.api_key"),
-            timeout=config.get("api.timeout")
-        )
-        
-        if not output:
-            output = f"{feed_id}.zip"
+        client = get_client(ctx)
         
-        output_path = Path(output)
-        
-        with console.status(f"Downloading feed {feed_id}..."):
-            downloaded_path = client.download_feed(feed_id, str(output_path))
+        if len(feed_ids) == 1:
+            feed_id = feed_ids[0]
+            if not output:
+                output = f"{feed_id}.zip"
+            
+            output_path = Path(output)
+            
+            with console.status(f"Downloading feed {feed_id}..."):
+                downloaded_path = client.download_feed(feed_id, str(output_path))
+            
+            console.print(f"[green]✓[/green] Downloaded feed to: {downloaded_path}")
+            return
         
-        console.print(f"[green]✓[/green] Downloaded feed to: {downloaded_path}")
+        output_dir = Path(output) if output else Path.cwd()
         
+        with Progress(console=console) as progress:
+            task = progress.add_task("Downloading feeds...", total=len(feed_ids))
+            
+            def on_complete(feed_id: str, path: str) -> None:
+                progress.console.print(f"[green]✓[/green] Downloaded feed {feed_id} to: {path}")
+                progress.advance(task)
+            
+            client.download_feeds(
+                feed_ids,
+                output_dir,
+                concurrency=concurrency,
+                progress_callback=on_complete,
+            )
+    
     except DatabusError as e:
         console.print(f"[red]Error: {e}[/red]")
         sys.exit(1)
 
 
 @main.group()
-def gtfs() -> None:
+@click.option("--cache-dir", type=click.Path(file_okay=False), envvar="DATABUS_CACHE_DIR",
+              default=str(_DEFAULT_CACHE_DIR), show_default=True,
+              help="Directory for Feather caches of loaded feeds")
+@click.option("--no-cache", is_flag=True, help="Parse feeds without reading or writing caches")
+@click.pass_context
+def gtfs(ctx: click.Context, cache_dir: str, no_cache: bool) -> None:
     """Commands for GTFS data processing and analysis."""
-    pass
+    ctx.ensure_object(dict)
+    ctx.obj["cache_dir"] = None if no_cache else cache_dir
+
+
+def _load_processor(feed_path: str, cache_dir: Optional[str] = None) -> "GTFSProcessor":
+    """Load a local GTFS feed, going through a Feather cache when one is configured."""
+    from ..gtfs import GTFSProcessor
+    
+    processor = GTFSProcessor(feed_path)
+    processor.load_feed(cache_dir=cache_dir)
+    return processor
+
+
+def _load_feed_stats(feed_path: str, cache_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Load a local GTFS feed and compute its statistics."""
+    return _load_processor(feed_path, cache_dir).get_feed_stats()
 
 
 @gtfs.command()
-@click.argument("feed_path", type=click.Path(exists=True))
+@click.argument("feed_path", type=click.Path())
 @click.option("--format", "output_format", type=click.Choice(["table", "json"]), 
               default="table", help="Output format")
-def info(feed_path: str, output_format: str) -> None:
-    """Display information about a GTFS feed."""
+@click.option("--local", "force_local", is_flag=True,
+              help="Download the feed and compute statistics locally instead of using the API summary")
+@click.pass_context
+def info(ctx: click.Context, feed_path: str, output_format: str, force_local: bool) -> None:
+    """Display information about a GTFS feed.
+    
+    FEED_PATH is a local GTFS file or directory, or the ID of a Databús feed
+    whose summary statistics are fetched from the API.
+    """
+    from rich.table import Table
+    
+    console = get_console()
+    
     try:
-        processor = GTFSProcessor(feed_path)
-        
-        with console.status("Loading GTFS feed..."):
-            processor.load_feed()
-            stats = processor.get_feed_stats()
+        if Path(feed_path).exists():
+            with console.status("Loading GTFS feed..."):
+                stats = _load_feed_stats(feed_path, ctx.obj.get("cache_dir"))
+        else:
+            client = get_client(ctx)
+            stats = None
+            
+            if not force_local:
+                try:
+                    with console.status("Fetching feed statistics..."):
+                        stats = client.get_feed_stats(feed_path)
+                except DatabusAPIError as e:
+                    # Fall back to computing the statistics locally
+                    if e.status_code != 404:
+                        raise
+            
+            if stats is None:
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    with console.status(f"Downloading feed {feed_path}..."):
+                        downloaded_path = client.download_feed(feed_path, str(Path(tmp_dir) / f"{feed_path}.zip"))
+                    with console.status("Loading GTFS feed..."):
+                        stats = _load_feed_stats(downloaded_path)
         
         if output_format == "json":
             import json
@@ -185,7 +295,7 @@ def info(feed_path: str, output_format: str) -> None:
                 
                 from ..utils.helpers import get_route_type_name
                 for route_type, count in stats["routes_by_type"].items():
-                    route_table.add_row(get_route_type_name(route_type), str(count))
+                    route_table.add_row(get_route_type_name(int(route_type)), str(count))
                 
                 console.print()
                 console.print(route_table)
@@ -194,7 +304,7 @@ def info(feed_path: str, output_format: str) -> None:
             if "service_period" in stats:
                 console.print()
                 console.print(f"[bold]Service Period:[/bold] {stats['service_period']['start']} to {stats['service_period']['end']}")
-        
+    
     except DatabusError as e:
         console.print(f"[red]Error: {e}[/red]")
         sys.exit(1)
@@ -205,13 +315,17 @@ def info(feed_path: str, output_format: str) -> None:
 @click.option("--output", "-o", type=click.Path(), help="Output file path for report")
 @click.option("--format", "output_format", type=click.Choice(["table", "json"]), 
               default="table", help="Output format")
-def validate(feed_path: str, output: Optional[str], output_format: str) -> None:
+@click.pass_context
+def validate(ctx: click.Context, feed_path: str, output: Optional[str], output_format: str) -> None:
     """Validate a GTFS feed."""
+    from rich.table import Table
+    from ..gtfs import GTFSValidator
+    
+    console = get_console()
+    
     try:
-        processor = GTFSProcessor(feed_path)
-        
         with console.status("Loading GTFS feed..."):
-            processor.load_feed()
+            processor = _load_processor(feed_path, ctx.obj.get("cache_dir"))
         
         validator = GTFSValidator(processor)
         
@@ -219,13 +333,13 @@ def validate(feed_path: str, output: Optional[str], output_format: str) -> None:
             report = validator.validate()
         
         if output_format == "json":
-            report_json = report.to_json()
             if output:
-                with open(output, 'w') as f:
-                    f.write(report_json)
+                # Write the encoded bytes directly instead of round-tripping through str
+                with open(output, 'wb') as f:
+                    f.write(json_dumps(report.to_dict(), indent=True))
                 console.print(f"[green]✓[/green] Validation report saved to: {output}")
             else:
-                console.print(report_json)
+                console.print(report.to_json())
         else:
             # Display summary table
             summary_table = Table(title=f"Validation Report: {Path(feed_path).name}")
@@ -261,7 +375,7 @@ def validate(feed_path: str, output: Optional[str], output_format: str) -> None:
                     console.print(f"  • {warning['message']}")
                 if len(report.warnings) > 3:
                     console.print(f"  ... and {len(report.warnings) - 3} more warnings")
-        
+    
     except DatabusError as e:
         console.print(f"[red]Error: {e}[/red]")
         sys.exit(1)
@@ -272,26 +386,25 @@ def validate(feed_path: str, output: Optional[str], output_format: str) -> None:
 @click.argument("output_path", type=click.Path())
 @click.option("--bbox", help="Bounding box as 'min_lon,min_lat,max_lon,max_lat'")
 @click.option("--dates", help="Date range as 'start_date,end_date' (YYYY-MM-DD)")
-def filter(input_path: str, output_path: str, bbox: Optional[str], dates: Optional[str]) -> None:
+@click.pass_context
+def filter(ctx: click.Context, input_path: str, output_path: str, bbox: Optional[str], dates: Optional[str]) -> None:
     """Filter GTFS feed by geographic bounds or date range."""
+    console = get_console()
+    
     try:
-        processor = GTFSProcessor(input_path)
-        
         with console.status("Loading GTFS feed..."):
-            processor.load_feed()
+            processor = _load_processor(input_path, ctx.obj.get("cache_dir"))
         
-        filtered_processor = processor
+        bbox_coords = None
+        date_range = None
         
         if bbox:
             try:
                 coords = list(map(float, bbox.split(',')))
                 if len(coords) != 4:
                     raise ValueError("Bounding box must have 4 coordinates")
-                
-                min_lon, min_lat, max_lon, max_lat = coords
-                with console.status("Filtering by bounding box..."):
-                    filtered_processor = processor.filter_by_bounding_box(min_lat, min_lon, max_lat, max_lon)
-                    
+                bbox_coords = tuple(coords)
+            
             except ValueError as e:
                 console.print(f"[red]Invalid bounding box format: {e}[/red]")
                 sys.exit(1)
@@ -301,20 +414,32 @@ def filter(input_path: str, output_path: str, bbox: Optional[str], dates: Option
                 date_parts = dates.split(',')
                 if len(date_parts) != 2:
                     raise ValueError("Date range must have start and end date")
-                
-                start_date, end_date = date_parts
-                with console.status("Filtering by date range..."):
-                    filtered_processor = filtered_processor.filter_by_dates(start_date, end_date)
-                    
+                date_range = tuple(date_parts)
+            
             except ValueError as e:
                 console.print(f"[red]Invalid date range format: {e}[/red]")
                 sys.exit(1)
         
+        filtered_processor = processor
+        
+        if bbox_coords and date_range:
+            # Apply both predicates in a single pass over the feed tables
+            with console.status("Filtering by bounding box and date range..."):
+                filtered_processor = processor.filter(bbox=bbox_coords, dates=date_range)
+        elif bbox_coords:
+            min_lon, min_lat, max_lon, max_lat = bbox_coords
+            with console.status("Filtering by bounding box..."):
+                filtered_processor = processor.filter_by_bounding_box(min_lat, min_lon, max_lat, max_lon)
+        elif date_range:
+            start_date, end_date = date_range
+            with console.status("Filtering by date range..."):
+                filtered_processor = processor.filter_by_dates(start_date, end_date)
+        
         with console.status("Exporting filtered feed..."):
             output_file = filtered_processor.export_to_zip(output_path)
         
         console.print(f"[green]✓[/green] Filtered feed exported to: {output_file}")
-        
+    
     except DatabusError as e:
         console.print(f"[red]Error: {e}[/red]")
         sys.exit(1)
@@ -324,7 +449,7 @@ def filter(input_path: str, output_path: str, bbox: Optional[str], dates: Option
 def config_show() -> None:
     """Show current configuration."""
     import json
-    console.print(json.dumps(config.to_dict(), indent=2))
+    get_console().print(json.dumps(config.to_dict(), indent=2))
 
 
 if __name__ == "__main__":
@@ -3,17 +3,144 @@
 import logging
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-import math
 
 import pandas as pd
 import numpy as np
 
 from ..utils.exceptions import GTFSProcessingError
-from ..utils.helpers import calculate_distance, parse_gtfs_time
+from ..utils.helpers import _EARTH_RADIUS_KM, calculate_distance_batch
 
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on pairwise distances computed per block (~512 KB of float64)
+_PAIRWISE_BLOCK_SIZE = 1 << 16
+
+# Stops sampled for the pairwise distance statistics of analyze_stop_coverage
+_COVERAGE_SAMPLE_SIZE = 100
+
+
+def _pairwise_haversine_km(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    cos_lat1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+    cos_lat2: np.ndarray,
+) -> np.ndarray:
+    """Haversine distance matrix between two sets of points in radians.
+    
+    The formula is evaluated in place on two preallocated matrices so the
+    sin/cos/sqrt chain makes a single pass over memory per step, and the
+    latitude cosines are computed once per point rather than per pair.
+    
+    Returns:
+        Matrix of distances in kilometers with shape (len(lat1), len(lat2))
+    """
+    a = np.subtract.outer(lat1, lat2)
+    a *= 0.5
+    np.sin(a, out=a)
+    np.square(a, out=a)
+    
+    b = np.subtract.outer(lon1, lon2)
+    b *= 0.5
+    np.sin(b, out=b)
+    np.square(b, out=b)
+    b *= cos_lat1[:, None]
+    b *= cos_lat2[None, :]
+    
+    a += b
+    np.sqrt(a, out=a)
+    np.arcsin(a, out=a)
+    a *= 2 * _EARTH_RADIUS_KM
+    return a
+
+
+def _pairwise_distance_stats(lat: np.ndarray, lon: np.ndarray) -> Tuple[float, float, float]:
+    """Get mean, min and max haversine distance over all pairs of points.
+    
+    Rows are processed in blocks against the points after them, so memory
+    stays bounded while every unordered pair is visited exactly once.
+    
+    Args:
+        lat: Latitudes in degrees
+        lon: Longitudes in degrees
+    
+    Returns:
+        Tuple of (mean, min, max) distance in meters, zeros for fewer than two points
+    """
+    n = len(lat)
+    if n < 2:
+        return 0.0, 0.0, 0.0
+    
+    lat = np.radians(lat)
+    lon = np.radians(lon)
+    cos_lat = np.cos(lat)
+    block_rows = max(1, _PAIRWISE_BLOCK_SIZE // n)
+    
+    total = 0.0
+    minimum = np.inf
+    maximum = 0.0
+    for start in range(0, n - 1, block_rows):
+        stop = min(start + block_rows, n)
+        rows = slice(start, stop)
+        
+        # Pairs within the block (upper triangle) and with all later points
+        within = _pairwise_haversine_km(lat[rows], lon[rows], cos_lat[rows], lat[rows], lon[rows], cos_lat[rows])
+        blocks = [within[np.triu_indices(stop - start, k=1)]]
+        if stop < n:
+            later = slice(stop, n)
+            blocks.append(_pairwise_haversine_km(
+                lat[rows], lon[rows], cos_lat[rows], lat[later], lon[later], cos_lat[later]
+            ))
+        
+        for distances in blocks:
+            if distances.size:
+                total += distances.sum()
+                minimum = min(minimum, distances.min())
+                maximum = max(maximum, distances.max())
+    
+    pair_count = n * (n - 1) // 2
+    return total / pair_count * 1000, minimum * 1000, maximum * 1000
+
+
+def _sorted_group_diff_stats(
+    codes: np.ndarray,
+    values: np.ndarray,
+    n_groups: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Get per-group size and consecutive-difference statistics in one sweep.
+    
+    Differences are taken between neighbouring values of the same group, so
+    the inputs must be sorted by group code and then by value.
+    
+    Args:
+        codes: Integer group codes in the range [0, n_groups)
+        values: Values sorted within each group
+        n_groups: Number of groups
+    
+    Returns:
+        Tuple of (count, mean, min, max) arrays indexed by group code;
+        difference statistics are NaN for groups with fewer than two values
+    """
+    count = np.bincount(codes, minlength=n_groups)
+    mean = np.full(n_groups, np.nan)
+    minimum = np.full(n_groups, np.nan)
+    maximum = np.full(n_groups, np.nan)
+    
+    same_group = codes[1:] == codes[:-1]
+    diffs = np.diff(values)[same_group]
+    if diffs.size:
+        # Differences stay grouped, so each group is one contiguous segment
+        diff_codes = codes[1:][same_group]
+        starts = np.flatnonzero(np.r_[True, diff_codes[1:] != diff_codes[:-1]])
+        present = diff_codes[starts]
+        mean[present] = np.add.reduceat(diffs, starts) / np.diff(np.r_[starts, diffs.size])
+        minimum[present] = np.minimum.reduceat(diffs, starts)
+        maximum[present] = np.maximum.reduceat(diffs, starts)
+    
+    return count, mean, minimum, maximum
+
 
 class GTFSAnalyzer:
     """Analyzer for advanced GTFS data analysis and insights.
@@ -33,52 +160,90 @@ class GTFSAnalyzer:
         """
         from .processor import GTFSProcessor
         self.processor = processor
+        self._trip_routes = None
+        self._trip_routes_source = None
+    
+    def _get_trip_routes(self) -> pd.DataFrame:
+        """Get stop times joined with the route of their trip.
+        
+        The join is computed once and reused until the processor's stop
+        times or trips tables are replaced.
+        
+        Returns:
+            Stop times dataframe with added route_id, arrival_seconds and
+            departure_seconds columns, and categorical ID columns
+        """
+        stop_times = self.processor.get_stop_times()
+        trips = self.processor.get_trips()
+        
+        source = self._trip_routes_source
+        if source is None or source[0] is not stop_times or source[1] is not trips:
+            # Join on the trips index; duplicate trip IDs are rejected
+            seconds = self.processor.get_stop_time_seconds()
+            trip_route_ids = trips[['trip_id', 'route_id']].set_index('trip_id')
+            trip_routes = stop_times.assign(
+                arrival_seconds=seconds['arrival_seconds'].array,
+                departure_seconds=seconds['departure_seconds'].array,
+            ).merge(
+                trip_route_ids,
+                left_on='trip_id',
+                right_index=True,
+                how='inner',
+                validate='many_to_one',
+            ).reset_index(drop=True)
+            
+            # Hash the ID strings once; later groupbys work on integer codes
+            for column in ('route_id', 'trip_id', 'stop_id'):
+                trip_routes[column] = trip_routes[column].astype('category')
+            
+            self._trip_routes = trip_routes
+            self._trip_routes_source = (stop_times, trips)
+        
+        return self._trip_routes
     
     def analyze_service_frequency(self, time_window: int = 3600) -> Dict[str, Any]:
         """Analyze service frequency by route and time period.
         
         Args:
             time_window: Time window in seconds (default: 1 hour)
-            
+        
         Returns:
             Dictionary with frequency analysis results
         """
         try:
-            stop_times = self.processor.get_stop_times()
-            trips = self.processor.get_trips()
             routes = self.processor.get_routes()
             
-            # Join stop times with trips to get route info
-            trip_routes = stop_times.merge(trips[['trip_id', 'route_id']], on='trip_id')
+            # Stop times joined with trips to get route info
+            trip_routes = self._get_trip_routes()
+            
+            # Filter out invalid times
+            trip_routes = trip_routes[['route_id', 'trip_id', 'arrival_seconds']].dropna(subset=['arrival_seconds'])
             
-            # Parse arrival times
-            trip_routes['arrival_seconds'] = trip_routes['arrival_time'].apply(
-                lambda x: parse_gtfs_time(x).total_seconds() if parse_gtfs_time(x) else None
+            # Get first stop of each trip (trip start times) for all routes at once
+            trip_starts = (
+                trip_routes.groupby(['route_id', 'trip_id'], sort=False, observed=True)['arrival_seconds']
+                .min()
+                .reset_index()
             )
             
-            # Filter out invalid times
-            trip_routes = trip_routes.dropna(subset=['arrival_seconds'])
+            # Headways (time between consecutive trips) of every route in one sweep
+            codes, route_ids = pd.factorize(trip_starts['route_id'], sort=True)
+            starts = trip_starts['arrival_seconds'].to_numpy(dtype=np.float64)
+            order = np.lexsort((starts, codes))
+            total_trips, average_headway, min_headway, max_headway = _sorted_group_diff_stats(
+                codes[order], starts[order], len(route_ids)
+            )
+            route_names = _route_names(routes)
             
-            # Group by route and calculate frequency metrics
             frequency_analysis = {}
-            
-            for route_id in trip_routes['route_id'].unique():
-                route_data = trip_routes[trip_routes['route_id'] == route_id]
-                route_info = routes[routes['route_id'] == route_id].iloc[0]
-                
-                # Get first stop of each trip (trip start times)
-                trip_starts = route_data.groupby('trip_id')['arrival_seconds'].min()
-                
-                # Calculate headways (time between consecutive trips)
-                headways = trip_starts.sort_values().diff().dropna()
-                
+            for i, route_id in enumerate(route_ids):
                 frequency_analysis[route_id] = {
-                    'route_name': route_info.get('route_long_name', route_info.get('route_short_name', route_id)),
-                    'total_trips': len(trip_starts),
-                    'average_headway_minutes': headways.mean() / 60 if not headways.empty else None,
-                    'min_headway_minutes': headways.min() / 60 if not headways.empty else None,
-                    'max_headway_minutes': headways.max() / 60 if not headways.empty else None,
-                    'trips_per_hour': len(trip_starts) * (time_window / (24 * 3600)) if not trip_starts.empty else 0,
+                    'route_name': route_names.get(route_id, route_id),
+                    'total_trips': int(total_trips[i]),
+                    'average_headway_minutes': _minutes_or_none(average_headway[i]),
+                    'min_headway_minutes': _minutes_or_none(min_headway[i]),
+                    'max_headway_minutes': _minutes_or_none(max_headway[i]),
+                    'trips_per_hour': total_trips[i] * (time_window / (24 * 3600)),
                 }
             
             return {
@@ -89,7 +254,7 @@ class GTFSAnalyzer:
                     'time_window_hours': time_window / 3600,
                 }
             }
-            
+        
         except Exception as e:
             raise GTFSProcessingError(f"Failed to analyze service frequency: {e}")
     
@@ -98,7 +263,7 @@ class GTFSAnalyzer:
         
         Args:
             buffer_distance: Buffer distance in meters for coverage analysis
-            
+        
         Returns:
             Dictionary with coverage analysis results
         """
@@ -108,41 +273,36 @@ class GTFSAnalyzer:
             if stops.empty:
                 return {'error': 'No stops found in feed'}
             
-            # Calculate stop density
-            lat_range = stops['stop_lat'].max() - stops['stop_lat'].min()
-            lon_range = stops['stop_lon'].max() - stops['stop_lon'].min()
+            # Bounding box of all stops in a single reduction over both columns
+            coords = stops[['stop_lat', 'stop_lon']].to_numpy(dtype=np.float64)
+            mins = np.nanmin(coords, axis=0)
+            maxs = np.nanmax(coords, axis=0)
+            lat_range, lon_range = maxs - mins
             
             # Approximate area in km² (rough calculation)
-            area_km2 = lat_range * lon_range * 111 * 111 * math.cos(math.radians(stops['stop_lat'].mean()))
-            
-            # Calculate distances between stops
-            distances = []
-            stop_coords = stops[['stop_lat', 'stop_lon']].values
+            area_km2 = lat_range * lon_range * 111 * 111 * np.cos(np.radians(np.nanmean(coords[:, 0])))
             
-            for i in range(min(100, len(stop_coords))):  # Sample first 100 stops for performance
-                for j in range(i + 1, min(100, len(stop_coords))):
-                    dist = calculate_distance(
-                        stop_coords[i][0], stop_coords[i][1],
-                        stop_coords[j][0], stop_coords[j][1]
-                    )
-                    distances.append(dist * 1000)  # Convert to meters
+            # Distances between all pairs of the first stops with coordinates;
+            # the sample keeps the quadratic pair count bounded
+            located = coords[~np.isnan(coords).any(axis=1)][:_COVERAGE_SAMPLE_SIZE]
+            mean_distance, min_distance, max_distance = _pairwise_distance_stats(located[:, 0], located[:, 1])
             
             return {
                 'total_stops': len(stops),
                 'stop_density_per_km2': len(stops) / area_km2 if area_km2 > 0 else 0,
                 'coverage_area_km2': area_km2,
                 'buffer_distance_m': buffer_distance,
-                'average_stop_distance_m': np.mean(distances) if distances else 0,
-                'min_stop_distance_m': min(distances) if distances else 0,
-                'max_stop_distance_m': max(distances) if distances else 0,
+                'average_stop_distance_m': mean_distance,
+                'min_stop_distance_m': min_distance,
+                'max_stop_distance_m': max_distance,
                 'bounding_box': {
-                    'min_lat': stops['stop_lat'].min(),
-                    'max_lat': stops['stop_lat'].max(),
-                    'min_lon': stops['stop_lon'].min(),
-                    'max_lon': stops['stop_lon'].max(),
+                    'min_lat': mins[0],
+                    'max_lat': maxs[0],
+                    'min_lon': mins[1],
+                    'max_lon': maxs[1],
                 }
             }
-            
+        
         except Exception as e:
             raise GTFSProcessingError(f"Failed to analyze stop coverage: {e}")
     
@@ -155,64 +315,76 @@ class GTFSAnalyzer:
         try:
             routes = self.processor.get_routes()
             trips = self.processor.get_trips()
-            stop_times = self.processor.get_stop_times()
             stops = self.processor.get_stops()
             
-            efficiency_analysis = {}
+            # Stop times joined with trips to get route info
+            trip_routes = self._get_trip_routes()
+            
+            # Per-route counts of distinct stops and scheduled trips
+            route_stops = trip_routes[['route_id', 'stop_id']]
+            unique_stops = route_stops.groupby('route_id', sort=False, observed=True)['stop_id'].nunique()
+            total_trips = trips.groupby('route_id', sort=False).size()
+            
+            # Average trip duration from the first departure to the last arrival
+            timed = trip_routes[['route_id', 'trip_id', 'stop_sequence', 'arrival_seconds', 'departure_seconds']]
+            timed = timed.sort_values(['trip_id', 'stop_sequence'], kind='stable')
+            timed = timed[timed['trip_id'].duplicated(keep=False)]  # Trips with at least two stops
+            first_stops = timed.drop_duplicates('trip_id', keep='first').set_index('trip_id')
+            last_stops = timed.drop_duplicates('trip_id', keep='last').set_index('trip_id')
+            trip_durations = (last_stops['arrival_seconds'] - first_stops['departure_seconds']) / 60  # minutes
+            average_durations = trip_durations.groupby(first_stops['route_id'], sort=False, observed=True).mean()
+            
+            # Calculate route length (approximate using straight-line distances
+            # between stops in the order trips usually visit them)
+            stop_orders = (
+                trip_routes.groupby(['route_id', 'stop_id'], sort=False, observed=True)['stop_sequence']
+                .median()
+                .rename('stop_order')
+                .reset_index()
+            )
+            route_coords = stop_orders.merge(
+                stops[['stop_id', 'stop_lat', 'stop_lon']], on='stop_id'
+            ).sort_values(['route_id', 'stop_order'], kind='stable')
+            
+            route_ids = route_coords['route_id'].to_numpy()
+            lat = route_coords['stop_lat'].to_numpy(dtype=np.float64)
+            lon = route_coords['stop_lon'].to_numpy(dtype=np.float64)
+            same_route = route_ids[1:] == route_ids[:-1]
+            segment_lengths = calculate_distance_batch(lat[:-1], lon[:-1], lat[1:], lon[1:])
+            route_lengths = (
+                pd.Series(segment_lengths[same_route])
+                .groupby(route_ids[1:][same_route], sort=False)
+                .sum()
+            )
             
-            for _, route in routes.iterrows():
-                route_id = route['route_id']
-                route_trips = trips[trips['route_id'] == route_id]
-                
-                if route_trips.empty:
-                    continue
-                
-                # Get stop times for this route's trips
-                trip_ids = route_trips['trip_id'].tolist()
-                route_stop_times = stop_times[stop_times['trip_id'].isin(trip_ids)]
-                
-                if route_stop_times.empty:
-                    continue
-                
-                # Calculate route metrics
-                unique_stops = route_stop_times['stop_id'].nunique()
-                total_trips = len(route_trips)
-                
-                # Calculate average trip duration
-                trip_durations = []
-                for trip_id in trip_ids[:10]:  # Sample first 10 trips for performance
-                    trip_stops = route_stop_times[route_stop_times['trip_id'] == trip_id].sort_values('stop_sequence')
-                    
-                    if len(trip_stops) >= 2:
-                        start_time = parse_gtfs_time(trip_stops.iloc[0]['departure_time'])
-                        end_time = parse_gtfs_time(trip_stops.iloc[-1]['arrival_time'])
-                        
-                        if start_time and end_time:
-                            duration = (end_time - start_time).total_seconds() / 60  # minutes
-                            trip_durations.append(duration)
-                
-                # Calculate route length (approximate using straight-line distances)
-                route_stops_ids = route_stop_times['stop_id'].unique()
-                route_stops_coords = stops[stops['stop_id'].isin(route_stops_ids)]
-                
-                route_length_km = 0
-                if len(route_stops_coords) >= 2:
-                    coords = route_stops_coords[['stop_lat', 'stop_lon']].values
-                    for i in range(len(coords) - 1):
-                        dist = calculate_distance(
-                            coords[i][0], coords[i][1],
-                            coords[i + 1][0], coords[i + 1][1]
-                        )
-                        route_length_km += dist
-                
-                efficiency_analysis[route_id] = {
-                    'route_name': route.get('route_long_name', route.get('route_short_name', route_id)),
-                    'route_type': route.get('route_type'),
-                    'unique_stops': unique_stops,
-                    'total_trips': total_trips,
-                    'average_trip_duration_minutes': np.mean(trip_durations) if trip_durations else None,
-                    'approximate_length_km': route_length_km,
-                    'stops_per_km': unique_stops / route_length_km if route_length_km > 0 else None,
+            # Attach the per-route aggregates to the route table in file order
+            route_info = routes[routes['route_id'].isin(unique_stops.index)]
+            analyzed = route_info['route_id']
+            name_column = next(
+                (column for column in ('route_long_name', 'route_short_name') if column in routes.columns),
+                'route_id',
+            )
+            metrics = pd.DataFrame({
+                'route_id': analyzed.to_numpy(),
+                'route_name': route_info[name_column].to_numpy(),
+                'route_type': route_info['route_type'].to_numpy() if 'route_type' in routes.columns else None,
+                'unique_stops': unique_stops.reindex(analyzed).to_numpy(),
+                'total_trips': total_trips.reindex(analyzed).to_numpy(),
+                'average_duration': average_durations.reindex(analyzed).to_numpy(dtype=np.float64, na_value=np.nan),
+                'length_km': route_lengths.reindex(analyzed, fill_value=0.0).to_numpy(),
+            })
+            metrics['stops_per_km'] = (metrics['unique_stops'] / metrics['length_km']).where(metrics['length_km'] > 0)
+            
+            efficiency_analysis = {}
+            for row in metrics.itertuples(index=False):
+                efficiency_analysis[row.route_id] = {
+                    'route_name': row.route_name,
+                    'route_type': row.route_type,
+                    'unique_stops': row.unique_stops,
+                    'total_trips': row.total_trips,
+                    'average_trip_duration_minutes': None if pd.isna(row.average_duration) else row.average_duration,
+                    'approximate_length_km': row.length_km,
+                    'stops_per_km': None if pd.isna(row.stops_per_km) else row.stops_per_km,
                 }
             
             return {
@@ -223,7 +395,7 @@ class GTFSAnalyzer:
                     'average_trips_per_route': np.mean([r['total_trips'] for r in efficiency_analysis.values()]),
                 }
             }
-            
+        
         except Exception as e:
             raise GTFSProcessingError(f"Failed to analyze route efficiency: {e}")
     
@@ -234,39 +406,36 @@ class GTFSAnalyzer:
             Dictionary with temporal analysis results
         """
         try:
-            stop_times = self.processor.get_stop_times()
             calendar = self.processor.feed.calendar
             
-            # Parse departure times
-            stop_times['departure_seconds'] = stop_times['departure_time'].apply(
-                lambda x: parse_gtfs_time(x).total_seconds() if parse_gtfs_time(x) else None
+            # Departure times parsed once by the processor
+            departure_seconds = (
+                self.processor.get_stop_time_seconds()['departure_seconds'].dropna().to_numpy(dtype=np.int64)
             )
+            if not departure_seconds.size:
+                raise ValueError("no valid departure times")
             
-            stop_times = stop_times.dropna(subset=['departure_seconds'])
-            
-            # Convert to hours
-            stop_times['departure_hour'] = stop_times['departure_seconds'] / 3600
-            
-            # Analyze hourly patterns
-            hourly_trips = stop_times.groupby(stop_times['departure_hour'].astype(int)).size()
+            # Analyze hourly patterns; hours form a small non-negative range
+            hourly_trips = np.bincount(departure_seconds // 3600, minlength=24)
+            served_hours = np.flatnonzero(hourly_trips)
             
             # Find peak hours
-            peak_hour = hourly_trips.idxmax()
-            off_peak_hour = hourly_trips.idxmin()
+            peak_hour = int(hourly_trips.argmax())
+            off_peak_hour = int(served_hours[hourly_trips[served_hours].argmin()])
             
             # Service span
-            service_start = stop_times['departure_hour'].min()
-            service_end = stop_times['departure_hour'].max()
+            service_start = departure_seconds.min() / 3600
+            service_end = departure_seconds.max() / 3600
             
             temporal_analysis = {
                 'service_span_hours': service_end - service_start,
                 'earliest_service_hour': service_start,
                 'latest_service_hour': service_end,
                 'peak_hour': peak_hour,
-                'peak_hour_trips': hourly_trips[peak_hour],
+                'peak_hour_trips': int(hourly_trips[peak_hour]),
                 'off_peak_hour': off_peak_hour,
-                'off_peak_hour_trips': hourly_trips[off_peak_hour],
-                'hourly_distribution': hourly_trips.to_dict(),
+                'off_peak_hour_trips': int(hourly_trips[off_peak_hour]),
+                'hourly_distribution': {int(hour): int(hourly_trips[hour]) for hour in served_hours},
             }
             
             # Analyze weekly patterns if calendar data is available
@@ -282,7 +451,7 @@ class GTFSAnalyzer:
                 temporal_analysis['weekly_patterns'] = weekday_service
             
             return temporal_analysis
-            
+        
         except Exception as e:
             raise GTFSProcessingError(f"Failed to analyze temporal patterns: {e}")
     
@@ -306,7 +475,7 @@ class GTFSAnalyzer:
             
             logger.info("Comprehensive analysis report generated successfully")
             return report
-            
+        
         except Exception as e:
             raise GTFSProcessingError(f"Failed to generate comprehensive report: {e}")
     
@@ -315,64 +484,81 @@ class GTFSAnalyzer:
         
         Args:
             min_headway_minutes: Minimum time gap to consider as a service gap
-            
+        
         Returns:
             Dictionary with service gap analysis
         """
         try:
-            stop_times = self.processor.get_stop_times()
-            trips = self.processor.get_trips()
-            
-            # Join to get route information
-            trip_routes = stop_times.merge(trips[['trip_id', 'route_id']], on='trip_id')
-            
-            # Parse times
-            trip_routes['departure_seconds'] = trip_routes['departure_time'].apply(
-                lambda x: parse_gtfs_time(x).total_seconds() if parse_gtfs_time(x) else None
+            # Stop times joined with trips to get route information
+            trip_routes = self._get_trip_routes()
+            
+            # Sort all departures by route and time, then diff within each route
+            departures = (
+                trip_routes[['route_id', 'departure_seconds']]
+                .dropna(subset=['departure_seconds'])
+                .sort_values(['route_id', 'departure_seconds'])
             )
-            
-            trip_routes = trip_routes.dropna(subset=['departure_seconds'])
+            departures['previous_seconds'] = departures.groupby('route_id', sort=False, observed=True)['departure_seconds'].shift()
+            departures['gap'] = departures['departure_seconds'] - departures['previous_seconds']
+            
+            # Find gaps larger than threshold
+            large_gaps = departures[(departures['gap'] > min_headway_minutes * 60).fillna(False)]
+            gap_stats = large_gaps.groupby('route_id', sort=False, observed=True)['gap'].agg(['size', 'max', 'mean'])
+            first_gaps = large_gaps.groupby('route_id', sort=False, observed=True).head(5)  # Show first 5 gaps
+            first_gaps = pd.DataFrame({
+                'route_id': first_gaps['route_id'],
+                'start_time': _seconds_to_times(first_gaps['previous_seconds']),
+                'end_time': _seconds_to_times(first_gaps['departure_seconds']),
+                'duration_minutes': first_gaps['gap'] / 60,
+            })
+            gap_times = {
+                route_id: route_gaps[['start_time', 'end_time', 'duration_minutes']].to_dict(orient='records')
+                for route_id, route_gaps in first_gaps.groupby('route_id', sort=False, observed=True)
+            }
             
             service_gaps = {}
-            
-            for route_id in trip_routes['route_id'].unique():
-                route_data = trip_routes[trip_routes['route_id'] == route_id]
-                
-                # Get all departure times for this route
-                departures = route_data['departure_seconds'].sort_values()
-                gaps = departures.diff()
-                
-                # Find gaps larger than threshold
-                large_gaps = gaps[gaps > min_headway_minutes * 60]
-                
-                if not large_gaps.empty:
-                    service_gaps[route_id] = {
-                        'gaps_found': len(large_gaps),
-                        'largest_gap_minutes': large_gaps.max() / 60,
-                        'average_gap_minutes': large_gaps.mean() / 60,
-                        'gap_times': [
-                            {
-                                'start_time': seconds_to_time(departures.iloc[i-1]),
-                                'end_time': seconds_to_time(departures.iloc[i]),
-                                'duration_minutes': gap / 60
-                            }
-                            for i, gap in enumerate(large_gaps) if i < 5  # Show first 5 gaps
-                        ]
-                    }
+            for route_id, stats in gap_stats.iterrows():
+                service_gaps[route_id] = {
+                    'gaps_found': int(stats['size']),
+                    'largest_gap_minutes': stats['max'] / 60,
+                    'average_gap_minutes': stats['mean'] / 60,
+                    'gap_times': gap_times[route_id],
+                }
             
             return {
                 'threshold_minutes': min_headway_minutes,
                 'routes_with_gaps': len(service_gaps),
                 'gaps_by_route': service_gaps
             }
-            
+        
         except Exception as e:
             raise GTFSProcessingError(f"Failed to find service gaps: {e}")
 
 
+def _route_names(routes: pd.DataFrame) -> Dict[str, Any]:
+    """Map route IDs to their long name, falling back to the short name."""
+    for column in ('route_long_name', 'route_short_name'):
+        if column in routes.columns:
+            return dict(zip(routes['route_id'], routes[column]))
+    return {}
+
+
+def _minutes_or_none(seconds: Any) -> Optional[float]:
+    """Convert seconds to minutes, keeping missing values as None."""
+    return None if pd.isna(seconds) else seconds / 60
+
+
 def seconds_to_time(seconds: float) -> str:
     """Convert seconds to HH:MM:SS format."""
     hours = int(seconds // 3600)
     minutes = int((seconds % 3600) // 60)
     secs = int(seconds % 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+def _seconds_to_times(seconds: pd.Series) -> np.ndarray:
+    """Convert a column of seconds to HH:MM:SS strings in bulk."""
+    seconds = seconds.to_numpy(dtype=np.float64)
+    fields = (seconds // 3600, seconds % 3600 // 60, seconds % 60)
+    hours, minutes, secs = (pd.Series(field.astype(np.int64)).astype(str).str.zfill(2) for field in fields)
+    return (hours + ':' + minutes + ':' + secs).to_numpy()
@@ -1,19 +1,167 @@
 """GTFS format converter for transforming between different formats."""
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Union, Optional
+from typing import Callable, Dict, Any, List, Union, Optional
 import tempfile
 
 import pandas as pd
 import geopandas as gpd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 from shapely.geometry import Point, LineString
 
+try:
+    import pyogrio
+except ImportError:  # pragma: no cover - optional dependency
+    pyogrio = None
+
+try:
+    import xlsxwriter
+except ImportError:  # pragma: no cover - optional dependency
+    xlsxwriter = None
+
 from ..utils.exceptions import GTFSProcessingError
+from ..utils.serialization import json_dumps
 
 
 logger = logging.getLogger(__name__)
 
+# Tables are written concurrently; pyarrow releases the GIL while encoding
+_MAX_WRITE_WORKERS = min(8, os.cpu_count() or 1)
+
+# Excel sheet limits: rows including the header, and sheet name length
+_EXCEL_MAX_ROWS = 1_048_576
+_EXCEL_MAX_SHEET_NAME = 31
+
+
+def _to_arrow(df: Union[pd.DataFrame, pa.Table]) -> pa.Table:
+    """Get an Arrow table for a dataframe, passing Arrow tables through."""
+    if isinstance(df, pa.Table):
+        return df
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def _write_parquet(df: Union[pd.DataFrame, pa.Table], path: Path) -> None:
+    """Write a table to a zstd-compressed, dictionary-encoded Parquet file."""
+    pq.write_table(
+        _to_arrow(df),
+        path,
+        compression='zstd',
+        compression_level=3,
+        use_dictionary=True,
+        data_page_size=1 << 20,
+    )
+
+
+def _write_csv(df: Union[pd.DataFrame, pa.Table], path: Path) -> None:
+    """Write a table to CSV with pyarrow's native writer.
+    
+    The header is written unquoted, as GTFS files conventionally have it,
+    while pyarrow quotes every string value.
+    """
+    table = _to_arrow(df)
+    with open(path, 'wb') as f:
+        f.write((','.join(table.column_names) + '\n').encode('utf-8'))
+        pacsv.write_csv(
+            table,
+            f,
+            write_options=pacsv.WriteOptions(include_header=False, quoting_style='needed'),
+        )
+
+
+def _write_point_geojson(gdf: gpd.GeoDataFrame, path: Path) -> None:
+    """Write a layer of WGS84 points as a GeoJSON FeatureCollection.
+    
+    Features are built from the coordinate arrays and encoded in a single
+    call, skipping OGR's feature-by-feature write path.
+    """
+    properties = gdf.drop(columns=gdf.geometry.name)
+    properties = properties.astype(object).where(properties.notna(), None)
+    features = [
+        {
+            "type": "Feature",
+            "properties": record,
+            "geometry": {"type": "Point", "coordinates": [x, y]},
+        }
+        for record, x, y in zip(
+            properties.to_dict(orient="records"),
+            gdf.geometry.x.tolist(),
+            gdf.geometry.y.tolist(),
+        )
+    ]
+    with open(path, "wb") as f:
+        f.write(json_dumps({"type": "FeatureCollection", "features": features}))
+
+
+def _to_file(gdf: gpd.GeoDataFrame, path: Path, driver: str, layer: Optional[str] = None) -> None:
+    """Write a spatial layer, using the fast writer for GeoJSON point layers.
+    
+    Other layers are written through pyogrio's bulk OGR API when it is
+    installed, falling back to geopandas' default engine otherwise.
+    """
+    is_wgs84 = gdf.crs is None or gdf.crs.to_epsg() == 4326
+    is_points = (gdf.geom_type == "Point").all() and not gdf.geometry.is_empty.any()
+    if driver == "GeoJSON" and is_wgs84 and is_points:
+        _write_point_geojson(gdf, path)
+    elif pyogrio is not None:
+        pyogrio.write_dataframe(gdf, path, layer=layer, driver=driver)
+    else:
+        gdf.to_file(path, driver=driver, layer=layer)
+
+
+def _sheet_names(table_names: List[str]) -> Dict[str, str]:
+    """Map table names to unique Excel sheet names within the length limit."""
+    sheet_names = {}
+    used = set()
+    for table_name in table_names:
+        sheet_name = table_name[:_EXCEL_MAX_SHEET_NAME]
+        suffix = 1
+        while sheet_name.lower() in used:
+            # Excel compares sheet names case-insensitively
+            tag = f"~{suffix}"
+            sheet_name = table_name[:_EXCEL_MAX_SHEET_NAME - len(tag)] + tag
+            suffix += 1
+        used.add(sheet_name.lower())
+        sheet_names[table_name] = sheet_name
+    return sheet_names
+
+
+def _write_tables(
+    writer: Callable[[Union[pd.DataFrame, pa.Table], Path], None],
+    tables: Dict[str, Union[pd.DataFrame, pa.Table]],
+    output_dir: Path,
+    extension: str,
+) -> Dict[str, Path]:
+    """Write non-empty tables concurrently, one file per table.
+    
+    Args:
+        writer: Function writing one dataframe to a path
+        tables: Dictionary mapping table names to dataframes or Arrow tables
+        output_dir: Directory to save the files
+        extension: File extension including the leading dot
+    
+    Returns:
+        Dictionary mapping table names to file paths
+    """
+    files = {
+        table_name: output_dir / f"{table_name}{extension}"
+        for table_name, df in tables.items()
+        if len(df)
+    }
+    
+    with ThreadPoolExecutor(max_workers=_MAX_WRITE_WORKERS) as executor:
+        # Consume the results so the first failure is raised here
+        list(executor.map(writer, (tables[name] for name in files), files.values()))
+    
+    for table_name, path in files.items():
+        logger.info(f"Exported {table_name} ({len(tables[table_name])} rows) to {path}")
+    
+    return files
+
 
 class GTFSConverter:
     """Converter for transforming GTFS data between different formats.
@@ -35,13 +183,32 @@ class GTFSConverter:
         from .processor import GTFSProcessor
         self.processor = processor
     
+    def _get_tables(self) -> Dict[str, Union[pd.DataFrame, pa.Table]]:
+        """Get the feed tables for export.
+        
+        When the processor's feed is backed by a Feather cache and none of
+        its tables has been replaced since, the tables are read from it as
+        memory-mapped Arrow tables, skipping the conversion from pandas.
+        
+        Returns:
+            Dictionary mapping table names to dataframes or Arrow tables
+        """
+        cache_dir = self.processor.get_feather_cache_dir()
+        if cache_dir is None:
+            return self.processor.to_dict()
+        
+        return {
+            path.stem: pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+            for path in sorted(cache_dir.glob("*.feather"))
+        }
+    
     def to_geojson(self, output_dir: Union[str, Path], include_shapes: bool = True) -> Dict[str, Path]:
         """Convert GTFS to GeoJSON format.
         
         Args:
             output_dir: Directory to save GeoJSON files
             include_shapes: Whether to include route shapes
-            
+        
         Returns:
             Dictionary mapping layer names to file paths
         """
@@ -55,7 +222,7 @@ class GTFSConverter:
             stops_gdf = self.processor.get_stops(as_geodataframe=True)
             if not stops_gdf.empty:
                 stops_path = output_dir / "stops.geojson"
-                stops_gdf.to_file(stops_path, driver="GeoJSON")
+                _to_file(stops_gdf, stops_path, "GeoJSON", layer="stops")
                 files["stops"] = stops_path
                 logger.info(f"Exported {len(stops_gdf)} stops to {stops_path}")
             
@@ -64,12 +231,12 @@ class GTFSConverter:
                 shapes_gdf = self.processor.get_shapes(as_geodataframe=True)
                 if not shapes_gdf.empty:
                     shapes_path = output_dir / "shapes.geojson"
-                    shapes_gdf.to_file(shapes_path, driver="GeoJSON")
+                    _to_file(shapes_gdf, shapes_path, "GeoJSON", layer="shapes")
                     files["shapes"] = shapes_path
                     logger.info(f"Exported shapes to {shapes_path}")
             
             return files
-            
+        
         except Exception as e:
             raise GTFSProcessingError(f"Failed to convert to GeoJSON: {e}")
     
@@ -78,26 +245,18 @@ class GTFSConverter:
         
         Args:
             output_dir: Directory to save Parquet files
-            
+        
         Returns:
             Dictionary mapping table names to file paths
         """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        files = {}
-        tables = self.processor.to_dict()
+        tables = self._get_tables()
         
         try:
-            for table_name, df in tables.items():
-                if not df.empty:
-                    parquet_path = output_dir / f"{table_name}.parquet"
-                    df.to_parquet(parquet_path, index=False)
-                    files[table_name] = parquet_path
-                    logger.info(f"Exported {table_name} ({len(df)} rows) to {parquet_path}")
-            
-            return files
-            
+            return _write_tables(_write_parquet, tables, output_dir, ".parquet")
+        
         except Exception as e:
             raise GTFSProcessingError(f"Failed to convert to Parquet: {e}")
     
@@ -106,25 +265,39 @@ class GTFSConverter:
         
         Args:
             output_path: Path for output Excel file
-            
+        
         Returns:
             Path to created Excel file
         """
         output_path = Path(output_path)
         tables = self.processor.to_dict()
         
+        # xlsxwriter in constant memory mode streams rows instead of
+        # holding whole sheets in memory
+        if xlsxwriter is not None:
+            writer_options = {'engine': 'xlsxwriter', 'engine_kwargs': {'options': {'constant_memory': True}}}
+        else:
+            writer_options = {'engine': 'openpyxl'}
+        
         try:
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+            tables = {table_name: df for table_name, df in tables.items() if not df.empty}
+            sheet_names = _sheet_names(list(tables))
+            
+            with pd.ExcelWriter(output_path, **writer_options) as writer:
                 for table_name, df in tables.items():
-                    if not df.empty:
-                        # Excel sheet names are limited to 31 characters
-                        sheet_name = table_name[:31]
-                        df.to_excel(writer, sheet_name=sheet_name, index=False)
-                        logger.info(f"Added {table_name} sheet with {len(df)} rows")
+                    if len(df) >= _EXCEL_MAX_ROWS:
+                        logger.warning(
+                            f"Skipped {table_name} sheet: {len(df)} rows exceed the Excel limit "
+                            f"of {_EXCEL_MAX_ROWS - 1} data rows"
+                        )
+                        continue
+                    
+                    df.to_excel(writer, sheet_name=sheet_names[table_name], index=False)
+                    logger.info(f"Added {table_name} sheet with {len(df)} rows")
             
             logger.info(f"Exported GTFS to Excel: {output_path}")
             return output_path
-            
+        
         except Exception as e:
             raise GTFSProcessingError(f"Failed to convert to Excel: {e}")
     
@@ -133,26 +306,18 @@ class GTFSConverter:
         
         Args:
             output_dir: Directory to save CSV files
-            
+        
         Returns:
             Dictionary mapping table names to file paths
         """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        files = {}
-        tables = self.processor.to_dict()
+        tables = self._get_tables()
         
         try:
-            for table_name, df in tables.items():
-                if not df.empty:
-                    csv_path = output_dir / f"{table_name}.txt"
-                    df.to_csv(csv_path, index=False)
-                    files[table_name] = csv_path
-                    logger.info(f"Exported {table_name} ({len(df)} rows) to {csv_path}")
-            
-            return files
-            
+            return _write_tables(_write_csv, tables, output_dir, ".txt")
+        
         except Exception as e:
             raise GTFSProcessingError(f"Failed to convert to CSV: {e}")
     
@@ -165,8 +330,9 @@ class GTFSConverter:
         
         Args:
             output_dir: Directory to save files
-            formats: List of formats to export ('geojson', 'shapefile', 'gpkg')
-            
+            formats: List of formats to export ('geojson', 'shapefile', 'gpkg');
+                GeoPackage output holds every layer in a single gtfs.gpkg file
+        
         Returns:
             Nested dictionary with format and layer names mapping to paths
         """
@@ -200,18 +366,18 @@ class GTFSConverter:
             try:
                 # Export stops
                 if not stops_gdf.empty:
-                    stops_path = format_dir / f"stops{ext}"
-                    stops_gdf.to_file(stops_path, driver=driver)
+                    stops_path = format_dir / (f"gtfs{ext}" if fmt == 'gpkg' else f"stops{ext}")
+                    _to_file(stops_gdf, stops_path, driver, layer='stops')
                     results[fmt]['stops'] = stops_path
                 
-                # Export shapes
+                # Export shapes (GeoPackage layers share a single file)
                 if not shapes_gdf.empty:
-                    shapes_path = format_dir / f"shapes{ext}"
-                    shapes_gdf.to_file(shapes_path, driver=driver)
+                    shapes_path = format_dir / (f"gtfs{ext}" if fmt == 'gpkg' else f"shapes{ext}")
+                    _to_file(shapes_gdf, shapes_path, driver, layer='shapes')
                     results[fmt]['shapes'] = shapes_path
                 
                 logger.info(f"Exported spatial data to {fmt} format in {format_dir}")
-                
+            
             except Exception as e:
                 logger.error(f"Failed to export to {fmt}: {e}")
         
@@ -222,7 +388,7 @@ class GTFSConverter:
         
         Args:
             output_path: Path for output report file
-            
+        
         Returns:
             Path to created report file
         """
@@ -278,6 +444,6 @@ class GTFSConverter:
             
             logger.info(f"Created summary report: {output_path}")
             return output_path
-            
+        
         except Exception as e:
             raise GTFSProcessingError(f"Failed to create summary report: {e}")
@@ -1,22 +1,223 @@
 """GTFS data processor for loading, manipulating, and analyzing transit data."""
 
+import copy
+import hashlib
+import json
 import logging
 import zipfile
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Callable, Dict, List, Optional, Tuple, Union, Any
 import tempfile
 import os
 
+import numpy as np
 import pandas as pd
 import gtfs_kit as gk
 import geopandas as gpd
-from shapely.geometry import Point
+import shapely
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from pyarrow import feather
 
 from ..utils.exceptions import GTFSProcessingError, GTFSValidationError
 
 
 logger = logging.getLogger(__name__)
 
+# GTFS tables held by a gtfs_kit Feed
+_GTFS_TABLES = (
+    'agency',
+    'routes',
+    'stops',
+    'trips',
+    'stop_times',
+    'shapes',
+    'calendar',
+    'calendar_dates',
+    'fare_attributes',
+    'fare_rules',
+    'frequencies',
+    'transfers',
+    'feed_info',
+    'attributions',
+)
+
+# Repeated ID columns held as categoricals; unique keys such as
+# stops.stop_id would gain nothing from dictionary encoding
+_CATEGORICAL_COLUMNS = {
+    'routes': ('agency_id',),
+    'trips': ('route_id', 'service_id', 'shape_id'),
+    'stop_times': ('trip_id', 'stop_id'),
+    'calendar_dates': ('service_id',),
+    'shapes': ('shape_id',),
+}
+
+# Small enumerations and sequence numbers, stored in the narrowest
+# signed integer type that holds their values
+_DOWNCAST_COLUMNS = {
+    'routes': ('route_type',),
+    'stops': ('location_type', 'wheelchair_boarding'),
+    'trips': ('direction_id',),
+    'stop_times': ('stop_sequence', 'pickup_type', 'drop_off_type'),
+}
+
+# Tables the feed statistics are computed from
+_FEED_STATS_TABLES = (
+    'agency',
+    'routes',
+    'stops',
+    'trips',
+    'stop_times',
+    'shapes',
+    'calendar',
+    'calendar_dates',
+)
+
+# Arrow and pandas equivalents of the column types in gk.constants.DTYPES
+_ARROW_TYPES = {
+    'string': pa.string(),
+    'float': pa.float64(),
+    'Int32': pa.int32(),
+    'Int16': pa.int16(),
+}
+_PANDAS_TYPES = {
+    pa.string(): pd.StringDtype(),
+    pa.int32(): pd.Int32Dtype(),
+    pa.int16(): pd.Int16Dtype(),
+}
+
+
+def _read_gtfs_table(source: Any, table_name: str) -> pd.DataFrame:
+    """Read one GTFS CSV table with Arrow's multithreaded CSV reader.
+    
+    Known GTFS columns are read with the same types gtfs_kit assigns, so no
+    type inference is needed, except that repeated ID columns are
+    dictionary-encoded straight into categoricals.
+    
+    Args:
+        source: Path or binary file object holding the CSV data
+        table_name: GTFS table name, used to look up the column types
+    
+    Returns:
+        Table as a DataFrame
+    """
+    column_types = {
+        column: _ARROW_TYPES[dtype]
+        for column, dtype in gk.constants.DTYPES.get(table_name, {}).items()
+    }
+    for column in _CATEGORICAL_COLUMNS.get(table_name, ()):
+        column_types[column] = pa.dictionary(pa.int32(), pa.string())
+    table = pacsv.read_csv(
+        source,
+        read_options=pacsv.ReadOptions(block_size=64 << 20, use_threads=True),
+        convert_options=pacsv.ConvertOptions(column_types=column_types, strings_can_be_null=True),
+    )
+    return table.to_pandas(types_mapper=_PANDAS_TYPES.get, self_destruct=True)
+
+
+def _read_gtfs_arrow(path: Path, dist_units: str) -> gk.Feed:
+    """Read a GTFS feed from a ZIP file or directory with pyarrow.
+    
+    The archive is memory-mapped and its members are streamed straight
+    into the CSV reader, without extracting them to disk first.
+    
+    Args:
+        path: GTFS ZIP file or directory
+        dist_units: Distance units of the feed
+    
+    Returns:
+        Loaded feed
+    """
+    tables = {}
+    
+    if path.is_dir():
+        for table_name in _GTFS_TABLES:
+            table_path = path / f"{table_name}.txt"
+            if table_path.exists():
+                tables[table_name] = _read_gtfs_table(table_path, table_name)
+    else:
+        with pa.memory_map(str(path)) as archive, zipfile.ZipFile(archive) as zf:
+            # Some feeds nest their files in a folder inside the archive
+            members = {Path(name).name: name for name in zf.namelist()}
+            for table_name in _GTFS_TABLES:
+                member = members.get(f"{table_name}.txt")
+                if member is not None:
+                    with zf.open(member) as f:
+                        tables[table_name] = _read_gtfs_table(f, table_name)
+    
+    return gk.Feed(dist_units=dist_units, **tables)
+
+
+def _feed_cache_key(path: Path) -> str:
+    """Key a feed file for the Feather cache by its head, tail, size and mtime.
+    
+    Reading only the first MiB and the last 64 KiB keeps the check cheap
+    for large feeds. The tail holds the ZIP central directory with the CRC
+    of every member, so edits anywhere in the archive change the key.
+    """
+    stat = path.stat()
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        digest.update(f.read(1 << 20))
+        if stat.st_size > 1 << 20:
+            f.seek(max(1 << 20, stat.st_size - (1 << 16)))
+            digest.update(f.read())
+    digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()[:16]
+
+
+def _shapes_to_linestrings(shapes: pd.DataFrame) -> gpd.GeoDataFrame:
+    """Build one LineString per shape from the shape points.
+    
+    Points are ordered by shape and sequence once, then every LineString
+    is created by a single vectorized ``shapely.linestrings`` call.
+    
+    Args:
+        shapes: GTFS shapes dataframe
+    
+    Returns:
+        GeoDataFrame with shape_id and geometry columns
+    """
+    shapes = shapes.dropna(subset=['shape_id']).sort_values(['shape_id', 'shape_pt_sequence'], kind='stable')
+    shape_codes, shape_ids = pd.factorize(shapes['shape_id'])
+    coords = shapes[['shape_pt_lon', 'shape_pt_lat']].to_numpy(dtype='float64', na_value=np.nan)
+    
+    return gpd.GeoDataFrame(
+        {'shape_id': shape_ids},
+        geometry=shapely.linestrings(coords, indices=shape_codes),
+        crs="EPSG:4326",
+    )
+
+
+def _gtfs_time_to_seconds(times: pd.Series) -> pd.Series:
+    """Convert a column of GTFS HH:MM:SS times to seconds after midnight.
+    
+    Vectorized counterpart of :func:`parse_gtfs_time`; hours may exceed 23
+    for trips running past midnight.
+    
+    Args:
+        times: Series of GTFS time strings
+    
+    Returns:
+        Nullable Int32 series of seconds, <NA> where a time is missing or invalid
+    """
+    parts = times.astype('string').str.strip().str.split(':', n=2, expand=True)
+    if parts.shape[1] < 3:
+        return pd.Series(pd.NA, index=times.index, dtype='Int32')
+    
+    hours = pd.to_numeric(parts[0], errors='coerce')
+    minutes = pd.to_numeric(parts[1], errors='coerce')
+    seconds = pd.to_numeric(parts[2], errors='coerce')
+    
+    valid = (
+        parts[0].str.len().between(1, 2)
+        & (parts[1].str.len() == 2)
+        & (parts[2].str.len() == 2)
+        & (hours >= 0) & (minutes < 60) & (seconds < 60)
+    )
+    total = hours * 3600 + minutes * 60 + seconds
+    return total.where(valid.fillna(False)).astype('Int32')
+
 
 class GTFSProcessor:
     """Processor for GTFS data manipulation and analysis.
@@ -26,7 +227,7 @@ class GTFSProcessor:
     
     Args:
         feed_path: Path to GTFS feed (ZIP file or directory)
-        
+    
     Example:
         >>> processor = GTFSProcessor("costa_rica_gtfs.zip")
         >>> routes = processor.get_routes()
@@ -37,13 +238,31 @@ class GTFSProcessor:
         self.feed_path = Path(feed_path) if feed_path else None
         self.feed = None
         self._is_loaded = False
-        
-    def load_feed(self, feed_path: Optional[Union[str, Path]] = None) -> None:
+        self._derived_tables = {}
+        self._feather_cache = None
+    
+    def load_feed(
+        self,
+        feed_path: Optional[Union[str, Path]] = None,
+        engine: str = "pyarrow",
+        dist_units: str = "km",
+        cache_dir: Optional[Union[str, Path]] = None,
+    ) -> None:
         """Load GTFS feed from file or directory.
         
         Args:
             feed_path: Path to GTFS feed (overrides constructor path)
+            engine: CSV reader to use; 'pyarrow' parses the tables with
+                Arrow's multithreaded reader, 'gtfs_kit' delegates to gtfs_kit
+            dist_units: Distance units of the feed
+            cache_dir: Directory for Feather caches of feed files. A feed
+                found there is loaded from its cache instead of being parsed,
+                otherwise it is cached after parsing. Directories are never
+                cached.
         """
+        if engine not in ("pyarrow", "gtfs_kit"):
+            raise ValueError(f"Unsupported engine: {engine}")
+        
         path = Path(feed_path) if feed_path else self.feed_path
         if not path:
             raise GTFSProcessingError("No feed path provided")
@@ -51,21 +270,180 @@ class GTFSProcessor:
         if not path.exists():
             raise GTFSProcessingError(f"Feed path does not exist: {path}")
         
+        feed_cache = None
+        if cache_dir is not None and path.is_file():
+            feed_cache = Path(cache_dir) / _feed_cache_key(path)
+            if (feed_cache / "feed.json").exists():
+                try:
+                    self.load_from_feather(feed_cache)
+                    self.feed_path = path
+                    return
+                except GTFSProcessingError as e:
+                    logger.warning(f"Ignoring unreadable feed cache: {e}")
+        
         try:
             logger.info(f"Loading GTFS feed from {path}")
-            self.feed = gk.read_gtfs(str(path))
+            if engine == "pyarrow":
+                self.feed = _read_gtfs_arrow(path, dist_units)
+            else:
+                self.feed = gk.read_feed(path, dist_units=dist_units)
+                self._coerce_categoricals()
+            self._downcast_numerics()
             self.feed_path = path
             self._is_loaded = True
             logger.info("GTFS feed loaded successfully")
-            
+        
         except Exception as e:
             raise GTFSProcessingError(f"Failed to load GTFS feed: {e}")
+        
+        if feed_cache is not None:
+            try:
+                self.cache_to_feather(feed_cache)
+            except GTFSProcessingError as e:
+                logger.warning(f"Could not cache GTFS feed: {e}")
+    
+    def load_from_feather(self, cache_dir: Union[str, Path]) -> None:
+        """Load a GTFS feed from a Feather cache written by :meth:`cache_to_feather`.
+        
+        Tables are read through memory maps, which is much faster than
+        parsing the original CSV files again.
+        
+        Args:
+            cache_dir: Directory holding the cached tables
+        """
+        cache_dir = Path(cache_dir)
+        metadata_path = cache_dir / "feed.json"
+        if not metadata_path.exists():
+            raise GTFSProcessingError(f"No Feather cache found in {cache_dir}")
+        
+        try:
+            logger.info(f"Loading cached GTFS feed from {cache_dir}")
+            metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+            tables = {
+                path.stem: feather.read_feather(path, memory_map=True)
+                for path in sorted(cache_dir.glob("*.feather"))
+            }
+            self.feed = gk.Feed(dist_units=metadata["dist_units"], **tables)
+            self._is_loaded = True
+            self._feather_cache = (cache_dir, self.to_dict())
+            logger.info("Cached GTFS feed loaded successfully")
+        
+        except Exception as e:
+            raise GTFSProcessingError(f"Failed to load cached GTFS feed: {e}")
+    
+    def cache_to_feather(self, cache_dir: Union[str, Path]) -> Path:
+        """Cache the feed tables as LZ4-compressed Feather (Arrow IPC) files.
+        
+        Args:
+            cache_dir: Directory to write one ``<table>.feather`` file per table
+        
+        Returns:
+            Path to the cache directory
+        """
+        self._ensure_loaded()
+        
+        cache_dir = Path(cache_dir)
+        
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            (cache_dir / "feed.json").unlink(missing_ok=True)
+            for stale_path in cache_dir.glob("*.feather"):
+                stale_path.unlink()
+            
+            for table_name, df in self.to_dict().items():
+                feather.write_feather(
+                    pa.Table.from_pandas(df, preserve_index=False),
+                    cache_dir / f"{table_name}.feather",
+                    compression="lz4",
+                    chunksize=1 << 16,
+                )
+            
+            # Written last, so an interrupted cache is never picked up
+            metadata = {"dist_units": self.feed.dist_units}
+            (cache_dir / "feed.json").write_text(json.dumps(metadata), encoding="utf-8")
+            
+            self._feather_cache = (cache_dir, self.to_dict())
+            logger.info(f"GTFS feed cached to {cache_dir}")
+            return cache_dir
+        
+        except Exception as e:
+            raise GTFSProcessingError(f"Failed to cache GTFS feed: {e}")
+    
+    def get_feather_cache_dir(self) -> Optional[Path]:
+        """Get the Feather cache directory holding the current feed, if any.
+        
+        Returns:
+            Cache directory, or None when the feed was not cached or any of
+            its tables has since been replaced
+        """
+        if self._feather_cache is None or not self._is_loaded or self.feed is None:
+            return None
+        
+        cache_dir, cached_tables = self._feather_cache
+        tables = self.to_dict()
+        if tables.keys() != cached_tables.keys() or any(
+            table is not cached_tables[name] for name, table in tables.items()
+        ):
+            return None
+        return cache_dir
+    
+    def _coerce_categoricals(self) -> None:
+        """Convert the repeated ID columns of the feed tables to categoricals.
+        
+        Millions of repeated ID strings in stop_times shrink to integer codes,
+        which also speeds up comparisons, joins and groupbys on them.
+        """
+        for table_name, columns in _CATEGORICAL_COLUMNS.items():
+            table = getattr(self.feed, table_name, None)
+            if table is None:
+                continue
+            for column in columns:
+                if column in table.columns:
+                    table[column] = table[column].astype('category')
+    
+    def _downcast_numerics(self) -> None:
+        """Store small integer columns of the feed tables in narrower types.
+        
+        stop_sequence typically fits in two bytes and the enumerations in
+        one, shrinking every later pass over these columns. Signed types
+        keep arithmetic on the values from wrapping around; non-integer
+        columns are left unchanged.
+        """
+        for table_name, columns in _DOWNCAST_COLUMNS.items():
+            table = getattr(self.feed, table_name, None)
+            if table is None:
+                continue
+            for column in columns:
+                if column in table.columns and pd.api.types.is_integer_dtype(table[column]):
+                    table[column] = pd.to_numeric(table[column], downcast='integer')
     
     def _ensure_loaded(self) -> None:
         """Ensure feed is loaded."""
         if not self._is_loaded or self.feed is None:
             raise GTFSProcessingError("No GTFS feed loaded. Call load_feed() first.")
     
+    def _get_derived(self, name: str, source: Any, build: Callable[[], Any]) -> Any:
+        """Get a value derived from a feed table, building it on first use.
+        
+        The value is reused until the source table is replaced, so costly
+        conversions run once per feed rather than once per call.
+        
+        Args:
+            name: Cache key for the derived value
+            source: Feed table the value is derived from, or a tuple of
+                tables when it depends on several
+            build: Function computing the value
+        
+        Returns:
+            Cached or newly built value
+        """
+        sources = source if isinstance(source, tuple) else (source,)
+        cached = self._derived_tables.get(name)
+        if cached is None or any(old is not new for old, new in zip(cached[0], sources)):
+            cached = (sources, build())
+            self._derived_tables[name] = cached
+        return cached[1]
+    
     def get_agencies(self) -> pd.DataFrame:
         """Get agencies dataframe."""
         self._ensure_loaded()
@@ -76,7 +454,7 @@ class GTFSProcessor:
         
         Args:
             agency_id: Filter routes by agency ID
-            
+        
         Returns:
             Routes dataframe
         """
@@ -84,7 +462,7 @@ class GTFSProcessor:
         routes = self.feed.routes
         
         if agency_id:
-            routes = routes[routes['agency_id'] == agency_id]
+            routes = routes.iloc[self._group_rows('routes', 'agency_id', [agency_id])]
         
         return routes
     
@@ -93,18 +471,24 @@ class GTFSProcessor:
         
         Args:
             as_geodataframe: Return as GeoDataFrame with Point geometries
-            
+        
         Returns:
-            Stops dataframe or GeoDataFrame
+            Stops dataframe or GeoDataFrame; the GeoDataFrame is built once
+            per stops table and shared between calls
         """
         self._ensure_loaded()
         stops = self.feed.stops
         
         if as_geodataframe and 'stop_lat' in stops.columns and 'stop_lon' in stops.columns:
-            # Create Point geometries from lat/lon
-            geometry = [Point(lon, lat) for lon, lat in zip(stops['stop_lon'], stops['stop_lat'])]
-            stops_gdf = gpd.GeoDataFrame(stops, geometry=geometry, crs="EPSG:4326")
-            return stops_gdf
+            def build_stops_gdf() -> gpd.GeoDataFrame:
+                # Create Point geometries from lat/lon in one vectorized call
+                geometry = gpd.points_from_xy(
+                    pd.to_numeric(stops['stop_lon'], errors='coerce').to_numpy(dtype='float64', na_value=float('nan')),
+                    pd.to_numeric(stops['stop_lat'], errors='coerce').to_numpy(dtype='float64', na_value=float('nan')),
+                )
+                return gpd.GeoDataFrame(stops, geometry=geometry, crs="EPSG:4326")
+            
+            return self._get_derived('stops_gdf', stops, build_stops_gdf)
         
         return stops
     
@@ -113,7 +497,7 @@ class GTFSProcessor:
         
         Args:
             route_id: Filter trips by route ID
-            
+        
         Returns:
             Trips dataframe
         """
@@ -121,7 +505,7 @@ class GTFSProcessor:
         trips = self.feed.trips
         
         if route_id:
-            trips = trips[trips['route_id'] == route_id]
+            trips = trips.iloc[self._group_rows('trips', 'route_id', [route_id])]
         
         return trips
     
@@ -130,7 +514,7 @@ class GTFSProcessor:
         
         Args:
             trip_id: Filter stop times by trip ID
-            
+        
         Returns:
             Stop times dataframe
         """
@@ -138,18 +522,63 @@ class GTFSProcessor:
         stop_times = self.feed.stop_times
         
         if trip_id:
-            stop_times = stop_times[stop_times['trip_id'] == trip_id]
+            stop_times = stop_times.iloc[self._group_rows('stop_times', 'trip_id', [trip_id])]
         
         return stop_times
     
+    def _group_rows(self, table_name: str, column: str, keys: List[str]) -> np.ndarray:
+        """Get the positions of the rows of a feed table matching some keys.
+        
+        The group index of ``column`` is built once per table, so each
+        lookup costs O(rows returned) instead of a full table scan.
+        
+        Args:
+            table_name: Feed table to look up, e.g. ``'stop_times'``
+            column: Column the table is grouped by, e.g. ``'trip_id'``
+            keys: Values of ``column`` to look up
+        
+        Returns:
+            Sorted integer row positions into the table
+        """
+        table = getattr(self.feed, table_name)
+        rows_by_key = self._get_derived(
+            f'{table_name}_by_{column}',
+            table,
+            lambda: table.groupby(column, sort=False, observed=True).indices,
+        )
+        
+        blocks = [rows_by_key[key] for key in keys if key in rows_by_key]
+        if not blocks:
+            return np.array([], dtype=np.intp)
+        return np.sort(np.concatenate(blocks))
+    
+    def get_stop_time_seconds(self) -> pd.DataFrame:
+        """Get stop times arrival and departure times as seconds after midnight.
+        
+        Times are parsed once and reused until the feed's stop times table
+        is replaced, so repeated analyses do not reparse the time strings.
+        
+        Returns:
+            Dataframe with nullable Int32 arrival_seconds and departure_seconds
+            columns, indexed like the stop times dataframe
+        """
+        self._ensure_loaded()
+        stop_times = self.feed.stop_times
+        
+        return self._get_derived('stop_time_seconds', stop_times, lambda: pd.DataFrame({
+            'arrival_seconds': _gtfs_time_to_seconds(stop_times['arrival_time']),
+            'departure_seconds': _gtfs_time_to_seconds(stop_times['departure_time']),
+        }))
+    
     def get_shapes(self, as_geodataframe: bool = False) -> Union[pd.DataFrame, gpd.GeoDataFrame]:
         """Get shapes dataframe, optionally as GeoDataFrame.
         
         Args:
             as_geodataframe: Return as GeoDataFrame with LineString geometries
-            
+        
         Returns:
-            Shapes dataframe or GeoDataFrame
+            Shapes dataframe or GeoDataFrame; the GeoDataFrame is built once
+            per shapes table and shared between calls
         """
         self._ensure_loaded()
         
@@ -160,19 +589,25 @@ class GTFSProcessor:
         
         if as_geodataframe:
             # Convert shapes to LineString geometries
-            shapes_gdf = gk.shapes_to_linestrings(self.feed)
-            return shapes_gdf
+            return self._get_derived('shapes_gdf', shapes, lambda: _shapes_to_linestrings(shapes))
         
         return shapes
     
     def get_feed_stats(self) -> Dict[str, Any]:
         """Get comprehensive statistics about the GTFS feed.
         
+        Statistics are computed once and reused until one of the feed tables
+        is replaced; every call returns its own copy.
+        
         Returns:
             Dictionary with feed statistics
         """
         self._ensure_loaded()
-        
+        tables = tuple(getattr(self.feed, name, None) for name in _FEED_STATS_TABLES)
+        return copy.deepcopy(self._get_derived('feed_stats', tables, self._compute_feed_stats))
+    
+    def _compute_feed_stats(self) -> Dict[str, Any]:
+        """Compute the statistics returned by :meth:`get_feed_stats`."""
         stats = {
             'agencies': len(self.feed.agency) if self.feed.agency is not None else 0,
             'routes': len(self.feed.routes) if self.feed.routes is not None else 0,
@@ -186,8 +621,15 @@ class GTFSProcessor:
         
         # Add route type breakdown
         if self.feed.routes is not None:
-            route_types = self.feed.routes['route_type'].value_counts().to_dict()
-            stats['routes_by_type'] = route_types
+            # Route types are small integers, so counting them is one bincount;
+            # the offset only matters for invalid negative types
+            route_types = self.feed.routes['route_type'].dropna().to_numpy(dtype=np.int64)
+            offset = min(int(route_types.min()), 0) if len(route_types) else 0
+            counts = np.bincount(route_types - offset, minlength=13)
+            stats['routes_by_type'] = {
+                int(route_type) + offset: int(count)
+                for route_type, count in enumerate(counts) if count
+            }
         
         # Add date range
         if self.feed.calendar is not None and not self.feed.calendar.empty:
@@ -205,24 +647,32 @@ class GTFSProcessor:
         
         Args:
             route_id: Route ID to analyze
-            
+        
         Returns:
-            Dictionary with route statistics
+            Dictionary with route statistics; computed once per route and
+            reused until the routes, trips or stop times are replaced
         """
         self._ensure_loaded()
         
+        tables = (self.feed.routes, self.feed.trips, self.feed.stop_times)
+        route_stats = self._get_derived('route_stats', tables, dict)
+        if route_id not in route_stats:
+            route_stats[route_id] = self._compute_route_stats(route_id)
+        return dict(route_stats[route_id])
+    
+    def _compute_route_stats(self, route_id: str) -> Dict[str, Any]:
+        """Compute the statistics returned by :meth:`get_route_stats`."""
         # Get route info
-        route = self.feed.routes[self.feed.routes['route_id'] == route_id]
+        route = self.feed.routes.iloc[self._group_rows('routes', 'route_id', [route_id])]
         if route.empty:
             raise GTFSProcessingError(f"Route {route_id} not found")
         
         # Get trips for this route
         trips = self.get_trips(route_id)
         
-        # Get stops for this route
-        trip_ids = trips['trip_id'].tolist()
-        stop_times = self.feed.stop_times[self.feed.stop_times['trip_id'].isin(trip_ids)]
-        unique_stops = stop_times['stop_id'].nunique()
+        # Get stops for this route; only the stop_id column is sliced
+        stop_time_rows = self._group_rows('stop_times', 'trip_id', trips['trip_id'].unique())
+        unique_stops = self.feed.stop_times['stop_id'].iloc[stop_time_rows].nunique()
         
         # Get directions
         directions = trips['direction_id'].nunique() if 'direction_id' in trips.columns else 1
@@ -235,7 +685,7 @@ class GTFSProcessor:
             'total_trips': len(trips),
             'unique_stops': unique_stops,
             'directions': directions,
-            'total_stop_times': len(stop_times),
+            'total_stop_times': len(stop_time_rows),
         }
         
         return stats
@@ -249,70 +699,185 @@ class GTFSProcessor:
     ) -> 'GTFSProcessor':
         """Filter GTFS feed by geographic bounding box.
         
+        Trips are kept when they visit at least one stop inside the box,
+        and every other table is restricted to the records they use.
+        
         Args:
             min_lat: Minimum latitude
             min_lon: Minimum longitude
             max_lat: Maximum latitude
             max_lon: Maximum longitude
-            
+        
         Returns:
             New GTFSProcessor instance with filtered feed
         """
         self._ensure_loaded()
         
         try:
-            # Filter feed by bounding box using gtfs-kit
-            filtered_feed = gk.filter_by_bounding_box(
-                self.feed,
-                min_lon, min_lat, max_lon, max_lat
-            )
-            
-            # Create new processor with filtered feed
-            new_processor = GTFSProcessor()
-            new_processor.feed = filtered_feed
-            new_processor._is_loaded = True
-            
-            return new_processor
-            
+            return self._restrict_to_trips(self._trips_in_bbox(min_lon, min_lat, max_lon, max_lat))
+        
         except Exception as e:
             raise GTFSProcessingError(f"Failed to filter by bounding box: {e}")
     
     def filter_by_dates(self, start_date: str, end_date: str) -> 'GTFSProcessor':
         """Filter GTFS feed by date range.
         
+        Trips are kept when their service is active within the range, and
+        every other table is restricted to the records they use.
+        
         Args:
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
-            
+        
+        Returns:
+            New GTFSProcessor instance with filtered feed
+        """
+        return self.filter(dates=(start_date, end_date))
+    
+    def filter(
+        self,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        dates: Optional[Tuple[str, str]] = None,
+    ) -> 'GTFSProcessor':
+        """Filter GTFS feed by bounding box and date range in a single pass.
+        
+        Both predicates are combined into one trip mask: a trip is kept when
+        it visits at least one stop inside the bounding box and its service
+        is active within the date range. Every other table is then restricted
+        once to the records referenced by the kept trips.
+        
+        Args:
+            bbox: Bounding box as (min_lon, min_lat, max_lon, max_lat)
+            dates: Date range as (start_date, end_date) in YYYY-MM-DD format
+        
         Returns:
             New GTFSProcessor instance with filtered feed
         """
         self._ensure_loaded()
         
         try:
-            # Filter feed by dates using gtfs-kit
-            filtered_feed = gk.filter_by_dates(
-                self.feed,
-                start_date.replace('-', ''),
-                end_date.replace('-', '')
-            )
+            trips = self.feed.trips
+            trip_mask = pd.Series(True, index=trips.index)
             
-            # Create new processor with filtered feed
-            new_processor = GTFSProcessor()
-            new_processor.feed = filtered_feed
-            new_processor._is_loaded = True
+            if bbox is not None:
+                trip_mask &= trips['trip_id'].isin(self._trips_in_bbox(*bbox)['trip_id'])
             
-            return new_processor
+            if dates is not None:
+                start_date, end_date = dates
+                trip_mask &= trips['service_id'].isin(
+                    self._get_active_service_ids(start_date.replace('-', ''), end_date.replace('-', ''))
+                )
             
+            return self._restrict_to_trips(trips[trip_mask])
+        
         except Exception as e:
-            raise GTFSProcessingError(f"Failed to filter by dates: {e}")
+            raise GTFSProcessingError(f"Failed to filter feed: {e}")
+    
+    def _trips_in_bbox(
+        self,
+        min_lon: float,
+        min_lat: float,
+        max_lon: float,
+        max_lat: float
+    ) -> pd.DataFrame:
+        """Get the trips visiting at least one stop inside a bounding box."""
+        stops = self.feed.stops
+        
+        def build_stop_coords() -> Tuple[np.ndarray, np.ndarray]:
+            return (
+                pd.to_numeric(stops['stop_lon'], errors='coerce').to_numpy(dtype='float64', na_value=float('nan')),
+                pd.to_numeric(stops['stop_lat'], errors='coerce').to_numpy(dtype='float64', na_value=float('nan')),
+            )
+        
+        # A rectangle test is a single vectorized pass over the coordinate
+        # arrays; missing coordinates compare False and drop out
+        lon, lat = self._get_derived('stop_coords', stops, build_stop_coords)
+        in_bbox = (lon >= min_lon) & (lon <= max_lon) & (lat >= min_lat) & (lat <= max_lat)
+        
+        rows = self._group_rows('stop_times', 'stop_id', stops['stop_id'].to_numpy()[in_bbox])
+        visiting_trips = self.feed.stop_times['trip_id'].iloc[rows].unique()
+        
+        trips = self.feed.trips
+        return trips[trips['trip_id'].isin(visiting_trips)]
+    
+    def _get_active_service_ids(self, start_date: str, end_date: str) -> set:
+        """Get service IDs with service between two YYYYMMDD dates."""
+        service_ids = set()
+        
+        calendar = self.feed.calendar
+        if calendar is not None and not calendar.empty:
+            active = (
+                (calendar['start_date'].astype(str) <= end_date)
+                & (calendar['end_date'].astype(str) >= start_date)
+            )
+            service_ids.update(calendar.loc[active, 'service_id'])
+        
+        calendar_dates = self.feed.calendar_dates
+        if calendar_dates is not None and not calendar_dates.empty:
+            added = (
+                calendar_dates['date'].astype(str).between(start_date, end_date)
+                & (calendar_dates['exception_type'] == 1)
+            )
+            service_ids.update(calendar_dates.loc[added, 'service_id'])
+        
+        return service_ids
+    
+    def _restrict_to_trips(self, trips: pd.DataFrame) -> 'GTFSProcessor':
+        """Create a processor whose feed only contains data used by the given trips."""
+        feed = copy.copy(self.feed)
+        
+        stop_times = self.feed.stop_times.iloc[self._group_rows('stop_times', 'trip_id', trips['trip_id'])]
+        
+        stops = self.feed.stops
+        stop_mask = stops['stop_id'].isin(stop_times['stop_id'])
+        if 'parent_station' in stops.columns:
+            stop_mask |= stops['stop_id'].isin(stops.loc[stop_mask, 'parent_station'])
+        stops = stops[stop_mask]
+        
+        routes = self.feed.routes
+        routes = routes[routes['route_id'].isin(trips['route_id'])]
+        
+        feed.trips = trips
+        feed.stop_times = stop_times
+        feed.stops = stops
+        feed.routes = routes
+        
+        agency = self.feed.agency
+        if agency is not None and 'agency_id' in agency.columns and 'agency_id' in routes.columns:
+            feed.agency = agency[agency['agency_id'].isin(routes['agency_id'])]
+        
+        for table_name in ('calendar', 'calendar_dates'):
+            table = getattr(self.feed, table_name, None)
+            if table is not None:
+                setattr(feed, table_name, table[table['service_id'].isin(trips['service_id'])])
+        
+        shapes = getattr(self.feed, 'shapes', None)
+        if shapes is not None and 'shape_id' in trips.columns:
+            feed.shapes = shapes[shapes['shape_id'].isin(trips['shape_id'])]
+        
+        frequencies = getattr(self.feed, 'frequencies', None)
+        if frequencies is not None:
+            feed.frequencies = frequencies[frequencies['trip_id'].isin(trips['trip_id'])]
+        
+        transfers = getattr(self.feed, 'transfers', None)
+        if transfers is not None:
+            feed.transfers = transfers[
+                transfers['from_stop_id'].isin(stops['stop_id'])
+                & transfers['to_stop_id'].isin(stops['stop_id'])
+            ]
+        
+        new_processor = GTFSProcessor()
+        new_processor.feed = feed
+        new_processor._is_loaded = True
+        
+        return new_processor
     
     def export_to_zip(self, output_path: Union[str, Path]) -> Path:
         """Export processed GTFS feed to ZIP file.
         
         Args:
             output_path: Path for output ZIP file
-            
+        
         Returns:
             Path to created ZIP file
         """
@@ -325,7 +890,7 @@ class GTFSProcessor:
             gk.write_gtfs(self.feed, str(output_path))
             logger.info(f"GTFS feed exported to {output_path}")
             return output_path
-            
+        
         except Exception as e:
             raise GTFSProcessingError(f"Failed to export GTFS feed: {e}")
     
@@ -338,10 +903,9 @@ class GTFSProcessor:
         self._ensure_loaded()
         
         tables = {}
-        for attr_name in dir(self.feed):
-            if not attr_name.startswith('_'):
-                attr_value = getattr(self.feed, attr_name)
-                if isinstance(attr_value, pd.DataFrame) and not attr_value.empty:
-                    tables[attr_name] = attr_value
+        for name in _GTFS_TABLES:
+            table = getattr(self.feed, name, None)
+            if isinstance(table, pd.DataFrame) and not table.empty:
+                tables[name] = table
         
         return tables
@@ -1,18 +1,47 @@
 """GTFS validator for validating transit feed compliance and quality."""
 
 import logging
-from typing import Dict, List, Optional, Any
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 
 import gtfs_kit as gk
+import numpy as np
 import pandas as pd
 
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - optional dependency
+    pl = None
+
+from .processor import _gtfs_time_to_seconds
 from ..utils.exceptions import GTFSValidationError
 from ..validation import ValidationReport, ValidationRule
+from ..validation.rules import _blank_names, _missing_references
 
 
 logger = logging.getLogger(__name__)
 
+# Fields every non-empty table must have
+_REQUIRED_FIELDS = {
+    'agency': ('agency_name', 'agency_url', 'agency_timezone'),
+    'routes': ('route_id', 'route_type'),
+    'stops': ('stop_id', 'stop_name', 'stop_lat', 'stop_lon'),
+    'trips': ('route_id', 'service_id', 'trip_id'),
+    'stop_times': ('trip_id', 'stop_id', 'stop_sequence'),
+}
+
+# Fields whose values must be numeric
+_NUMERIC_FIELDS = {
+    'stops': ('stop_lat', 'stop_lon'),
+    'routes': ('route_type',),
+}
+
+# Rules spend most of their time in pandas and NumPy calls that release the GIL
+_MAX_RULE_WORKERS = min(8, os.cpu_count() or 1)
+
 
 class GTFSValidator:
     """Validator for GTFS feeds using gtfs-kit and custom validation rules.
@@ -25,7 +54,10 @@ class GTFSValidator:
     
     Args:
         processor: GTFSProcessor instance with loaded feed
-        
+        backend: Engine for the stop_times-heavy checks; 'pandas', or
+            'polars' to run the foreign key and stop sequence checks on a
+            Polars copy of stop_times (requires the ``polars`` extra)
+    
     Example:
         >>> from databus.gtfs import GTFSProcessor
         >>> processor = GTFSProcessor("feed.zip")
@@ -35,63 +67,84 @@ class GTFSValidator:
         >>> print(f"Validation score: {report.score}")
     """
     
-    def __init__(self, processor=None):
+    def __init__(self, processor=None, backend: str = "pandas"):
         from .processor import GTFSProcessor
+        if backend not in ("pandas", "polars"):
+            raise ValueError(f"Unsupported backend: {backend}")
+        if backend == "polars" and pl is None:
+            raise ImportError(
+                "The polars backend requires polars. "
+                "Install it with: pip install 'databus[polars]'"
+            )
+        
         self.processor = processor
+        self.backend = backend
         self._validation_rules = []
+        self._schema = None
+        self._polars_stop_times = None
+        self._cache_lock = threading.Lock()
         self._setup_default_rules()
     
     def _setup_default_rules(self) -> None:
         """Set up default validation rules."""
-        # Add standard GTFS validation rules
+        # Add standard GTFS validation rules; they only read the feed, so
+        # they are marked safe to run concurrently
         self._validation_rules = [
             ValidationRule(
                 "required_files",
                 "Check for required GTFS files",
                 self._validate_required_files,
-                severity="error"
+                severity="error",
+                thread_safe=True
             ),
             ValidationRule(
                 "required_fields",
                 "Check for required fields in each file",
                 self._validate_required_fields,
-                severity="error"
+                severity="error",
+                thread_safe=True
             ),
             ValidationRule(
                 "data_types",
                 "Check data type compliance",
                 self._validate_data_types,
-                severity="error"
+                severity="error",
+                thread_safe=True
             ),
             ValidationRule(
                 "foreign_keys",
                 "Check foreign key relationships",
                 self._validate_foreign_keys,
-                severity="error"
+                severity="error",
+                thread_safe=True
             ),
             ValidationRule(
                 "coordinate_validity",
                 "Check coordinate validity",
                 self._validate_coordinates,
-                severity="error"
+                severity="error",
+                thread_safe=True
             ),
             ValidationRule(
                 "service_dates",
                 "Check service date ranges",
                 self._validate_service_dates,
-                severity="warning"
+                severity="warning",
+                thread_safe=True
             ),
             ValidationRule(
                 "stop_times_sequence",
                 "Check stop time sequences",
                 self._validate_stop_times_sequence,
-                severity="warning"
+                severity="warning",
+                thread_safe=True
             ),
             ValidationRule(
                 "route_names",
                 "Check route naming consistency",
                 self._validate_route_names,
-                severity="info"
+                severity="info",
+                thread_safe=True
             ),
         ]
     
@@ -108,13 +161,13 @@ class GTFSValidator:
         
         Args:
             processor: GTFSProcessor instance (overrides constructor processor)
-            
+        
         Returns:
             ValidationReport with results
         """
         if processor:
             self.processor = processor
-            
+        
         if not self.processor or not self.processor._is_loaded:
             raise GTFSValidationError("No loaded GTFS processor provided")
         
@@ -124,35 +177,54 @@ class GTFSValidator:
         warnings = []
         notices = []
         
-        # Run each validation rule
-        for rule in self._validation_rules:
-            try:
-                logger.debug(f"Running validation rule: {rule.name}")
-                issues = rule.validate_func(self.processor.feed)
+        feed = self.processor.feed
+        
+        # Rules that are not thread-safe run one at a time in this thread
+        # before any pooled rule starts, so they never overlap with others
+        rules = list(self._validation_rules)
+        outcomes = {
+            index: self._run_rule_now(rule, feed)
+            for index, rule in enumerate(rules)
+            if not rule.thread_safe
+        }
+        
+        with ThreadPoolExecutor(max_workers=_MAX_RULE_WORKERS) as executor:
+            # Thread-safe rules run concurrently; results are collected in
+            # rule order
+            for index, rule in enumerate(rules):
+                if rule.thread_safe:
+                    outcomes[index] = executor.submit(self._run_rule, rule, feed)
+            
+            for index, rule in enumerate(rules):
+                try:
+                    issues = outcomes[index].result()
+                except Exception as e:
+                    logger.error(f"Error running validation rule {rule.name}: {e}")
+                    errors.append({
+                        'rule': rule.name,
+                        'message': f"Validation rule failed: {e}",
+                        'details': {},
+                        'severity': 'error'
+                    })
+                    continue
                 
-                for issue in issues:
-                    issue_dict = {
+                # Pick the target list once per rule rather than per issue
+                if rule.severity == "error":
+                    target = errors
+                elif rule.severity == "warning":
+                    target = warnings
+                else:
+                    target = notices
+                
+                target.extend(
+                    {
                         'rule': rule.name,
                         'message': issue.get('message', rule.description),
                         'details': issue.get('details', {}),
                         'severity': rule.severity
                     }
-                    
-                    if rule.severity == "error":
-                        errors.append(issue_dict)
-                    elif rule.severity == "warning":
-                        warnings.append(issue_dict)
-                    else:
-                        notices.append(issue_dict)
-                        
-            except Exception as e:
-                logger.error(f"Error running validation rule {rule.name}: {e}")
-                errors.append({
-                    'rule': rule.name,
-                    'message': f"Validation rule failed: {e}",
-                    'details': {},
-                    'severity': 'error'
-                })
+                    for issue in issues
+                )
         
         # Calculate validation score
         total_issues = len(errors) + len(warnings) + len(notices)
@@ -188,6 +260,86 @@ class GTFSValidator:
         logger.info(f"Validation completed. Status: {status}, Score: {score:.1f}")
         return report
     
+    def _run_rule(self, rule: ValidationRule, feed) -> List[Dict[str, Any]]:
+        """Run a single validation rule against the feed."""
+        logger.debug(f"Running validation rule: {rule.name}")
+        return rule.validate_func(feed)
+    
+    def _run_rule_now(self, rule: ValidationRule, feed) -> Future:
+        """Run a validation rule in this thread, capturing its outcome in a future."""
+        future = Future()
+        try:
+            future.set_result(self._run_rule(rule, feed))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    
+    def _schema_scan(self, feed) -> Dict[str, Dict[str, Any]]:
+        """Scan the columns of the feed tables once for the schema rules.
+        
+        The required fields, data types and coordinate rules all read from
+        this scan, so each checked column is converted to numbers only once
+        per feed, across rules and repeated validate() calls.
+        
+        Returns:
+            Mapping of table name to a dictionary with the table's
+            'missing_fields', its 'nonnumeric' fields, and 'numeric' float
+            arrays of the numeric fields (NaN where missing or not numeric)
+        """
+        with self._cache_lock:
+            if self._schema is None or self._schema[0] is not feed:
+                scan = {}
+                for table_name in dict.fromkeys([*_REQUIRED_FIELDS, *_NUMERIC_FIELDS]):
+                    table = getattr(feed, table_name, None)
+                    if table is None:
+                        continue
+                    
+                    entry = {
+                        'missing_fields': [
+                            field for field in _REQUIRED_FIELDS.get(table_name, ())
+                            if field not in table.columns
+                        ] if not table.empty else [],
+                        'nonnumeric': [],
+                        'numeric': {},
+                    }
+                    for field in _NUMERIC_FIELDS.get(table_name, ()):
+                        if field not in table.columns:
+                            continue
+                        values = pd.to_numeric(table[field], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+                        entry['numeric'][field] = values
+                        # Values that are present but did not parse as numbers
+                        if (np.isnan(values) & table[field].notna().to_numpy()).any():
+                            entry['nonnumeric'].append(field)
+                    scan[table_name] = entry
+                
+                self._schema = (feed, scan)
+            return self._schema[1]
+    
+    def _get_polars_stop_times(self, stop_times: pd.DataFrame) -> "pl.DataFrame":
+        """Get the columns of stop_times checked by the rules as a Polars frame.
+        
+        The frame is converted once per stop_times table. ID columns are
+        cast to strings so they join against the other tables' IDs, and
+        arrival times are parsed by the same function as the pandas backend
+        into an arrival_seconds column.
+        """
+        with self._cache_lock:
+            if self._polars_stop_times is None or self._polars_stop_times[0] is not stop_times:
+                columns = [
+                    column for column in ('trip_id', 'stop_id', 'stop_sequence')
+                    if column in stop_times.columns
+                ]
+                selected = stop_times[columns]
+                if 'arrival_time' in stop_times.columns:
+                    selected = selected.assign(
+                        arrival_seconds=_gtfs_time_to_seconds(stop_times['arrival_time'])
+                    )
+                frame = pl.from_pandas(selected, rechunk=True).with_columns(
+                    pl.col(column).cast(pl.Utf8) for column in ('trip_id', 'stop_id') if column in columns
+                )
+                self._polars_stop_times = (stop_times, frame)
+            return self._polars_stop_times[1]
+    
     def _validate_required_files(self, feed) -> List[Dict[str, Any]]:
         """Validate that required GTFS files are present."""
         issues = []
@@ -207,54 +359,35 @@ class GTFSValidator:
         """Validate that required fields are present in each file."""
         issues = []
         
-        required_fields = {
-            'agency': ['agency_name', 'agency_url', 'agency_timezone'],
-            'routes': ['route_id', 'route_type'],
-            'stops': ['stop_id', 'stop_name', 'stop_lat', 'stop_lon'],
-            'trips': ['route_id', 'service_id', 'trip_id'],
-            'stop_times': ['trip_id', 'stop_id', 'stop_sequence']
-        }
-        
-        for table_name, fields in required_fields.items():
-            table = getattr(feed, table_name, None)
-            if table is not None and not table.empty:
-                for field in fields:
-                    if field not in table.columns:
-                        issues.append({
-                            'message': f"Required field '{field}' missing in {table_name}.txt",
-                            'details': {'file': table_name, 'field': field}
-                        })
+        for table_name, entry in self._schema_scan(feed).items():
+            for field in entry['missing_fields']:
+                issues.append({
+                    'message': f"Required field '{field}' missing in {table_name}.txt",
+                    'details': {'file': table_name, 'field': field}
+                })
         
         return issues
     
     def _validate_data_types(self, feed) -> List[Dict[str, Any]]:
         """Validate data types for key fields."""
         issues = []
+        scan = self._schema_scan(feed)
         
         # Check stop coordinates
-        if hasattr(feed, 'stops') and feed.stops is not None:
-            stops = feed.stops
-            if 'stop_lat' in stops.columns and 'stop_lon' in stops.columns:
-                try:
-                    pd.to_numeric(stops['stop_lat'], errors='raise')
-                    pd.to_numeric(stops['stop_lon'], errors='raise')
-                except (ValueError, TypeError):
-                    issues.append({
-                        'message': "Stop coordinates must be numeric",
-                        'details': {'file': 'stops', 'fields': ['stop_lat', 'stop_lon']}
-                    })
+        stops = scan.get('stops')
+        if stops is not None and len(stops['numeric']) == 2 and stops['nonnumeric']:
+            issues.append({
+                'message': "Stop coordinates must be numeric",
+                'details': {'file': 'stops', 'fields': ['stop_lat', 'stop_lon']}
+            })
         
         # Check route type
-        if hasattr(feed, 'routes') and feed.routes is not None:
-            routes = feed.routes
-            if 'route_type' in routes.columns:
-                try:
-                    pd.to_numeric(routes['route_type'], errors='raise')
-                except (ValueError, TypeError):
-                    issues.append({
-                        'message': "Route type must be numeric",
-                        'details': {'file': 'routes', 'field': 'route_type'}
-                    })
+        routes = scan.get('routes')
+        if routes is not None and routes['nonnumeric']:
+            issues.append({
+                'message': "Route type must be numeric",
+                'details': {'file': 'routes', 'field': 'route_type'}
+            })
         
         return issues
     
@@ -262,32 +395,40 @@ class GTFSValidator:
         """Validate foreign key relationships."""
         issues = []
         
+        # Look each table up once
+        routes = getattr(feed, 'routes', None)
+        trips = getattr(feed, 'trips', None)
+        stops = getattr(feed, 'stops', None)
+        stop_times = getattr(feed, 'stop_times', None)
+        
         # Check route_id in trips references routes
-        if (hasattr(feed, 'routes') and hasattr(feed, 'trips') and 
-            feed.routes is not None and feed.trips is not None):
-            
-            route_ids = set(feed.routes['route_id'].unique())
-            trip_route_ids = set(feed.trips['route_id'].unique())
-            missing_routes = trip_route_ids - route_ids
+        if routes is not None and trips is not None:
+            missing_routes = _missing_references(trips['route_id'], routes['route_id'])
             
-            if missing_routes:
+            if len(missing_routes):
                 issues.append({
-                    'message': f"Trips reference non-existent routes: {list(missing_routes)[:5]}",
-                    'details': {'missing_route_ids': list(missing_routes)[:10]}
+                    'message': f"Trips reference non-existent routes: {missing_routes[:5].tolist()}",
+                    'details': {'missing_route_ids': missing_routes[:10].tolist()}
                 })
         
         # Check stop_id in stop_times references stops
-        if (hasattr(feed, 'stops') and hasattr(feed, 'stop_times') and 
-            feed.stops is not None and feed.stop_times is not None):
+        if stops is not None and stop_times is not None:
+            if self.backend == "polars":
+                stop_ids = pl.from_pandas(stops[['stop_id']]).with_columns(pl.col('stop_id').cast(pl.Utf8))
+                missing_stops = (
+                    self._get_polars_stop_times(stop_times)
+                    .select(pl.col('stop_id').drop_nulls().unique(maintain_order=True))
+                    .join(stop_ids, on='stop_id', how='anti')
+                    .get_column('stop_id')
+                    .to_numpy()
+                )
+            else:
+                missing_stops = _missing_references(stop_times['stop_id'], stops['stop_id'])
             
-            stop_ids = set(feed.stops['stop_id'].unique())
-            stop_time_stop_ids = set(feed.stop_times['stop_id'].unique())
-            missing_stops = stop_time_stop_ids - stop_ids
-            
-            if missing_stops:
+            if len(missing_stops):
                 issues.append({
-                    'message': f"Stop times reference non-existent stops: {list(missing_stops)[:5]}",
-                    'details': {'missing_stop_ids': list(missing_stops)[:10]}
+                    'message': f"Stop times reference non-existent stops: {missing_stops[:5].tolist()}",
+                    'details': {'missing_stop_ids': missing_stops[:10].tolist()}
                 })
         
         return issues
@@ -296,24 +437,28 @@ class GTFSValidator:
         """Validate coordinate ranges."""
         issues = []
         
-        if hasattr(feed, 'stops') and feed.stops is not None:
-            stops = feed.stops
-            if 'stop_lat' in stops.columns and 'stop_lon' in stops.columns:
-                # Check latitude range
-                invalid_lats = stops[(stops['stop_lat'] < -90) | (stops['stop_lat'] > 90)]
-                if not invalid_lats.empty:
-                    issues.append({
-                        'message': f"Invalid latitudes found: {len(invalid_lats)} stops",
-                        'details': {'count': len(invalid_lats)}
-                    })
-                
-                # Check longitude range  
-                invalid_lons = stops[(stops['stop_lon'] < -180) | (stops['stop_lon'] > 180)]
-                if not invalid_lons.empty:
-                    issues.append({
-                        'message': f"Invalid longitudes found: {len(invalid_lons)} stops",
-                        'details': {'count': len(invalid_lons)}
-                    })
+        stops = self._schema_scan(feed).get('stops')
+        if stops is not None and len(stops['numeric']) == 2:
+            lat, lon = stops['numeric']['stop_lat'], stops['numeric']['stop_lon']
+            
+            # Check latitude range; missing coordinates are allowed (GTFS
+            # leaves them empty for generic nodes and boarding areas) and
+            # non-numeric ones are reported by the data types rule, so only
+            # present out-of-range values count, as in StandardRules
+            invalid_lats = int(np.count_nonzero((lat < -90) | (lat > 90)))
+            if invalid_lats:
+                issues.append({
+                    'message': f"Invalid latitudes found: {invalid_lats} stops",
+                    'details': {'count': invalid_lats}
+                })
+            
+            # Check longitude range
+            invalid_lons = int(np.count_nonzero((lon < -180) | (lon > 180)))
+            if invalid_lons:
+                issues.append({
+                    'message': f"Invalid longitudes found: {invalid_lons} stops",
+                    'details': {'count': invalid_lons}
+                })
         
         return issues
     
@@ -321,31 +466,42 @@ class GTFSValidator:
         """Validate service date ranges."""
         issues = []
         
-        if hasattr(feed, 'calendar') and feed.calendar is not None and not feed.calendar.empty:
-            calendar = feed.calendar
-            
-            # Check for past service periods
+        calendar = getattr(feed, 'calendar', None)
+        
+        if calendar is not None and not calendar.empty:
+            # Check for past service periods; GTFS dates are YYYYMMDD, so
+            # they compare correctly as plain numbers
             try:
-                start_dates = pd.to_datetime(calendar['start_date'], format='%Y%m%d')
-                end_dates = pd.to_datetime(calendar['end_date'], format='%Y%m%d')
+                start_dates = pd.to_numeric(calendar['start_date']).to_numpy(dtype='float64', na_value=np.nan)
+                end_dates = pd.to_numeric(calendar['end_date']).to_numpy(dtype='float64', na_value=np.nan)
                 
-                now = pd.Timestamp.now()
-                past_services = calendar[end_dates < (now - pd.Timedelta(days=30))]
+                cutoff = int((pd.Timestamp.now() - pd.Timedelta(days=30)).strftime('%Y%m%d'))
+                past_services = int((end_dates <= cutoff).sum())
                 
-                if not past_services.empty:
+                if past_services:
                     issues.append({
-                        'message': f"Service periods ending more than 30 days ago: {len(past_services)}",
-                        'details': {'count': len(past_services)}
+                        'message': f"Service periods ending more than 30 days ago: {past_services}",
+                        'details': {'count': past_services}
                     })
                 
-                # Check for unreasonably long service periods
-                long_services = calendar[(end_dates - start_dates).dt.days > 730]  # 2 years
-                if not long_services.empty:
+                # Check for unreasonably long service periods. More than 730
+                # days needs at least two calendar years between the dates,
+                # so only those rows are parsed as dates.
+                candidates = (end_dates // 10000 - start_dates // 10000) >= 2
+                long_services = 0
+                if candidates.any():
+                    durations = (
+                        pd.to_datetime(calendar['end_date'][candidates], format='%Y%m%d')
+                        - pd.to_datetime(calendar['start_date'][candidates], format='%Y%m%d')
+                    )
+                    long_services = int((durations.dt.days > 730).sum())  # 2 years
+                
+                if long_services:
                     issues.append({
-                        'message': f"Service periods longer than 2 years: {len(long_services)}",
-                        'details': {'count': len(long_services)}
+                        'message': f"Service periods longer than 2 years: {long_services}",
+                        'details': {'count': long_services}
                     })
-                    
+            
             except Exception as e:
                 issues.append({
                     'message': f"Error validating service dates: {e}",
@@ -358,32 +514,98 @@ class GTFSValidator:
         """Validate stop time sequences."""
         issues = []
         
-        if hasattr(feed, 'stop_times') and feed.stop_times is not None:
-            stop_times = feed.stop_times
+        stop_times = getattr(feed, 'stop_times', None)
+        
+        if stop_times is not None:
+            if self.backend == "polars":
+                n_duplicates, n_unordered = self._count_sequence_issues_polars(stop_times)
+            else:
+                n_duplicates, n_unordered = self._count_sequence_issues(stop_times)
             
-            # Check for duplicate stop sequences within trips
-            duplicates = stop_times.groupby(['trip_id', 'stop_sequence']).size()
-            duplicates = duplicates[duplicates > 1]
+            if n_duplicates:
+                issues.append({
+                    'message': f"Duplicate stop sequences found in {n_duplicates} cases",
+                    'details': {'count': n_duplicates}
+                })
             
-            if not duplicates.empty:
+            if n_unordered:
                 issues.append({
-                    'message': f"Duplicate stop sequences found in {len(duplicates)} cases",
-                    'details': {'count': len(duplicates)}
+                    'message': f"Arrival times decrease along the stop sequence in {n_unordered} trips",
+                    'details': {'count': n_unordered}
                 })
         
         return issues
     
+    def _count_sequence_issues(self, stop_times: pd.DataFrame) -> Tuple[int, int]:
+        """Count duplicate stop sequences and trips whose arrival times go backwards.
+        
+        Every trip is walked in stop_sequence order once; both checks then
+        compare each row with the previous row of the same trip. Each
+        repeated (trip_id, stop_sequence) pair counts once, and stops
+        without an arrival time are skipped.
+        
+        Returns:
+            Number of duplicated pairs and number of unordered trips
+        """
+        trip_codes, _ = pd.factorize(stop_times['trip_id'])
+        sequences = stop_times['stop_sequence'].to_numpy(dtype='float64', na_value=np.nan)
+        order = np.lexsort((sequences, trip_codes))
+        trip_codes = trip_codes[order]
+        sequences = sequences[order]
+        
+        repeated = (trip_codes[1:] == trip_codes[:-1]) & (sequences[1:] == sequences[:-1])
+        n_duplicates = int((repeated & ~np.r_[False, repeated[:-1]]).sum())
+        
+        n_unordered = 0
+        if 'arrival_time' in stop_times.columns:
+            arrivals = _gtfs_time_to_seconds(stop_times['arrival_time']).to_numpy(
+                dtype='float64', na_value=np.nan
+            )[order]
+            timed = ~np.isnan(arrivals)
+            timed_codes = trip_codes[timed]
+            timed_arrivals = arrivals[timed]
+            backwards = (timed_codes[1:] == timed_codes[:-1]) & (timed_arrivals[1:] < timed_arrivals[:-1])
+            n_unordered = len(np.unique(timed_codes[1:][backwards]))
+        
+        return n_duplicates, n_unordered
+    
+    def _count_sequence_issues_polars(self, stop_times: pd.DataFrame) -> Tuple[int, int]:
+        """Polars counterpart of :meth:`_count_sequence_issues`."""
+        frame = self._get_polars_stop_times(stop_times)
+        keys = ['trip_id', 'stop_sequence']
+        
+        # A missing stop_sequence never equals another one, as NaN in the
+        # pandas backend; missing trip IDs do form one group in both
+        n_duplicates = (
+            frame.filter(pl.col('stop_sequence').is_not_null())
+            .filter(pl.struct(keys).is_duplicated())
+            .unique(subset=keys)
+            .height
+        )
+        
+        n_unordered = 0
+        if 'arrival_seconds' in frame.columns:
+            # Stable sort with missing sequences last, like np.lexsort
+            n_unordered = (
+                frame.drop_nulls('arrival_seconds')
+                .sort(keys, nulls_last=True, maintain_order=True)
+                .filter(pl.col('arrival_seconds') < pl.col('arrival_seconds').shift(1).over('trip_id'))
+                .select(pl.col('trip_id').n_unique())
+                .item()
+            )
+        
+        return int(n_duplicates), int(n_unordered)
+    
     def _validate_route_names(self, feed) -> List[Dict[str, Any]]:
         """Validate route naming consistency."""
         issues = []
         
-        if hasattr(feed, 'routes') and feed.routes is not None:
-            routes = feed.routes
-            
+        routes = getattr(feed, 'routes', None)
+        
+        if routes is not None:
             # Check for routes with neither short nor long name
             no_name = routes[
-                (routes.get('route_short_name', '').astype(str).str.strip() == '') &
-                (routes.get('route_long_name', '').astype(str).str.strip() == '')
+                _blank_names(routes, 'route_short_name') & _blank_names(routes, 'route_long_name')
             ]
             
             if not no_name.empty:
@@ -4,6 +4,7 @@ from .exceptions import (
     DatabusError,
     DatabusAPIError,
     DatabusConnectionError,
+    FeedDownloadError,
     GTFSProcessingError,
     GTFSValidationError,
 )
@@ -11,6 +12,7 @@ from .helpers import (
     format_file_size,
     format_duration,
     calculate_distance,
+    calculate_distance_batch,
     parse_gtfs_time,
     format_gtfs_time,
 )
@@ -20,11 +22,13 @@ __all__ = [
     "DatabusError",
     "DatabusAPIError", 
     "DatabusConnectionError",
+    "FeedDownloadError",
     "GTFSProcessingError",
     "GTFSValidationError",
     "format_file_size",
     "format_duration",
     "calculate_distance",
+    "calculate_distance_batch",
     "parse_gtfs_time",
     "format_gtfs_time",
     "Config",
@@ -1,16 +1,54 @@
 """Configuration management for databus."""
 
 import os
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Sequence
 from pathlib import Path
-import json
 import logging
+import threading
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
 
 from .exceptions import ConfigurationError
+from .serialization import json_dumps, json_loads
 
 
 logger = logging.getLogger(__name__)
 
+# Marks keys that resolved to nothing in the lookup cache
+_MISSING = object()
+
+# Config files at least this large are streamed when ijson is installed
+_STREAM_THRESHOLD = 64 * 1024
+
+# Errors raised for unreadable or malformed config files
+_CONFIG_FILE_ERRORS = (ValueError, IOError) + ((ijson.JSONError,) if ijson is not None else ())
+
+
+@lru_cache(maxsize=1)
+def _user_config_dir() -> Path:
+    """Get the per-user configuration directory, resolved once per process."""
+    return Path.home() / ".databus"
+
+
+def _to_bool(value: str) -> bool:
+    """Interpret an environment variable as a boolean flag."""
+    return value.lower() in ('true', '1', 'yes', 'on')
+
+
+# Environment variables as (name, configuration path, converter) triples
+_ENV_MAPPINGS = (
+    ("DATABUS_API_URL", ("api", "base_url"), str),
+    ("DATABUS_API_KEY", ("api", "api_key"), str),
+    ("DATABUS_API_TIMEOUT", ("api", "timeout"), int),
+    ("DATABUS_LOG_LEVEL", ("logging", "level"), str),
+    ("DATABUS_TEMP_DIR", ("processing", "temp_dir"), str),
+    ("DATABUS_STRICT_VALIDATION", ("validation", "strict_mode"), _to_bool),
+)
+
 
 class Config:
     """Configuration manager for databus settings.
@@ -49,10 +87,22 @@ class Config:
         """
         self._config = self.DEFAULT_CONFIG.copy()
         self._config_file = config_file
+        self._get_cache: Dict[str, Any] = {}
         
-        # Load configuration from various sources
-        self._load_from_file()
-        self._load_from_environment()
+        # Files and environment variables are read on first access
+        self._loaded = False
+        self._load_lock = threading.Lock()
+    
+    def _ensure_loaded(self) -> None:
+        """Load configuration from the file and environment sources once."""
+        if self._loaded:
+            return
+        
+        with self._load_lock:
+            if not self._loaded:
+                self._load_from_file()
+                self._load_from_environment()
+                self._loaded = True
     
     def _load_from_file(self) -> None:
         """Load configuration from file."""
@@ -62,47 +112,46 @@ class Config:
             config_paths.append(self._config_file)
         
         # Default config file locations
+        cwd = Path.cwd()
         config_paths.extend([
-            Path.home() / ".databus" / "config.json",
-            Path.cwd() / "databus.json",
-            Path.cwd() / ".databusrc",
+            _user_config_dir() / "config.json",
+            cwd / "databus.json",
+            cwd / ".databusrc",
         ])
         
         for config_path in config_paths:
-            if config_path.exists():
-                try:
-                    with open(config_path, 'r') as f:
-                        file_config = json.load(f)
-                    
-                    self._merge_config(file_config)
-                    logger.info(f"Loaded configuration from {config_path}")
-                    break
-                    
-                except (json.JSONDecodeError, IOError) as e:
-                    logger.warning(f"Failed to load config from {config_path}: {e}")
+            # Opening directly saves a stat() call per candidate path
+            try:
+                with open(config_path, 'rb') as f:
+                    if ijson is not None and os.fstat(f.fileno()).st_size >= _STREAM_THRESHOLD:
+                        # Parse one top-level section at a time so the raw
+                        # text of a large file is never held in memory
+                        loaded = dict(ijson.kvitems(f, '', use_float=True))
+                    else:
+                        loaded = json_loads(f.read())
+                
+                # Merge only once the whole file parsed, so a malformed
+                # file leaves nothing behind for the next candidate
+                self._merge_config(loaded)
+                
+                logger.info(f"Loaded configuration from {config_path}")
+                break
+            
+            except FileNotFoundError:
+                continue
+            except _CONFIG_FILE_ERRORS as e:
+                logger.warning(f"Failed to load config from {config_path}: {e}")
     
     def _load_from_environment(self) -> None:
         """Load configuration from environment variables."""
-        env_mappings = {
-            "DATABUS_API_URL": ["api", "base_url"],
-            "DATABUS_API_KEY": ["api", "api_key"],
-            "DATABUS_API_TIMEOUT": ["api", "timeout"],
-            "DATABUS_LOG_LEVEL": ["logging", "level"],
-            "DATABUS_TEMP_DIR": ["processing", "temp_dir"],
-            "DATABUS_STRICT_VALIDATION": ["validation", "strict_mode"],
-        }
-        
-        for env_var, config_path in env_mappings.items():
-            value = os.getenv(env_var)
+        for env_var, config_path, convert in _ENV_MAPPINGS:
+            value = os.environ.get(env_var)
             if value is not None:
                 # Convert string values to appropriate types
-                if env_var.endswith("_TIMEOUT"):
-                    try:
-                        value = int(value)
-                    except ValueError:
-                        continue
-                elif env_var.endswith("_STRICT_VALIDATION"):
-                    value = value.lower() in ('true', '1', 'yes', 'on')
+                try:
+                    value = convert(value)
+                except ValueError:
+                    continue
                 
                 self._set_nested_value(config_path, value)
     
@@ -116,8 +165,9 @@ class Config:
                     base[key] = value
         
         merge_dict(self._config, new_config)
+        self._get_cache.clear()
     
-    def _set_nested_value(self, path: list, value: Any) -> None:
+    def _set_nested_value(self, path: Sequence[str], value: Any) -> None:
         """Set a nested configuration value."""
         config = self._config
         for key in path[:-1]:
@@ -125,6 +175,7 @@ class Config:
                 config[key] = {}
             config = config[key]
         config[path[-1]] = value
+        self._get_cache.clear()
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation.
@@ -132,19 +183,24 @@ class Config:
         Args:
             key: Configuration key (e.g., 'api.base_url')
             default: Default value if key not found
-            
+        
         Returns:
             Configuration value
         """
-        keys = key.split('.')
-        value = self._config
-        
+        # Resolved keys are memoized until the configuration changes
         try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+            value = self._get_cache[key]
+        except KeyError:
+            self._ensure_loaded()
+            value = self._config
+            try:
+                for k in key.split('.'):
+                    value = value[k]
+            except (KeyError, TypeError):
+                value = _MISSING
+            self._get_cache[key] = value
+        
+        return default if value is _MISSING else value
     
     def set(self, key: str, value: Any) -> None:
         """Set configuration value using dot notation.
@@ -153,23 +209,28 @@ class Config:
             key: Configuration key (e.g., 'api.timeout')
             value: Value to set
         """
+        self._ensure_loaded()
         keys = key.split('.')
         self._set_nested_value(keys, value)
     
     def get_api_config(self) -> Dict[str, Any]:
         """Get API configuration section."""
+        self._ensure_loaded()
         return self._config.get("api", {})
     
     def get_logging_config(self) -> Dict[str, Any]:
         """Get logging configuration section."""
+        self._ensure_loaded()
         return self._config.get("logging", {})
     
     def get_processing_config(self) -> Dict[str, Any]:
         """Get processing configuration section."""
+        self._ensure_loaded()
         return self._config.get("processing", {})
     
     def get_validation_config(self) -> Dict[str, Any]:
         """Get validation configuration section."""
+        self._ensure_loaded()
         return self._config.get("validation", {})
     
     def save_to_file(self, file_path: Optional[Path] = None) -> None:
@@ -179,19 +240,22 @@ class Config:
             file_path: Path to save configuration (defaults to user config)
         """
         if not file_path:
-            config_dir = Path.home() / ".databus"
+            config_dir = _user_config_dir()
             config_dir.mkdir(exist_ok=True)
             file_path = config_dir / "config.json"
         
+        self._ensure_loaded()
+        
         try:
-            with open(file_path, 'w') as f:
-                json.dump(self._config, f, indent=2)
+            with open(file_path, 'wb') as f:
+                f.write(json_dumps(self._config, indent=True))
             logger.info(f"Configuration saved to {file_path}")
         except IOError as e:
             raise ConfigurationError(f"Failed to save configuration: {e}")
     
     def to_dict(self) -> Dict[str, Any]:
         """Get configuration as dictionary."""
+        self._ensure_loaded()
         return self._config.copy()
     
     def __getitem__(self, key: str) -> Any:
@@ -1,5 +1,7 @@
 """Custom exceptions for the databus package."""
 
+from typing import Dict, Optional
+
 
 class DatabusError(Exception):
     """Base exception class for all databus-related errors."""
@@ -7,8 +9,33 @@ class DatabusError(Exception):
 
 
 class DatabusAPIError(DatabusError):
-    """Exception raised for API-related errors."""
-    pass
+    """Exception raised for API-related errors.
+    
+    Args:
+        message: Error description
+        status_code: HTTP status code of the failed response, if any
+    """
+    
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class FeedDownloadError(DatabusAPIError):
+    """Exception raised when some feeds of a batch download fail.
+    
+    Args:
+        results: Paths of the feeds that were downloaded, by feed ID
+        failures: Exceptions of the feeds that failed, by feed ID
+    """
+    
+    def __init__(self, results: Dict[str, str], failures: Dict[str, Exception]):
+        details = "; ".join(f"{feed_id}: {error}" for feed_id, error in failures.items())
+        super().__init__(
+            f"Failed to download {len(failures)} of {len(results) + len(failures)} feeds: {details}"
+        )
+        self.results = results
+        self.failures = failures
 
 
 class DatabusConnectionError(DatabusError):
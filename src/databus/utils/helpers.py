@@ -1,9 +1,44 @@
 """Helper functions and utilities for databus operations."""
 
 import math
-import re
+import os
 from datetime import datetime, timedelta
-from typing import Tuple, Union, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Tuple, Union, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+# Earth's radius in kilometers
+_EARTH_RADIUS_KM = 6371.0
+
+# Units used by format_file_size, each 1024 times the previous one
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# Characters allowed in a GTFS hex color
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+# Result returned for every valid coordinate pair
+_VALID_COORDINATE = (True, "")
+
+# Zero-padded two-digit strings for the minute and second fields
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(60))
+
+# Human-readable names of the GTFS route types
+_ROUTE_TYPE_NAMES = {
+    0: "Tram, Streetcar, Light rail",
+    1: "Subway, Metro",
+    2: "Rail",
+    3: "Bus",
+    4: "Ferry",
+    5: "Cable tram",
+    6: "Aerial lift, suspended cable car",
+    7: "Funicular",
+    11: "Trolleybus",
+    12: "Monorail",
+}
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -15,15 +50,14 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted size string (e.g., "1.5 MB", "2.3 GB")
     """
-    if size_bytes == 0:
+    if size_bytes <= 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = int(math.floor(math.log(size_bytes, 1024)))
-    p = math.pow(1024, i)
-    s = round(size_bytes / p, 2)
+    # The unit index is the number of whole 10-bit groups above the first bit
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    s = round(size_bytes / (1 << (10 * i)), 2)
     
-    return f"{s} {size_names[i]}"
+    return f"{s} {_SIZE_UNITS[i]}"
 
 
 def format_duration(seconds: float) -> str:
@@ -75,16 +109,45 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
     c = 2 * math.asin(math.sqrt(a))
     
-    # Earth's radius in kilometers
-    r = 6371
+    return c * _EARTH_RADIUS_KM
+
+
+def calculate_distance_batch(
+    lat1: "np.ndarray",
+    lon1: "np.ndarray",
+    lat2: "np.ndarray",
+    lon2: "np.ndarray"
+) -> "np.ndarray":
+    """Calculate element-wise distances between arrays of points.
+    
+    Vectorized counterpart of :func:`calculate_distance`; the inputs are
+    broadcast against each other, so a single point can be compared with
+    many.
+    
+    Args:
+        lat1: Latitudes of the first points
+        lon1: Longitudes of the first points
+        lat2: Latitudes of the second points
+        lon2: Longitudes of the second points
+        
+    Returns:
+        Array of distances in kilometers
+    """
+    # Imported here so that importing the helpers (e.g. from the CLI) stays cheap
+    import numpy as np
+    
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2))
     
-    return c * r
+    a = np.sin((lat2 - lat1) * 0.5) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) * 0.5) ** 2
+    return 2 * _EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
 
 
+@lru_cache(maxsize=8192)
 def parse_gtfs_time(time_str: str) -> Optional[timedelta]:
     """Parse GTFS time format (HH:MM:SS) to timedelta.
     
     GTFS allows times beyond 24:00:00 to represent times after midnight.
+    Results are cached, since feeds repeat the same times many times over.
     
     Args:
         time_str: Time string in HH:MM:SS format
@@ -92,16 +155,21 @@ def parse_gtfs_time(time_str: str) -> Optional[timedelta]:
     Returns:
         timedelta object or None if parsing fails
     """
-    if not time_str or time_str.strip() == '':
+    if not time_str:
         return None
     
     try:
-        # Match HH:MM:SS format
-        match = re.match(r'^(\d{1,2}):(\d{2}):(\d{2})$', time_str.strip())
-        if not match:
+        time_str = time_str.strip()
+        
+        # Check the H:MM:SS / HH:MM:SS layout by position instead of a regex
+        if len(time_str) not in (7, 8) or time_str[-3] != ':' or time_str[-6] != ':':
             return None
         
-        hours, minutes, seconds = map(int, match.groups())
+        hour_part, minute_part, second_part = time_str[:-6], time_str[-5:-3], time_str[-2:]
+        if not (hour_part.isdecimal() and minute_part.isdecimal() and second_part.isdecimal()):
+            return None
+        
+        hours, minutes, seconds = int(hour_part), int(minute_part), int(second_part)
         
         # Validate ranges (allowing hours > 23 for GTFS)
         if minutes >= 60 or seconds >= 60:
@@ -122,12 +190,11 @@ def format_gtfs_time(td: timedelta) -> str:
     Returns:
         Time string in HH:MM:SS format
     """
-    total_seconds = int(td.total_seconds())
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    seconds = total_seconds % 60
+    hours, remainder = divmod(int(td.total_seconds()), 3600)
+    minutes, seconds = divmod(remainder, 60)
     
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    # Hours may exceed 99, so only minutes and seconds use the lookup table
+    return f"{hours:02d}:{_TWO_DIGITS[minutes]}:{_TWO_DIGITS[seconds]}"
 
 
 def validate_coordinate(lat: float, lon: float) -> Tuple[bool, str]:
@@ -140,16 +207,44 @@ def validate_coordinate(lat: float, lon: float) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not isinstance(lat, (int, float)) or not isinstance(lon, (int, float)):
+    try:
+        finite = math.isfinite(lat) and math.isfinite(lon)
+    except TypeError:
         return False, "Coordinates must be numeric"
     
-    if lat < -90 or lat > 90:
+    # Common case first: one chained comparison per axis
+    if finite and -90 <= lat <= 90 and -180 <= lon <= 180:
+        return _VALID_COORDINATE
+    
+    if not finite:
+        return False, "Coordinates must be finite"
+    
+    if not -90 <= lat <= 90:
         return False, f"Latitude {lat} is out of range [-90, 90]"
     
-    if lon < -180 or lon > 180:
-        return False, f"Longitude {lon} is out of range [-180, 180]"
+    return False, f"Longitude {lon} is out of range [-180, 180]"
+
+
+def validate_coordinates_batch(lats: "np.ndarray", lons: "np.ndarray") -> "np.ndarray":
+    """Validate arrays of geographic coordinates.
+    
+    Vectorized counterpart of :func:`validate_coordinate`; missing and
+    non-finite values are invalid.
     
-    return True, ""
+    Args:
+        lats: Latitudes
+        lons: Longitudes
+        
+    Returns:
+        Boolean array, True where the coordinate pair is valid
+    """
+    import numpy as np
+    
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    
+    # NaN fails every comparison, so it is rejected along with out of range values
+    return np.logical_and.reduce((lats >= -90, lats <= 90, lons >= -180, lons <= 180))
 
 
 def parse_gtfs_color(color_str: str) -> Optional[str]:
@@ -168,7 +263,7 @@ def parse_gtfs_color(color_str: str) -> Optional[str]:
     color = color_str.strip().lstrip('#')
     
     # Validate 6-digit hex
-    if re.match(r'^[0-9A-Fa-f]{6}$', color):
+    if len(color) == 6 and _HEX_DIGITS.issuperset(color):
         return color.upper()
     
     return None
@@ -187,8 +282,12 @@ def clean_gtfs_text(text: str, max_length: Optional[int] = None) -> str:
     if not text:
         return ""
     
-    # Remove excessive whitespace and normalize
-    cleaned = ' '.join(text.strip().split())
+    cleaned = text.strip()
+    
+    # Remove excessive whitespace and normalize; text without double spaces
+    # or other whitespace (tabs, newlines, ...) is already clean
+    if '  ' in cleaned or not cleaned.isprintable():
+        cleaned = ' '.join(cleaned.split())
     
     # Truncate if necessary
     if max_length and len(cleaned) > max_length:
@@ -206,20 +305,7 @@ def get_route_type_name(route_type: int) -> str:
     Returns:
         Route type name
     """
-    route_types = {
-        0: "Tram, Streetcar, Light rail",
-        1: "Subway, Metro",
-        2: "Rail",
-        3: "Bus", 
-        4: "Ferry",
-        5: "Cable tram",
-        6: "Aerial lift, suspended cable car",
-        7: "Funicular",
-        11: "Trolleybus",
-        12: "Monorail",
-    }
-    
-    return route_types.get(route_type, f"Unknown ({route_type})")
+    return _ROUTE_TYPE_NAMES.get(route_type, f"Unknown ({route_type})")
 
 
 def generate_unique_id(prefix: str = "", length: int = 8) -> str:
@@ -232,10 +318,8 @@ def generate_unique_id(prefix: str = "", length: int = 8) -> str:
     Returns:
         Unique identifier string
     """
-    import random
-    import string
-    
-    random_part = ''.join(random.choices(string.ascii_lowercase + string.digits, k=length))
+    # One urandom read gives every character at once as lowercase hex
+    random_part = os.urandom((length + 1) // 2).hex()[:length]
     
     if prefix:
         return f"{prefix}_{random_part}"
@@ -271,7 +355,30 @@ def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
     if len(text) <= max_length:
         return text
     
-    if len(suffix) >= max_length:
+    suffix_length = len(suffix)
+    if suffix_length >= max_length:
         return text[:max_length]
     
-    return text[:max_length - len(suffix)] + suffix
+    return text[:max_length - suffix_length] + suffix
+
+
+def truncate_series(texts: "pd.Series", max_length: int, suffix: str = "...") -> "pd.Series":
+    """Truncate a column of text to specified length with optional suffix.
+    
+    Vectorized counterpart of :func:`truncate_text` for string series;
+    missing values are left as they are.
+    
+    Args:
+        texts: Series of strings
+        max_length: Maximum length including suffix
+        suffix: Suffix to add when truncating
+        
+    Returns:
+        Series of truncated text
+    """
+    suffix_length = len(suffix)
+    if suffix_length >= max_length:
+        return texts.str.slice(0, max_length)
+    
+    too_long = (texts.str.len() > max_length).fillna(False).astype(bool)
+    return texts.mask(too_long, texts.str.slice(0, max_length - suffix_length) + suffix)
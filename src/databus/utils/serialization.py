@@ -0,0 +1,66 @@
+"""JSON serialization helpers with optional orjson acceleration."""
+
+import json
+from typing import Any, BinaryIO, Iterable, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document.
+    
+    Uses orjson when it is installed, falling back to the standard
+    library decoder otherwise.
+    
+    Args:
+        data: JSON document as text or UTF-8 bytes
+        
+    Returns:
+        Decoded Python object
+        
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode an object as a UTF-8 JSON document.
+    
+    Uses orjson when it is installed, falling back to the standard
+    library encoder otherwise. Unsupported types are encoded with str().
+    
+    Args:
+        obj: Object to encode
+        indent: Pretty-print with two-space indentation
+        
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, default=str, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def write_json_array(items: Iterable[Any], stream: BinaryIO) -> None:
+    """Write items to a binary stream as an indented JSON array.
+    
+    Each item is encoded and written on its own, so memory use is bounded
+    by the largest item rather than the whole array.
+    
+    Args:
+        items: Objects to encode as array elements
+        stream: Binary stream to write to (e.g. ``sys.stdout.buffer``)
+    """
+    separator = b"[\n  "
+    for item in items:
+        stream.write(separator)
+        stream.write(json_dumps(item, indent=True).replace(b"\n", b"\n  "))
+        separator = b",\n  "
+    stream.write(b"\n]\n" if separator != b"[\n  " else b"[]\n")
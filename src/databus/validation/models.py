@@ -1,11 +1,13 @@
 """Validation models and data structures."""
 
+import sys
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, Iterator, List, Optional, Any, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import chain
 
-from pydantic import BaseModel
+from ..utils.serialization import json_dumps
 
 
 class ValidationSeverity(str, Enum):
@@ -25,20 +27,28 @@ class ValidationRule:
         validate_func: Function that performs validation
         severity: Rule severity level
         category: Optional rule category
+        thread_safe: Whether the rule only reads the feed and may run
+            concurrently with other rules; rules that do not opt in run
+            on their own before the concurrent ones
     """
     name: str
     description: str
     validate_func: Callable[[Any], List[Dict[str, Any]]]
     severity: str = "warning"
     category: Optional[str] = None
+    thread_safe: bool = False
     
     def __post_init__(self):
         """Validate rule configuration."""
         if self.severity not in ["error", "warning", "info"]:
             raise ValueError(f"Invalid severity: {self.severity}")
+        
+        # Every issue the rule reports carries its name
+        self.name = sys.intern(self.name)
 
 
-class ValidationReport(BaseModel):
+@dataclass
+class ValidationReport:
     """Comprehensive validation report.
     
     Contains all validation results including errors, warnings, and notices,
@@ -52,6 +62,11 @@ class ValidationReport(BaseModel):
     feed_path: Optional[str] = None
     validated_at: datetime = field(default_factory=datetime.now)
     
+    # Last summary, stored with the report state it was computed from
+    _summary_cache: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     @property
     def total_issues(self) -> int:
         """Total number of validation issues."""
@@ -67,54 +82,103 @@ class ValidationReport(BaseModel):
         """Whether the report contains warnings."""
         return len(self.warnings) > 0
     
+    def add_error(self, issue: Dict[str, Any]) -> None:
+        """Record an error issue.
+        
+        Args:
+            issue: Issue dictionary
+        """
+        self.errors.append(issue)
+    
+    def add_warning(self, issue: Dict[str, Any]) -> None:
+        """Record a warning issue.
+        
+        Args:
+            issue: Issue dictionary
+        """
+        self.warnings.append(issue)
+    
+    def add_notice(self, issue: Dict[str, Any]) -> None:
+        """Record an informational issue.
+        
+        Args:
+            issue: Issue dictionary
+        """
+        self.notices.append(issue)
+    
     def get_issues_by_rule(self, rule_name: str) -> List[Dict[str, Any]]:
         """Get all issues for a specific rule.
         
         Args:
             rule_name: Name of the validation rule
-            
+        
         Returns:
             List of issues for the specified rule
         """
-        issues = []
-        for issue_list in [self.errors, self.warnings, self.notices]:
-            issues.extend([issue for issue in issue_list if issue.get('rule') == rule_name])
-        return issues
+        return [
+            issue for issue in chain(self.errors, self.warnings, self.notices)
+            if issue.get('rule') == rule_name
+        ]
     
     def get_issues_by_severity(self, severity: str) -> List[Dict[str, Any]]:
         """Get all issues of a specific severity.
         
         Args:
             severity: Issue severity ('error', 'warning', 'info')
-            
+        
+        Returns:
+            List of issues with the specified severity; a copy that the
+            caller may modify
+        """
+        return list(self.iter_issues_by_severity(severity))
+    
+    def iter_issues_by_severity(self, severity: str) -> Iterator[Dict[str, Any]]:
+        """Iterate over the issues of a specific severity without copying them.
+        
+        Args:
+            severity: Issue severity ('error', 'warning', 'info')
+        
         Returns:
-            List of issues with the specified severity
+            Iterator over the issues with the specified severity
         """
         if severity == "error":
-            return self.errors.copy()
+            return iter(self.errors)
         elif severity == "warning":
-            return self.warnings.copy()
+            return iter(self.warnings)
         elif severity == "info":
-            return self.notices.copy()
+            return iter(self.notices)
         else:
-            return []
+            return iter(())
     
     def summary(self) -> Dict[str, Any]:
         """Generate validation summary.
         
         Returns:
-            Dictionary with validation summary
+            Dictionary with validation summary; rebuilt only when the
+            report has changed since the last call
         """
-        return {
-            "status": self.status,
-            "score": round(self.score, 1),
-            "total_issues": self.total_issues,
-            "errors": len(self.errors),
-            "warnings": len(self.warnings), 
-            "notices": len(self.notices),
-            "validated_at": self.validated_at.isoformat(),
-            "feed_path": self.feed_path,
-        }
+        state = (
+            self.status,
+            self.score,
+            len(self.errors),
+            len(self.warnings),
+            len(self.notices),
+            self.validated_at,
+            self.feed_path,
+        )
+        if self._summary_cache is None or self._summary_cache[0] != state:
+            self._summary_cache = (state, {
+                "status": self.status,
+                "score": round(self.score, 1),
+                "total_issues": self.total_issues,
+                "errors": len(self.errors),
+                "warnings": len(self.warnings),
+                "notices": len(self.notices),
+                "validated_at": self.validated_at.isoformat(),
+                "feed_path": self.feed_path,
+            })
+        
+        return dict(self._summary_cache[1])
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert report to dictionary."""
@@ -128,11 +192,10 @@ class ValidationReport(BaseModel):
             "validated_at": self.validated_at.isoformat(),
             "summary": self.summary(),
         }
-        
+    
     def to_json(self) -> str:
         """Convert report to JSON string."""
-        import json
-        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        return json_dumps(self.to_dict(), indent=True).decode("utf-8")
 
 
 @dataclass
@@ -154,6 +217,12 @@ class ValidationIssue:
     file_name: Optional[str] = None
     line_number: Optional[int] = None
     
+    def __post_init__(self):
+        """Share one string object per rule and file name across issues."""
+        self.rule = sys.intern(self.rule)
+        if self.file_name is not None:
+            self.file_name = sys.intern(self.file_name)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert issue to dictionary."""
         return {
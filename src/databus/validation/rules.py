@@ -1,11 +1,73 @@
 """Standard GTFS validation rules."""
 
-from typing import Dict, List, Any
+import copy
+from functools import lru_cache
+from typing import Dict, List, Any, Tuple
+import numpy as np
 import pandas as pd
 
 from .models import ValidationRule
 
 
+def _blank_names(routes: pd.DataFrame, column: str) -> pd.Series:
+    """Flag the rows of a route name column that are missing or blank.
+    
+    The checks run as string kernels on the column itself instead of
+    stripping a copy of every name, and an absent column counts as blank.
+    
+    Args:
+        routes: Routes dataframe
+        column: Name column to check
+    
+    Returns:
+        Boolean series aligned with the routes
+    """
+    if column not in routes.columns:
+        return pd.Series(True, index=routes.index)
+    
+    names = routes[column].astype('string')
+    return (names.isna() | names.str.len().eq(0) | names.str.isspace()).astype(bool)
+
+
+def _missing_references(references: pd.Series, keys: pd.Series) -> np.ndarray:
+    """Get the distinct referenced IDs that do not appear among the keys.
+    
+    Both sides are deduplicated by pandas first, so the comparison runs as
+    a vectorized NumPy set difference rather than Python set arithmetic.
+    
+    Args:
+        references: Column holding foreign key values
+        keys: Column holding the referenced primary keys
+    
+    Returns:
+        Array of the missing IDs in order of first reference
+    """
+    return np.setdiff1d(
+        np.asarray(references.dropna().unique(), dtype=object),
+        np.asarray(keys.dropna().unique(), dtype=object),
+        assume_unique=True,
+    )
+
+
+def _has_non_numeric(values: pd.Series) -> bool:
+    """Check whether a column holds values that do not parse as numbers.
+    
+    Columns that were already parsed to a numeric dtype are accepted
+    without scanning them.
+    
+    Args:
+        values: Column to check
+    
+    Returns:
+        True if any present value is not numeric
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return False
+    
+    parsed = pd.to_numeric(values, errors='coerce')
+    return bool((parsed.isna() & values.notna()).any())
+
+
 class StandardRules:
     """Collection of standard GTFS validation rules."""
     
@@ -13,10 +75,19 @@ class StandardRules:
     def get_all_rules() -> List[ValidationRule]:
         """Get all standard validation rules.
         
+        The validation functions are built once; every call returns new
+        rule objects that callers may change without affecting later calls.
+        
         Returns:
             List of ValidationRule instances
         """
-        return [
+        return [copy.copy(rule) for rule in StandardRules._standard_rules()]
+    
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _standard_rules() -> Tuple[ValidationRule, ...]:
+        """Build the standard rules once."""
+        return (
             StandardRules.required_files_rule(),
             StandardRules.required_fields_rule(),
             StandardRules.data_types_rule(),
@@ -27,7 +98,7 @@ class StandardRules:
             StandardRules.route_names_rule(),
             StandardRules.duplicate_ids_rule(),
             StandardRules.speed_validation_rule(),
-        ]
+        )
     
     @staticmethod
     def required_files_rule() -> ValidationRule:
@@ -50,7 +121,8 @@ class StandardRules:
             description="Check for required GTFS files",
             validate_func=validate,
             severity="error",
-            category="structure"
+            category="structure",
+            thread_safe=True
         )
     
     @staticmethod
@@ -82,7 +154,8 @@ class StandardRules:
             description="Check for required fields in each file",
             validate_func=validate,
             severity="error",
-            category="structure"
+            category="structure",
+            thread_safe=True
         )
     
     @staticmethod
@@ -95,10 +168,7 @@ class StandardRules:
             if hasattr(feed, 'stops') and feed.stops is not None:
                 stops = feed.stops
                 if 'stop_lat' in stops.columns and 'stop_lon' in stops.columns:
-                    try:
-                        pd.to_numeric(stops['stop_lat'], errors='raise')
-                        pd.to_numeric(stops['stop_lon'], errors='raise')
-                    except (ValueError, TypeError):
+                    if _has_non_numeric(stops['stop_lat']) or _has_non_numeric(stops['stop_lon']):
                         issues.append({
                             'message': "Stop coordinates must be numeric",
                             'details': {'file': 'stops', 'fields': ['stop_lat', 'stop_lon']}
@@ -108,9 +178,7 @@ class StandardRules:
             if hasattr(feed, 'routes') and feed.routes is not None:
                 routes = feed.routes
                 if 'route_type' in routes.columns:
-                    try:
-                        pd.to_numeric(routes['route_type'], errors='raise')
-                    except (ValueError, TypeError):
+                    if _has_non_numeric(routes['route_type']):
                         issues.append({
                             'message': "Route type must be numeric",
                             'details': {'file': 'routes', 'field': 'route_type'}
@@ -123,7 +191,8 @@ class StandardRules:
             description="Check data type compliance",
             validate_func=validate,
             severity="error",
-            category="data_quality"
+            category="data_quality",
+            thread_safe=True
         )
     
     @staticmethod
@@ -136,28 +205,24 @@ class StandardRules:
             if (hasattr(feed, 'routes') and hasattr(feed, 'trips') and 
                 feed.routes is not None and feed.trips is not None):
                 
-                route_ids = set(feed.routes['route_id'].unique())
-                trip_route_ids = set(feed.trips['route_id'].unique())
-                missing_routes = trip_route_ids - route_ids
+                missing_routes = _missing_references(feed.trips['route_id'], feed.routes['route_id'])
                 
-                if missing_routes:
+                if len(missing_routes):
                     issues.append({
                         'message': f"Trips reference non-existent routes",
-                        'details': {'missing_route_ids': list(missing_routes)[:10]}
+                        'details': {'missing_route_ids': missing_routes[:10].tolist()}
                     })
             
             # Check stop_id in stop_times references stops
             if (hasattr(feed, 'stops') and hasattr(feed, 'stop_times') and 
                 feed.stops is not None and feed.stop_times is not None):
                 
-                stop_ids = set(feed.stops['stop_id'].unique())
-                stop_time_stop_ids = set(feed.stop_times['stop_id'].unique())
-                missing_stops = stop_time_stop_ids - stop_ids
+                missing_stops = _missing_references(feed.stop_times['stop_id'], feed.stops['stop_id'])
                 
-                if missing_stops:
+                if len(missing_stops):
                     issues.append({
                         'message': f"Stop times reference non-existent stops",
-                        'details': {'missing_stop_ids': list(missing_stops)[:10]}
+                        'details': {'missing_stop_ids': missing_stops[:10].tolist()}
                     })
             
             return issues
@@ -167,7 +232,8 @@ class StandardRules:
             description="Check foreign key relationships",
             validate_func=validate,
             severity="error",
-            category="referential_integrity"
+            category="referential_integrity",
+            thread_safe=True
         )
     
     @staticmethod
@@ -179,20 +245,23 @@ class StandardRules:
             if hasattr(feed, 'stops') and feed.stops is not None:
                 stops = feed.stops
                 if 'stop_lat' in stops.columns and 'stop_lon' in stops.columns:
+                    lat = stops['stop_lat'].to_numpy(dtype='float64', na_value=np.nan)
+                    lon = stops['stop_lon'].to_numpy(dtype='float64', na_value=np.nan)
+                    
                     # Check latitude range
-                    invalid_lats = stops[(stops['stop_lat'] < -90) | (stops['stop_lat'] > 90)]
-                    if not invalid_lats.empty:
+                    invalid_lats = int(np.count_nonzero((lat < -90) | (lat > 90)))
+                    if invalid_lats:
                         issues.append({
-                            'message': f"Invalid latitudes found: {len(invalid_lats)} stops",
-                            'details': {'count': len(invalid_lats)}
+                            'message': f"Invalid latitudes found: {invalid_lats} stops",
+                            'details': {'count': invalid_lats}
                         })
                     
                     # Check longitude range  
-                    invalid_lons = stops[(stops['stop_lon'] < -180) | (stops['stop_lon'] > 180)]
-                    if not invalid_lons.empty:
+                    invalid_lons = int(np.count_nonzero((lon < -180) | (lon > 180)))
+                    if invalid_lons:
                         issues.append({
-                            'message': f"Invalid longitudes found: {len(invalid_lons)} stops",
-                            'details': {'count': len(invalid_lons)}
+                            'message': f"Invalid longitudes found: {invalid_lons} stops",
+                            'details': {'count': invalid_lons}
                         })
             
             return issues
@@ -202,7 +271,8 @@ class StandardRules:
             description="Check coordinate validity",
             validate_func=validate,
             severity="error",
-            category="geographic"
+            category="geographic",
+            thread_safe=True
         )
     
     @staticmethod
@@ -249,7 +319,8 @@ class StandardRules:
             description="Check service date ranges",
             validate_func=validate,
             severity="warning",
-            category="temporal"
+            category="temporal",
+            thread_safe=True
         )
     
     @staticmethod
@@ -262,8 +333,8 @@ class StandardRules:
                 stop_times = feed.stop_times
                 
                 # Check for duplicate stop sequences within trips
-                duplicates = stop_times.groupby(['trip_id', 'stop_sequence']).size()
-                duplicates = duplicates[duplicates > 1]
+                duplicated = stop_times.duplicated(['trip_id', 'stop_sequence'])
+                duplicates = stop_times.loc[duplicated, ['trip_id', 'stop_sequence']].drop_duplicates()
                 
                 if not duplicates.empty:
                     issues.append({
@@ -271,16 +342,25 @@ class StandardRules:
                         'details': {'count': len(duplicates)}
                     })
                 
-                # Check for missing stop sequences
-                for trip_id in stop_times['trip_id'].unique()[:100]:  # Check first 100 trips
-                    trip_stops = stop_times[stop_times['trip_id'] == trip_id]['stop_sequence'].sort_values()
-                    expected_sequence = list(range(1, len(trip_stops) + 1))
-                    if list(trip_stops) != expected_sequence:
-                        issues.append({
-                            'message': f"Non-sequential stop sequences in trip {trip_id}",
-                            'details': {'trip_id': trip_id}
-                        })
-                        break  # Only report one example
+                # Check for missing stop sequences in every trip with one
+                # grouped pass: without duplicates, n values running from 1
+                # to n with sum n(n+1)/2 are exactly 1..n
+                sequences = pd.to_numeric(stop_times['stop_sequence'], errors='coerce').astype('float64')
+                stats = sequences.groupby(stop_times['trip_id'], sort=False, observed=True).agg(['size', 'min', 'max', 'sum'])
+                n = stats['size']
+                non_sequential = (
+                    (stats['min'] != 1)
+                    | (stats['max'] != n)
+                    | (stats['sum'] != n * (n + 1) / 2)
+                    | stats.index.isin(duplicates['trip_id'])
+                )
+                
+                if non_sequential.any():
+                    trip_ids = stats.index[non_sequential]
+                    issues.append({
+                        'message': f"Non-sequential stop sequences in {len(trip_ids)} trips",
+                        'details': {'count': len(trip_ids), 'trip_ids': trip_ids[:5].tolist()}
+                    })
             
             return issues
         
@@ -289,7 +369,8 @@ class StandardRules:
             description="Check stop time sequences",
             validate_func=validate,
             severity="warning",
-            category="sequence"
+            category="sequence",
+            thread_safe=True
         )
     
     @staticmethod
@@ -303,8 +384,7 @@ class StandardRules:
                 
                 # Check for routes with neither short nor long name
                 no_name = routes[
-                    (routes.get('route_short_name', '').astype(str).str.strip() == '') &
-                    (routes.get('route_long_name', '').astype(str).str.strip() == '')
+                    _blank_names(routes, 'route_short_name') & _blank_names(routes, 'route_long_name')
                 ]
                 
                 if not no_name.empty:
@@ -323,7 +403,8 @@ class StandardRules:
             description="Check route naming consistency",
             validate_func=validate,
             severity="info",
-            category="naming"
+            category="naming",
+            thread_safe=True
         )
     
     @staticmethod
@@ -336,22 +417,22 @@ class StandardRules:
             if hasattr(feed, 'routes') and feed.routes is not None:
                 routes = feed.routes
                 if 'route_id' in routes.columns:
-                    duplicates = routes[routes['route_id'].duplicated()]
-                    if not duplicates.empty:
+                    duplicates = int(routes['route_id'].duplicated().sum())
+                    if duplicates:
                         issues.append({
-                            'message': f"Duplicate route IDs found: {len(duplicates)}",
-                            'details': {'count': len(duplicates)}
+                            'message': f"Duplicate route IDs found: {duplicates}",
+                            'details': {'count': duplicates}
                         })
             
             # Check for duplicate stop IDs
             if hasattr(feed, 'stops') and feed.stops is not None:
                 stops = feed.stops
                 if 'stop_id' in stops.columns:
-                    duplicates = stops[stops['stop_id'].duplicated()]
-                    if not duplicates.empty:
+                    duplicates = int(stops['stop_id'].duplicated().sum())
+                    if duplicates:
                         issues.append({
-                            'message': f"Duplicate stop IDs found: {len(duplicates)}",
-                            'details': {'count': len(duplicates)}
+                            'message': f"Duplicate stop IDs found: {duplicates}",
+                            'details': {'count': duplicates}
                         })
             
             return issues
@@ -361,7 +442,8 @@ class StandardRules:
             description="Check for duplicate IDs",
             validate_func=validate,
             severity="error",
-            category="uniqueness"
+            category="uniqueness",
+            thread_safe=True
         )
     
     @staticmethod
@@ -386,5 +468,6 @@ class StandardRules:
             description="Validate travel speeds between stops",
             validate_func=validate,
             severity="info",
-            category="performance"
+            category="performance",
+            thread_safe=True
         )
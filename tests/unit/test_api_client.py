@@ -4,9 +4,10 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 import requests
 import json
+import io
 
 from databus.api import DatabusClient, Feed, Agency, Route, Stop, Trip
-from databus.utils.exceptions import DatabusAPIError, DatabusConnectionError
+from databus.utils.exceptions import DatabusAPIError, DatabusConnectionError, FeedDownloadError
 
 
 class TestDatabusClient:
@@ -37,12 +38,44 @@ class TestDatabusClient:
         assert "Authorization" in client.session.headers
         assert client.session.headers["Authorization"] == "Bearer test_key"
     
+    def test_init_connection_pool(self):
+        """Test that the session mounts a sized keep-alive connection pool."""
+        client = DatabusClient(pool_connections=8, pool_maxsize=16)
+        
+        adapter = client.session.get_adapter("https://api.databus.cr")
+        assert adapter._pool_connections == 8
+        assert adapter._pool_maxsize == 16
+        assert client.session.headers["Connection"] == "keep-alive"
+        assert "gzip" in client.session.headers["Accept-Encoding"]
+    
+    def test_default_clients_share_adapter(self):
+        """Test that clients with default pool settings reuse one adapter."""
+        first = DatabusClient()
+        second = DatabusClient()
+        custom = DatabusClient(max_retries=5)
+        
+        adapter = first.session.get_adapter("https://api.databus.cr")
+        assert second.session.get_adapter("https://api.databus.cr") is adapter
+        assert custom.session.get_adapter("https://api.databus.cr") is not adapter
+        
+        first.close()
+        assert second.session.get_adapter("https://api.databus.cr") is adapter
+        assert DatabusClient.shared() is DatabusClient.shared()
+    
+    @patch('requests.Session.close')
+    def test_context_manager_closes_session(self, mock_close):
+        """Test that exiting the context manager closes the session."""
+        with DatabusClient() as client:
+            assert isinstance(client, DatabusClient)
+        
+        mock_close.assert_called_once()
+    
     @patch('requests.Session.request')
     def test_make_request_success(self, mock_request):
         """Test successful API request."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"result": "success"}
+        mock_response.content = b'{"result": "success"}'
         mock_request.return_value = mock_response
         
         client = DatabusClient()
@@ -84,6 +117,92 @@ class TestDatabusClient:
         with pytest.raises(DatabusAPIError, match="API request failed"):
             client._make_request("GET", "/test")
     
+    @patch('requests.Session.request')
+    def test_make_request_http_error_status_code(self, mock_request):
+        """Test that HTTP errors carry the response status code."""
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            "404 Not Found", response=mock_response
+        )
+        mock_request.return_value = mock_response
+        
+        client = DatabusClient()
+        
+        with pytest.raises(DatabusAPIError) as exc_info:
+            client.get_feed_stats("missing-feed")
+        
+        assert exc_info.value.status_code == 404
+        assert mock_request.call_args.kwargs["url"].endswith("/feeds/missing-feed/stats")
+    
+    @patch('requests.Session.request')
+    def test_make_request_invalid_json(self, mock_request):
+        """Test that undecodable response bodies raise an API error."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = b"<html>not json</html>"
+        mock_request.return_value = mock_response
+        
+        client = DatabusClient()
+        
+        with pytest.raises(DatabusAPIError, match="Invalid JSON response"):
+            client._make_request("GET", "/test")
+    
+    @patch('requests.Session.request')
+    def test_make_request_cached(self, mock_request):
+        """Test that fresh GET responses are served from the cache."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Cache-Control": "max-age=60", "ETag": '"v1"'}
+        mock_response.content = b'{"result": "success"}'
+        mock_request.return_value = mock_response
+        
+        client = DatabusClient()
+        first = client._make_request("GET", "/test", params={"a": 1})
+        second = client._make_request("GET", "/test", params={"a": 1})
+        
+        assert first == second == {"result": "success"}
+        mock_request.assert_called_once()
+    
+    @patch('requests.Session.request')
+    def test_make_request_cached_copies(self, mock_request):
+        """Test that mutating a response does not change cached responses."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Cache-Control": "max-age=60"}
+        mock_response.content = b'{"routes": 2, "route_types": [3]}'
+        mock_request.return_value = mock_response
+        
+        client = DatabusClient()
+        first = client._make_request("GET", "/test")
+        first["routes"] = 0
+        second = client._make_request("GET", "/test")
+        second["route_types"].append(1)
+        third = client._make_request("GET", "/test")
+        
+        assert third == {"routes": 2, "route_types": [3]}
+        mock_request.assert_called_once()
+    
+    @patch('requests.Session.request')
+    def test_make_request_conditional_get(self, mock_request):
+        """Test that stale cache entries are revalidated with ETag."""
+        first_response = Mock()
+        first_response.status_code = 200
+        first_response.headers = {"Cache-Control": "no-cache", "ETag": '"v1"'}
+        first_response.content = b'{"result": "success"}'
+        not_modified = Mock()
+        not_modified.status_code = 304
+        not_modified.headers = {}
+        mock_request.side_effect = [first_response, not_modified]
+        
+        client = DatabusClient()
+        client._make_request("GET", "/test")
+        result = client._make_request("GET", "/test")
+        
+        assert result == {"result": "success"}
+        assert mock_request.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        not_modified.raise_for_status.assert_not_called()
+    
     @patch.object(DatabusClient, '_make_request')
     def test_get_feeds_no_filter(self, mock_request, api_responses):
         """Test getting all feeds without filter."""
@@ -96,4 +215,446 @@ class TestDatabusClient:
         assert isinstance(feeds[0], Feed)
         assert feeds[0].id == "costa-rica-gtfs"
         assert feeds[0].country_code == "CR"
-        mock_request.assert_called_once_with("GET", "/feeds", params={})\n    \n    @patch.object(DatabusClient, '_make_request')\n    def test_get_feeds_with_country_filter(self, mock_request, api_responses):\n        \"\"\"Test getting feeds filtered by country.\"\"\"\n        mock_request.return_value = api_responses[\"feeds\"]\n        \n        client = DatabusClient()\n        feeds = client.get_feeds(country=\"CR\")\n        \n        assert len(feeds) == 1\n        mock_request.assert_called_once_with(\"GET\", \"/feeds\", params={\"country\": \"CR\"})\n    \n    @patch.object(DatabusClient, '_make_request')\n    def test_get_feed(self, mock_request, api_responses):\n        \"\"\"Test getting specific feed by ID.\"\"\"\n        mock_request.return_value = api_responses[\"feed_detail\"]\n        \n        client = DatabusClient()\n        feed = client.get_feed(\"costa-rica-gtfs\")\n        \n        assert isinstance(feed, Feed)\n        assert feed.id == \"costa-rica-gtfs\"\n        assert feed.name == \"Costa Rica GTFS\"\n        mock_request.assert_called_once_with(\"GET\", \"/feeds/costa-rica-gtfs\")\n    \n    @patch.object(DatabusClient, '_make_request')\n    def test_get_agencies(self, mock_request, api_responses):\n        \"\"\"Test getting agencies for a feed.\"\"\"\n        mock_request.return_value = api_responses[\"agencies\"]\n        \n        client = DatabusClient()\n        agencies = client.get_agencies(\"costa-rica-gtfs\")\n        \n        assert len(agencies) == 1\n        assert isinstance(agencies[0], Agency)\n        assert agencies[0].agency_id == \"COSEVI\"\n        mock_request.assert_called_once_with(\"GET\", \"/feeds/costa-rica-gtfs/agencies\")\n    \n    @patch.object(DatabusClient, '_make_request')\n    def test_get_routes_no_filter(self, mock_request):\n        \"\"\"Test getting routes without filter.\"\"\"\n        mock_response = {\n            \"routes\": [\n                {\n                    \"route_id\": \"route_1\",\n                    \"route_type\": 3,\n                    \"route_short_name\": \"R1\",\n                    \"route_long_name\": \"Test Route\"\n                }\n            ]\n        }\n        mock_request.return_value = mock_response\n        \n        client = DatabusClient()\n        routes = client.get_routes(\"costa-rica-gtfs\")\n        \n        assert len(routes) == 1\n        assert isinstance(routes[0], Route)\n        assert routes[0].route_id == \"route_1\"\n        mock_request.assert_called_once_with(\n            \"GET\", \"/feeds/costa-rica-gtfs/routes\", params={}\n        )\n    \n    @patch.object(DatabusClient, '_make_request')\n    def test_get_routes_with_filters(self, mock_request):\n        \"\"\"Test getting routes with agency and type filters.\"\"\"\n        mock_response = {\"routes\": []}\n        mock_request.return_value = mock_response\n        \n        client = DatabusClient()\n        routes = client.get_routes(\n            \"costa-rica-gtfs\", \n            agency_id=\"COSEVI\", \n            route_type=3\n        )\n        \n        assert len(routes) == 0\n        mock_request.assert_called_once_with(\n            \"GET\", \n            \"/feeds/costa-rica-gtfs/routes\", \n            params={\"agency_id\": \"COSEVI\", \"route_type\": 3}\n        )\n    \n    @patch.object(DatabusClient, '_make_request')\n    def test_get_stops_no_filter(self, mock_request):\n        \"\"\"Test getting stops without filter.\"\"\"\n        mock_response = {\n            \"stops\": [\n                {\n                    \"stop_id\": \"stop_1\",\n                    \"stop_name\": \"Test Stop\",\n                    \"stop_lat\": 9.9281,\n                    \"stop_lon\": -84.0907\n                }\n            ]\n        }\n        mock_request.return_value = mock_response\n        \n        client = DatabusClient()\n        stops = client.get_stops(\"costa-rica-gtfs\")\n        \n        assert len(stops) == 1\n        assert isinstance(stops[0], Stop)\n        assert stops[0].stop_id == \"stop_1\"\n        mock_request.assert_called_once_with(\n            \"GET\", \"/feeds/costa-rica-gtfs/stops\", params={}\n        )\n    \n    @patch.object(DatabusClient, '_make_request')\n    def test_get_stops_with_bbox(self, mock_request):\n        \"\"\"Test getting stops with bounding box filter.\"\"\"\n        mock_response = {\"stops\": []}\n        mock_request.return_value = mock_response\n        \n        client = DatabusClient()\n        bbox = [-84.2, 9.8, -83.9, 10.1]\n        stops = client.get_stops(\"costa-rica-gtfs\", bbox=bbox)\n        \n        assert len(stops) == 0\n        mock_request.assert_called_once_with(\n            \"GET\", \n            \"/feeds/costa-rica-gtfs/stops\", \n            params={\"bbox\": \"-84.2,9.8,-83.9,10.1\"}\n        )\n    \n    @patch.object(DatabusClient, '_make_request')\n    def test_get_trips(self, mock_request):\n        \"\"\"Test getting trips.\"\"\"\n        mock_response = {\n            \"trips\": [\n                {\n                    \"route_id\": \"route_1\",\n                    \"service_id\": \"service_1\",\n                    \"trip_id\": \"trip_1\",\n                    \"trip_headsign\": \"Downtown\"\n                }\n            ]\n        }\n        mock_request.return_value = mock_response\n        \n        client = DatabusClient()\n        trips = client.get_trips(\"costa-rica-gtfs\")\n        \n        assert len(trips) == 1\n        assert isinstance(trips[0], Trip)\n        assert trips[0].trip_id == \"trip_1\"\n        mock_request.assert_called_once_with(\n            \"GET\", \"/feeds/costa-rica-gtfs/trips\", params={}\n        )\n    \n    @patch('requests.Session.get')\n    def test_download_feed_success(self, mock_get, temp_dir):\n        \"\"\"Test successful feed download.\"\"\"\n        # Mock response with file content\n        mock_response = Mock()\n        mock_response.raise_for_status.return_value = None\n        mock_response.iter_content.return_value = [b\"fake gtfs data\"]\n        mock_get.return_value = mock_response\n        \n        client = DatabusClient()\n        output_path = temp_dir / \"downloaded_feed.zip\"\n        result_path = client.download_feed(\"costa-rica-gtfs\", str(output_path))\n        \n        assert result_path == str(output_path)\n        assert output_path.exists()\n        mock_get.assert_called_once()\n        mock_response.raise_for_status.assert_called_once()\n    \n    @patch('requests.Session.get')\n    def test_download_feed_request_error(self, mock_get):\n        \"\"\"Test download feed with request error.\"\"\"\n        mock_get.side_effect = requests.exceptions.RequestException(\"Download failed\")\n        \n        client = DatabusClient()\n        \n        with pytest.raises(DatabusAPIError, match=\"Failed to download feed\"):\n            client.download_feed(\"costa-rica-gtfs\", \"output.zip\")\n    \n    def test_url_construction(self):\n        \"\"\"Test URL construction for different endpoints.\"\"\"\n        client = DatabusClient(base_url=\"https://api.test.com\")\n        \n        with patch.object(client, '_make_request') as mock_request:\n            # Test that URLs are constructed correctly\n            client.get_feeds()\n            args = mock_request.call_args\n            # The _make_request should be called with the endpoint\n            assert args[0] == (\"GET\", \"/feeds\")\n    \n    def test_base_url_trailing_slash(self):\n        \"\"\"Test that trailing slash is removed from base URL.\"\"\"\n        client = DatabusClient(base_url=\"https://api.test.com/\")\n        assert client.base_url == \"https://api.test.com\""
+        mock_request.assert_called_once_with("GET", "/feeds", params={})
+    
+    @patch.object(DatabusClient, '_make_request')
+    def test_get_feeds_with_country_filter(self, mock_request, api_responses):
+        """Test getting feeds filtered by country."""
+        mock_request.return_value = api_responses["feeds"]
+        
+        client = DatabusClient()
+        feeds = client.get_feeds(country="CR")
+        
+        assert len(feeds) == 1
+        mock_request.assert_called_once_with("GET", "/feeds", params={"country": "CR"})
+    
+    @patch.object(DatabusClient, '_make_request')
+    def test_get_feed(self, mock_request, api_responses):
+        """Test getting specific feed by ID."""
+        mock_request.return_value = api_responses["feed_detail"]
+        
+        client = DatabusClient()
+        feed = client.get_feed("costa-rica-gtfs")
+        
+        assert isinstance(feed, Feed)
+        assert feed.id == "costa-rica-gtfs"
+        assert feed.name == "Costa Rica GTFS"
+        mock_request.assert_called_once_with("GET", "/feeds/costa-rica-gtfs")
+    
+    @patch.object(DatabusClient, '_make_request')
+    def test_get_agencies(self, mock_request, api_responses):
+        """Test getting agencies for a feed."""
+        mock_request.return_value = api_responses["agencies"]
+        
+        client = DatabusClient()
+        agencies = client.get_agencies("costa-rica-gtfs")
+        
+        assert len(agencies) == 1
+        assert isinstance(agencies[0], Agency)
+        assert agencies[0].agency_id == "COSEVI"
+        mock_request.assert_called_once_with("GET", "/feeds/costa-rica-gtfs/agencies")
+    
+    @patch.object(DatabusClient, '_make_request')
+    def test_get_routes_no_filter(self, mock_request):
+        """Test getting routes without filter."""
+        mock_response = {
+            "routes": [
+                {
+                    "route_id": "route_1",
+                    "route_type": 3,
+                    "route_short_name": "R1",
+                    "route_long_name": "Test Route"
+                }
+            ]
+        }
+        mock_request.return_value = mock_response
+        
+        client = DatabusClient()
+        routes = client.get_routes("costa-rica-gtfs")
+        
+        assert len(routes) == 1
+        assert isinstance(routes[0], Route)
+        assert routes[0].route_id == "route_1"
+        mock_request.assert_called_once_with(
+            "GET", "/feeds/costa-rica-gtfs/routes", params={}
+        )
+    
+    @patch.object(DatabusClient, '_make_request')
+    def test_get_routes_with_filters(self, mock_request):
+        """Test getting routes with agency and type filters."""
+        mock_response = {"routes": []}
+        mock_request.return_value = mock_response
+        
+        client = DatabusClient()
+        routes = client.get_routes(
+            "costa-rica-gtfs", 
+            agency_id="COSEVI", 
+            route_type=3
+        )
+        
+        assert len(routes) == 0
+        mock_request.assert_called_once_with(
+            "GET", 
+            "/feeds/costa-rica-gtfs/routes", 
+            params={"agency_id": "COSEVI", "route_type": 3}
+        )
+    
+    @patch.object(DatabusClient, '_make_request')
+    def test_get_stops_no_filter(self, mock_request):
+        """Test getting stops without filter."""
+        mock_response = {
+            "stops": [
+                {
+                    "stop_id": "stop_1",
+                    "stop_name": "Test Stop",
+                    "stop_lat": 9.9281,
+                    "stop_lon": -84.0907
+                }
+            ]
+        }
+        mock_request.return_value = mock_response
+        
+        client = DatabusClient()
+        stops = client.get_stops("costa-rica-gtfs")
+        
+        assert len(stops) == 1
+        assert isinstance(stops[0], Stop)
+        assert stops[0].stop_id == "stop_1"
+        mock_request.assert_called_once_with(
+            "GET", "/feeds/costa-rica-gtfs/stops", params={}
+        )
+    
+    @patch.object(DatabusClient, '_make_request')
+    def test_get_stops_without_validation(self, mock_request):
+        """Test that validate=False builds stops without running validators."""
+        mock_request.return_value = {
+            "stops": [
+                {
+                    "stop_id": "stop_1",
+                    "stop_name": "Test Stop",
+                    "stop_lat": 95.0,
+                    "stop_lon": -84.0907,
+                    "location_type": 9,
+                }
+            ]
+        }
+        
+        client = DatabusClient()
+        stops = client.get_stops("costa-rica-gtfs", validate=False)
+        
+        assert isinstance(stops[0], Stop)
+        assert stops[0].stop_lat == 95.0
+        assert stops[0].zone_id is None
+    
+    @patch.object(DatabusClient, '_make_request')
+    def test_get_stops_as_record(self, mock_request):
+        """Test returning stops as lightweight read-only records."""
+        from dataclasses import FrozenInstanceError
+        from databus.api import StopRecord
+        
+        mock_request.return_value = {
+            "stops": [
+                {
+                    "stop_id": "stop_1",
+                    "stop_name": "Test Stop",
+                    "stop_lat": 9.9281,
+                    "stop_lon": -84.0907,
+                    "unknown_field": "ignored",
+                }
+            ]
+        }
+        
+        client = DatabusClient()
+        stops = client.get_stops("costa-rica-gtfs", as_record=True)
+        
+        assert isinstance(stops[0], StopRecord)
+        assert stops[0].stop_id == "stop_1"
+        with pytest.raises(FrozenInstanceError):
+            stops[0].stop_name = "Changed"
+    
+    @patch.object(DatabusClient, '_make_request')
+    def test_get_stops_table(self, mock_request):
+        """Test returning stops as a column-oriented table."""
+        mock_request.return_value = {
+            "stops": [
+                {"stop_id": "stop_1", "stop_name": "Inside", "stop_lat": 9.93, "stop_lon": -84.09},
+                {"stop_id": "stop_2", "stop_name": "Outside", "stop_lat": 10.5, "stop_lon": -85.0},
+            ]
+        }
+        
+        client = DatabusClient()
+        table = client.get_stops_table("costa-rica-gtfs")
+        
+        assert len(table) == 2
+        assert table.stop_lat.dtype == "float64"
+        
+        inside = table.within_bbox([-84.2, 9.8, -83.9, 10.1])
+        assert list(inside.stop_id) == ["stop_1"]
+        assert inside.to_records()[0].stop_name == "Inside"
+    
+    @patch('requests.Session.get')
+    def test_iter_stops_streaming(self, mock_get):
+        """Test iterating stops from a streamed response body."""
+        pytest.importorskip("ijson")
+        
+        body = {
+            "stops": [
+                {"stop_id": "stop_1", "stop_name": "Stop 1", "stop_lat": 9.9281, "stop_lon": -84.0907},
+                {"stop_id": "stop_2", "stop_name": "Stop 2", "stop_lat": 9.9350, "stop_lon": -84.0830},
+            ]
+        }
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.raw = io.BytesIO(json.dumps(body).encode())
+        mock_get.return_value = mock_response
+        
+        client = DatabusClient()
+        stops = client.iter_stops("costa-rica-gtfs")
+        
+        first = next(stops)
+        assert isinstance(first, Stop)
+        assert first.stop_lat == 9.9281
+        assert [stop.stop_id for stop in stops] == ["stop_2"]
+        assert mock_get.call_args.kwargs["stream"] is True
+    
+    @patch.object(DatabusClient, '_make_request')
+    def test_get_stops_with_bbox(self, mock_request):
+        """Test getting stops with bounding box filter."""
+        mock_response = {"stops": []}
+        mock_request.return_value = mock_response
+        
+        client = DatabusClient()
+        bbox = [-84.2, 9.8, -83.9, 10.1]
+        stops = client.get_stops("costa-rica-gtfs", bbox=bbox)
+        
+        assert len(stops) == 0
+        mock_request.assert_called_once_with(
+            "GET", 
+            "/feeds/costa-rica-gtfs/stops", 
+            params={"bbox": "-84.2,9.8,-83.9,10.1"}
+        )
+    
+    @patch.object(DatabusClient, '_make_request')
+    def test_get_trips(self, mock_request):
+        """Test getting trips."""
+        mock_response = {
+            "trips": [
+                {
+                    "route_id": "route_1",
+                    "service_id": "service_1",
+                    "trip_id": "trip_1",
+                    "trip_headsign": "Downtown"
+                }
+            ]
+        }
+        mock_request.return_value = mock_response
+        
+        client = DatabusClient()
+        trips = client.get_trips("costa-rica-gtfs")
+        
+        assert len(trips) == 1
+        assert isinstance(trips[0], Trip)
+        assert trips[0].trip_id == "trip_1"
+        mock_request.assert_called_once_with(
+            "GET", "/feeds/costa-rica-gtfs/trips", params={}
+        )
+    
+    @patch('requests.Session.get')
+    def test_download_feed_success(self, mock_get, temp_dir):
+        """Test successful feed download."""
+        # Mock response with file content
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.raise_for_status.return_value = None
+        mock_response.raw = io.BytesIO(b"fake gtfs data")
+        mock_response.headers = {"Content-Length": "14"}
+        mock_get.return_value = mock_response
+        
+        client = DatabusClient()
+        output_path = temp_dir / "downloaded_feed.zip"
+        result_path = client.download_feed("costa-rica-gtfs", str(output_path))
+        
+        assert result_path == str(output_path)
+        assert output_path.read_bytes() == b"fake gtfs data"
+        assert not (temp_dir / "downloaded_feed.zip.part").exists()
+        mock_get.assert_called_once()
+        mock_response.raise_for_status.assert_called_once()
+        mock_response.__exit__.assert_called_once()
+    
+    @patch('requests.Session.get')
+    def test_download_feed_http_error_closes_response(self, mock_get, temp_dir):
+        """Test that a failed download closes its response and leaves no file."""
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("404 Not Found")
+        mock_get.return_value = mock_response
+        
+        client = DatabusClient()
+        output_path = temp_dir / "missing_feed.zip"
+        
+        with pytest.raises(DatabusAPIError, match="Failed to download feed"):
+            client.download_feed("missing", str(output_path))
+        
+        mock_response.__exit__.assert_called_once()
+        assert not output_path.exists()
+        assert not (temp_dir / "missing_feed.zip.part").exists()
+    
+    @patch('requests.Session.get')
+    def test_download_feed_request_error(self, mock_get):
+        """Test download feed with request error."""
+        mock_get.side_effect = requests.exceptions.RequestException("Download failed")
+        
+        client = DatabusClient()
+        
+        with pytest.raises(DatabusAPIError, match="Failed to download feed"):
+            client.download_feed("costa-rica-gtfs", "output.zip")
+    
+    @patch.object(DatabusClient, 'download_feed')
+    def test_download_feeds(self, mock_download, temp_dir):
+        """Test downloading several feeds concurrently."""
+        mock_download.side_effect = lambda feed_id, output_path: output_path
+        completed = []
+        
+        client = DatabusClient()
+        results = client.download_feeds(
+            ["feed-a", "feed-b", "feed-c"],
+            temp_dir,
+            concurrency=2,
+            progress_callback=lambda feed_id, path: completed.append(feed_id),
+        )
+        
+        assert set(results) == {"feed-a", "feed-b", "feed-c"}
+        assert results["feed-a"] == str(temp_dir / "feed-a.zip")
+        assert sorted(completed) == ["feed-a", "feed-b", "feed-c"]
+        assert mock_download.call_count == 3
+    
+    @patch.object(DatabusClient, 'download_feed')
+    def test_download_feeds_partial_failure(self, mock_download, temp_dir):
+        """Test that failed downloads are reported with the successful ones."""
+        def download(feed_id, output_path):
+            if feed_id == "feed-b":
+                raise DatabusAPIError("Failed to download feed: 404")
+            return output_path
+        
+        mock_download.side_effect = download
+        completed = []
+        
+        client = DatabusClient()
+        with pytest.raises(FeedDownloadError, match="Failed to download 1 of 3 feeds") as exc_info:
+            client.download_feeds(
+                ["feed-a", "feed-b", "feed-c"],
+                temp_dir,
+                concurrency=1,
+                progress_callback=lambda feed_id, path: completed.append(feed_id),
+            )
+        
+        assert exc_info.value.results == {
+            "feed-a": str(temp_dir / "feed-a.zip"),
+            "feed-c": str(temp_dir / "feed-c.zip"),
+        }
+        assert list(exc_info.value.failures) == ["feed-b"]
+        assert sorted(completed) == ["feed-a", "feed-c"]
+        assert mock_download.call_count == 3
+    
+    def test_httpx_transport(self, api_responses):
+        """Test requests are sent through the httpx HTTP/2 transport."""
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        
+        client = DatabusClient(transport="httpx")
+        assert isinstance(client.session, httpx.Client)
+        
+        response = httpx.Response(
+            200,
+            json=api_responses["feeds"],
+            request=httpx.Request("GET", "https://api.databus.cr/feeds"),
+        )
+        with patch.object(client.session, 'request', return_value=response):
+            feeds = client.get_feeds()
+        
+        assert len(feeds) == len(api_responses["feeds"]["feeds"])
+        client.close()
+    
+    def test_invalid_transport(self):
+        """Test that unknown transports are rejected."""
+        with pytest.raises(ValueError):
+            DatabusClient(transport="pycurl")
+    
+    def test_url_construction(self):
+        """Test URL construction for different endpoints."""
+        client = DatabusClient(base_url="https://api.test.com")
+        
+        with patch.object(client, '_make_request') as mock_request:
+            # Test that URLs are constructed correctly
+            client.get_feeds()
+            args = mock_request.call_args
+            # The _make_request should be called with the endpoint
+            assert args[0] == ("GET", "/feeds")
+    
+    def test_url_keeps_base_path(self):
+        """Test that endpoint URLs keep the path portion of the base URL."""
+        client = DatabusClient(base_url="https://api.test.com/api/v1")
+        assert client._url("/feeds/test/download") == "https://api.test.com/api/v1/feeds/test/download"
+        assert client._url("feeds") == "https://api.test.com/api/v1/feeds"
+    
+    def test_url_rejects_absolute_endpoint(self):
+        """Test that absolute URLs are not accepted as endpoints."""
+        client = DatabusClient(base_url="https://api.test.com")
+        with pytest.raises(ValueError):
+            client._url("https://other.example.com/feeds")
+    
+    def test_base_url_trailing_slash(self):
+        """Test that trailing slash is removed from base URL."""
+        client = DatabusClient(base_url="https://api.test.com/")
+        assert client.base_url == "https://api.test.com"
+
+
+class TestAsyncDatabusClient:
+    """Test cases for AsyncDatabusClient class."""
+    
+    def test_get_feed_bundle(self, api_responses):
+        """Test fetching a feed bundle runs all endpoint calls."""
+        pytest.importorskip("aiohttp")
+        import asyncio
+        from databus.api import AsyncDatabusClient
+        
+        responses = {
+            "/feeds/costa-rica-gtfs/agencies": api_responses["agencies"],
+            "/feeds/costa-rica-gtfs/routes": {"routes": []},
+            "/feeds/costa-rica-gtfs/stops": {"stops": []},
+            "/feeds/costa-rica-gtfs/trips": {"trips": []},
+        }
+        
+        async def fake_request(method, endpoint, params=None, data=None):
+            return responses[endpoint]
+        
+        client = AsyncDatabusClient()
+        with patch.object(client, '_make_request', side_effect=fake_request) as mock_request:
+            bundle = asyncio.run(client.get_feed_bundle("costa-rica-gtfs"))
+        
+        assert set(bundle) == {"agencies", "routes", "stops", "trips"}
+        assert isinstance(bundle["agencies"][0], Agency)
+        assert mock_request.call_count == 4
+    
+    def test_make_request_http_error(self):
+        """Test that HTTP errors keep the base URL path and the status code."""
+        aiohttp = pytest.importorskip("aiohttp")
+        import asyncio
+        from databus.api import AsyncDatabusClient
+        
+        response = MagicMock()
+        response.raise_for_status.side_effect = aiohttp.ClientResponseError(
+            request_info=Mock(), history=(), status=404, message="Not Found"
+        )
+        request_context = MagicMock()
+        request_context.__aenter__.return_value = response
+        session = Mock()
+        session.request.return_value = request_context
+        
+        client = AsyncDatabusClient(base_url="https://api.test.com/api/v1/")
+        with patch.object(client, '_get_session', return_value=session):
+            with pytest.raises(DatabusAPIError) as exc_info:
+                asyncio.run(client._make_request("GET", "/feeds/missing"))
+        
+        assert exc_info.value.status_code == 404
+        assert session.request.call_args[0] == ("GET", "https://api.test.com/api/v1/feeds/missing")
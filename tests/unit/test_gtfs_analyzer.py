@@ -0,0 +1,189 @@
+"""Unit tests for GTFSAnalyzer class."""
+
+import pytest
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+import gtfs_kit as gk
+
+from databus.gtfs import GTFSAnalyzer, GTFSProcessor
+from databus.gtfs import analyzer as analyzer_module
+from databus.gtfs.analyzer import _pairwise_distance_stats, _sorted_group_diff_stats
+from databus.utils.helpers import _EARTH_RADIUS_KM, calculate_distance
+
+
+# Length of one degree of arc on the Earth's surface, in meters
+_DEGREE_M = _EARTH_RADIUS_KM * np.pi / 180 * 1000
+
+
+@pytest.fixture
+def sample_analyzer(sample_gtfs_data):
+    """Create an analyzer over the sample feed with extra trips.
+    
+    route_1 gets a third trip starting 08:40, so its trips start at 08:00,
+    08:10 and 08:40. route_2 gets a single trip departing 09:00 and 12:00.
+    """
+    trips = pd.concat([sample_gtfs_data["trips"], pd.DataFrame([
+        {"route_id": "route_1", "service_id": "service_1", "trip_id": "trip_3", "direction_id": 0},
+        {"route_id": "route_2", "service_id": "service_1", "trip_id": "trip_4", "direction_id": 0},
+    ])], ignore_index=True)
+    stop_times = pd.concat([sample_gtfs_data["stop_times"], pd.DataFrame([
+        {"trip_id": "trip_3", "arrival_time": "08:40:00", "departure_time": "08:40:00",
+         "stop_id": "stop_1", "stop_sequence": 1},
+        {"trip_id": "trip_3", "arrival_time": "08:45:00", "departure_time": "08:45:00",
+         "stop_id": "stop_2", "stop_sequence": 2},
+        {"trip_id": "trip_4", "arrival_time": "09:00:00", "departure_time": "09:00:00",
+         "stop_id": "stop_3", "stop_sequence": 1},
+        {"trip_id": "trip_4", "arrival_time": "12:00:00", "departure_time": "12:00:00",
+         "stop_id": "stop_2", "stop_sequence": 2},
+    ])], ignore_index=True)
+    
+    processor = GTFSProcessor()
+    processor.feed = gk.Feed(
+        dist_units="km",
+        **dict(sample_gtfs_data, trips=trips, stop_times=stop_times),
+    )
+    processor._is_loaded = True
+    return GTFSAnalyzer(processor)
+
+
+class TestGTFSAnalyzer:
+    """Test cases for GTFSAnalyzer class."""
+    
+    def test_sorted_group_diff_stats(self):
+        """Test per-group counts and consecutive differences."""
+        codes = np.array([0, 0, 0, 1, 2, 2])
+        values = np.array([0.0, 10.0, 30.0, 5.0, 100.0, 100.0])
+        
+        count, mean, minimum, maximum = _sorted_group_diff_stats(codes, values, 4)
+        
+        # Group 1 has a single value and group 3 none, so they have no differences
+        np.testing.assert_array_equal(count, [3, 1, 2, 0])
+        np.testing.assert_array_equal(mean, [15.0, np.nan, 0.0, np.nan])
+        np.testing.assert_array_equal(minimum, [10.0, np.nan, 0.0, np.nan])
+        np.testing.assert_array_equal(maximum, [20.0, np.nan, 0.0, np.nan])
+    
+    def test_pairwise_distance_stats(self):
+        """Test mean, min and max distance over all pairs of points."""
+        # Five points one degree apart along the equator: 10 pairs at
+        # 1, 2, 3 and 4 degrees, occurring 4, 3, 2 and 1 times
+        lat = np.zeros(5)
+        lon = np.arange(5, dtype=np.float64)
+        
+        mean, minimum, maximum = _pairwise_distance_stats(lat, lon)
+        
+        assert mean == pytest.approx(2 * _DEGREE_M)
+        assert minimum == pytest.approx(_DEGREE_M)
+        assert maximum == pytest.approx(4 * _DEGREE_M)
+    
+    def test_pairwise_distance_stats_blocks(self):
+        """Test that every pair is visited once when rows span several blocks."""
+        lat = np.array([9.93, 9.94, 9.95, 9.96, 9.97])
+        lon = np.array([-84.09, -84.07, -84.08, -84.05, -84.06])
+        expected = _pairwise_distance_stats(lat, lon)
+        
+        # Two rows per block: blocks [0, 2) and [2, 4), the last point is
+        # only reached through the pairs with later points
+        with patch.object(analyzer_module, '_PAIRWISE_BLOCK_SIZE', 10):
+            blocked = _pairwise_distance_stats(lat, lon)
+        
+        assert blocked == pytest.approx(expected)
+        
+        pairs = [(i, j) for i in range(5) for j in range(i + 1, 5)]
+        distances = [calculate_distance(lat[i], lon[i], lat[j], lon[j]) * 1000 for i, j in pairs]
+        assert blocked == pytest.approx((np.mean(distances), min(distances), max(distances)))
+    
+    def test_pairwise_distance_stats_single_point(self):
+        """Test that fewer than two points have no pairwise distances."""
+        assert _pairwise_distance_stats(np.array([9.93]), np.array([-84.09])) == (0.0, 0.0, 0.0)
+    
+    def test_analyze_stop_coverage_sample(self, sample_analyzer):
+        """Test that pairwise distances skip unlocated stops and are sampled."""
+        stops = sample_analyzer.processor.feed.stops
+        sample_analyzer.processor.feed.stops = pd.concat([
+            stops.iloc[:1],
+            pd.DataFrame([{"stop_id": "station_entrance", "stop_name": "Entrance", "stop_lat": None, "stop_lon": None}]),
+            stops.iloc[1:],
+        ], ignore_index=True)
+        
+        # The unlocated stop is dropped before the first two stops are sampled
+        with patch.object(analyzer_module, '_COVERAGE_SAMPLE_SIZE', 2):
+            result = sample_analyzer.analyze_stop_coverage()
+        
+        distance = calculate_distance(
+            stops.loc[0, "stop_lat"], stops.loc[0, "stop_lon"],
+            stops.loc[1, "stop_lat"], stops.loc[1, "stop_lon"],
+        ) * 1000
+        assert result["total_stops"] == 4
+        assert result["average_stop_distance_m"] == pytest.approx(distance)
+        assert result["min_stop_distance_m"] == pytest.approx(distance)
+        assert result["max_stop_distance_m"] == pytest.approx(distance)
+        assert not np.isnan(result["coverage_area_km2"])
+    
+    def test_analyze_service_frequency(self, sample_analyzer):
+        """Test headways between consecutive trip starts of each route."""
+        result = sample_analyzer.analyze_service_frequency()
+        
+        # route_1 trips start at 08:00, 08:10 and 08:40
+        route_1 = result["by_route"]["route_1"]
+        assert route_1["route_name"] == "Test Route 1"
+        assert route_1["total_trips"] == 3
+        assert route_1["min_headway_minutes"] == 10
+        assert route_1["average_headway_minutes"] == 20
+        assert route_1["max_headway_minutes"] == 30
+        
+        # A single trip has no headway
+        route_2 = result["by_route"]["route_2"]
+        assert route_2["total_trips"] == 1
+        assert route_2["min_headway_minutes"] is None
+        assert route_2["average_headway_minutes"] is None
+        assert route_2["max_headway_minutes"] is None
+        
+        assert result["overall"]["total_routes_analyzed"] == 2
+        assert result["overall"]["average_trips_per_route"] == 2
+    
+    def test_find_service_gaps(self, sample_analyzer):
+        """Test gaps between consecutive departures of each route."""
+        result = sample_analyzer.find_service_gaps(min_headway_minutes=20)
+        
+        # route_1 departs every 5 minutes from 08:00 to 08:15, then at 08:40
+        assert result["threshold_minutes"] == 20
+        assert result["routes_with_gaps"] == 2
+        route_1 = result["gaps_by_route"]["route_1"]
+        assert route_1["gaps_found"] == 1
+        assert route_1["largest_gap_minutes"] == 25
+        assert route_1["average_gap_minutes"] == 25
+        assert route_1["gap_times"] == [
+            {"start_time": "08:15:00", "end_time": "08:40:00", "duration_minutes": 25.0},
+        ]
+        
+        route_2 = result["gaps_by_route"]["route_2"]
+        assert route_2["gap_times"] == [
+            {"start_time": "09:00:00", "end_time": "12:00:00", "duration_minutes": 180.0},
+        ]
+        
+        # Raising the threshold above 25 minutes leaves only route_2
+        assert list(sample_analyzer.find_service_gaps(min_headway_minutes=30)["gaps_by_route"]) == ["route_2"]
+    
+    def test_analyze_route_efficiency(self, sample_analyzer, sample_gtfs_data):
+        """Test per-route stop counts, trip durations and lengths."""
+        result = sample_analyzer.analyze_route_efficiency()
+        stops = sample_gtfs_data["stops"].set_index("stop_id")
+        
+        def stop_distance(a, b):
+            return calculate_distance(
+                stops.loc[a, "stop_lat"], stops.loc[a, "stop_lon"],
+                stops.loc[b, "stop_lat"], stops.loc[b, "stop_lon"],
+            )
+        
+        # route_1 visits stop_1 then stop_2 on most trips, 5 minutes each
+        route_1 = result["by_route"]["route_1"]
+        assert route_1["unique_stops"] == 2
+        assert route_1["total_trips"] == 3
+        assert route_1["average_trip_duration_minutes"] == pytest.approx(5.0)
+        assert route_1["approximate_length_km"] == pytest.approx(stop_distance("stop_1", "stop_2"))
+        assert route_1["stops_per_km"] == pytest.approx(2 / stop_distance("stop_1", "stop_2"))
+        
+        route_2 = result["by_route"]["route_2"]
+        assert route_2["average_trip_duration_minutes"] == pytest.approx(180.0)
+        assert route_2["approximate_length_km"] == pytest.approx(stop_distance("stop_3", "stop_2"))
@@ -0,0 +1,51 @@
+"""Unit tests for GTFSConverter class."""
+
+import pytest
+import pandas as pd
+import gtfs_kit as gk
+
+from databus.gtfs import GTFSConverter, GTFSProcessor
+
+
+@pytest.fixture
+def cached_processor(sample_gtfs_data, temp_dir):
+    """Create a processor whose feed is backed by a Feather cache."""
+    processor = GTFSProcessor()
+    processor.feed = gk.Feed(dist_units="km", **sample_gtfs_data)
+    processor._is_loaded = True
+    processor.cache_to_feather(temp_dir / "cache")
+    
+    loaded = GTFSProcessor()
+    loaded.load_from_feather(temp_dir / "cache")
+    return loaded
+
+
+class TestGTFSConverter:
+    """Test cases for GTFSConverter class."""
+    
+    def test_to_csv_from_feather_cache(self, cached_processor, sample_gtfs_data, temp_dir):
+        """Test exporting a feed read straight from its Feather cache."""
+        assert cached_processor.get_feather_cache_dir() is not None
+        
+        files = GTFSConverter(cached_processor).to_csv(temp_dir / "csv")
+        
+        assert set(files) == set(sample_gtfs_data)
+        assert len(pd.read_csv(files["stops"])) == len(sample_gtfs_data["stops"])
+    
+    def test_to_csv_after_table_edit(self, cached_processor, temp_dir):
+        """Test that a replaced table is exported instead of the cached one."""
+        cached_processor.feed.stops = cached_processor.feed.stops.iloc[:1]
+        
+        assert cached_processor.get_feather_cache_dir() is None
+        
+        files = GTFSConverter(cached_processor).to_csv(temp_dir / "csv")
+        
+        assert pd.read_csv(files["stops"])["stop_id"].tolist() == ["stop_1"]
+    
+    def test_to_parquet_after_table_edit(self, cached_processor, temp_dir):
+        """Test that Parquet exports also follow edits to the feed tables."""
+        cached_processor.feed.routes = cached_processor.feed.routes.iloc[1:]
+        
+        files = GTFSConverter(cached_processor).to_parquet(temp_dir / "parquet")
+        
+        assert pd.read_parquet(files["routes"])["route_id"].tolist() == ["route_2"]
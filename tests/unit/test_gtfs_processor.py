@@ -3,9 +3,12 @@
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import pandas as pd
+import gtfs_kit as gk
+import os
 from pathlib import Path
 
 from databus.gtfs import GTFSProcessor
+from databus.gtfs.processor import _feed_cache_key
 from databus.utils.exceptions import GTFSProcessingError
 
 
@@ -27,18 +30,70 @@ class TestGTFSProcessor:
         assert processor.feed is None
         assert processor._is_loaded is False
     
-    @patch('databus.gtfs.processor.gk.read_gtfs')
-    def test_load_feed_success(self, mock_read_gtfs, sample_gtfs_feed):
+    @patch('databus.gtfs.processor.gk.read_feed')
+    def test_load_feed_success(self, mock_read_feed, sample_gtfs_feed, sample_gtfs_zip):
         """Test successful feed loading."""
-        mock_read_gtfs.return_value = sample_gtfs_feed
+        mock_read_feed.return_value = sample_gtfs_feed
         
         processor = GTFSProcessor()
-        processor.load_feed("test_feed.zip")
+        processor.load_feed(sample_gtfs_zip, engine="gtfs_kit")
         
         assert processor._is_loaded is True
         assert processor.feed == sample_gtfs_feed
-        assert processor.feed_path == Path("test_feed.zip")
-        mock_read_gtfs.assert_called_once_with("test_feed.zip")
+        assert processor.feed_path == sample_gtfs_zip
+        mock_read_feed.assert_called_once_with(sample_gtfs_zip, dist_units="km")
+    
+    def test_load_feed_pyarrow(self, sample_gtfs_zip, sample_gtfs_data):
+        """Test loading a feed ZIP with the pyarrow engine."""
+        processor = GTFSProcessor()
+        processor.load_feed(sample_gtfs_zip)
+        
+        assert processor._is_loaded is True
+        assert set(processor.to_dict()) == set(sample_gtfs_data)
+        assert processor.feed.stops["stop_lat"].dtype == "float64"
+        assert processor.feed.routes["route_type"].dtype == "Int8"
+        assert list(processor.feed.stop_times["trip_id"]) == list(sample_gtfs_data["stop_times"]["trip_id"])
+    
+    def test_load_feed_cache_dir(self, sample_gtfs_zip, temp_dir):
+        """Test feed files are cached on first load and read back afterwards."""
+        first = GTFSProcessor()
+        first.load_feed(sample_gtfs_zip, cache_dir=temp_dir / "cache")
+        
+        feed_cache = first.get_feather_cache_dir()
+        assert feed_cache is not None
+        assert feed_cache.parent == temp_dir / "cache"
+        
+        second = GTFSProcessor()
+        with patch.object(GTFSProcessor, 'load_from_feather', autospec=True,
+                          side_effect=GTFSProcessor.load_from_feather) as mock_load:
+            second.load_feed(sample_gtfs_zip, cache_dir=temp_dir / "cache")
+        
+        mock_load.assert_called_once_with(second, feed_cache)
+        assert second.feed_path == sample_gtfs_zip
+        pd.testing.assert_frame_equal(second.get_stop_times(), first.get_stop_times())
+    
+    def test_feed_cache_key_tail(self, temp_dir):
+        """Test the feed cache key changes with content past the first MiB."""
+        first = temp_dir / "first.zip"
+        second = temp_dir / "second.zip"
+        first.write_bytes(b"a" * (2 << 20))
+        second.write_bytes(b"a" * ((2 << 20) - 1) + b"b")
+        for path in (first, second):
+            os.utime(path, ns=(0, 0))
+        
+        assert _feed_cache_key(first) != _feed_cache_key(second)
+        
+        # Rewriting a file in place changes its modification time
+        key = _feed_cache_key(second)
+        os.utime(second, ns=(1, 1))
+        assert _feed_cache_key(second) != key
+    
+    def test_load_feed_invalid_engine(self, sample_gtfs_zip):
+        """Test loading feed with an unknown engine."""
+        processor = GTFSProcessor()
+        
+        with pytest.raises(ValueError, match="Unsupported engine"):
+            processor.load_feed(sample_gtfs_zip, engine="polars")
     
     def test_load_feed_no_path(self):
         """Test loading feed without providing path."""
@@ -54,15 +109,15 @@ class TestGTFSProcessor:
         with pytest.raises(GTFSProcessingError, match="Feed path does not exist"):
             processor.load_feed("nonexistent.zip")
     
-    @patch('databus.gtfs.processor.gk.read_gtfs')
-    def test_load_feed_gtfs_error(self, mock_read_gtfs):
+    @patch('databus.gtfs.processor.gk.read_feed')
+    def test_load_feed_gtfs_error(self, mock_read_feed, sample_gtfs_zip):
         """Test handling of gtfs-kit errors during loading."""
-        mock_read_gtfs.side_effect = Exception("Invalid GTFS file")
+        mock_read_feed.side_effect = Exception("Invalid GTFS file")
         
         processor = GTFSProcessor()
         
         with pytest.raises(GTFSProcessingError, match="Failed to load GTFS feed"):
-            processor.load_feed("invalid_feed.zip")
+            processor.load_feed(sample_gtfs_zip, engine="gtfs_kit")
     
     def test_ensure_loaded_not_loaded(self):
         """Test _ensure_loaded when no feed is loaded."""
@@ -114,21 +169,28 @@ class TestGTFSProcessor:
         assert "stop_lon" in stops.columns
     
     @patch('databus.gtfs.processor.gpd.GeoDataFrame')
-    @patch('databus.gtfs.processor.Point')
-    def test_get_stops_geodataframe(self, mock_point, mock_geodataframe, mock_gtfs_processor):
+    @patch('databus.gtfs.processor.gpd.points_from_xy')
+    def test_get_stops_geodataframe(self, mock_points_from_xy, mock_geodataframe, mock_gtfs_processor):
         """Test getting stops as GeoDataFrame."""
         processor = GTFSProcessor()
         processor.feed = mock_gtfs_processor.feed
         processor._is_loaded = True
         
-        # Mock Point creation
-        mock_point.return_value = Mock()
+        # Mock geometry creation
+        mock_points_from_xy.return_value = Mock()
         mock_geodataframe.return_value = Mock()
         
         stops = processor.get_stops(as_geodataframe=True)
         
-        # Verify Point was called for each stop
-        assert mock_point.call_count == len(mock_gtfs_processor.feed.stops)
+        # Verify all Points were built in a single call from coordinate arrays
+        mock_points_from_xy.assert_called_once()
+        lons, lats = mock_points_from_xy.call_args[0]
+        assert lons.tolist() == mock_gtfs_processor.feed.stops["stop_lon"].tolist()
+        assert lats.tolist() == mock_gtfs_processor.feed.stops["stop_lat"].tolist()
+        mock_geodataframe.assert_called_once()
+        
+        # The GeoDataFrame is reused while the stops table is unchanged
+        assert processor.get_stops(as_geodataframe=True) is stops
         mock_geodataframe.assert_called_once()
     
     def test_get_trips_no_filter(self, mock_gtfs_processor):
@@ -172,6 +234,41 @@ class TestGTFSProcessor:
         stop_times = processor.get_stop_times(trip_id="trip_1")
         assert isinstance(stop_times, pd.DataFrame)
         assert all(stop_times["trip_id"] == "trip_1")
+        
+        missing = processor.get_stop_times(trip_id="nonexistent")
+        assert missing.empty
+        assert list(missing.columns) == list(stop_times.columns)
+    
+    def test_get_stop_time_seconds(self, mock_gtfs_processor):
+        """Test stop times are parsed to seconds once and cached."""
+        processor = GTFSProcessor()
+        processor.feed = mock_gtfs_processor.feed
+        processor._is_loaded = True
+        
+        seconds = processor.get_stop_time_seconds()
+        
+        assert seconds["arrival_seconds"].tolist() == [28800, 29100, 29400, 29700]
+        assert str(seconds["departure_seconds"].dtype) == "Int32"
+        assert processor.get_stop_time_seconds() is seconds
+    
+    def test_get_shapes_geodataframe(self, sample_gtfs_data):
+        """Test shape points are assembled into ordered LineStrings."""
+        shapes = pd.DataFrame({
+            "shape_id": ["shape_2", "shape_1", "shape_1", "shape_2", "shape_1"],
+            "shape_pt_sequence": [2, 3, 1, 1, 2],
+            "shape_pt_lat": [9.93, 9.94, 9.92, 9.92, 9.93],
+            "shape_pt_lon": [-84.08, -84.07, -84.09, -84.09, -84.08],
+        })
+        processor = GTFSProcessor()
+        processor.feed = gk.Feed(dist_units="km", shapes=shapes, **sample_gtfs_data)
+        processor._is_loaded = True
+        
+        shapes_gdf = processor.get_shapes(as_geodataframe=True)
+        
+        assert list(shapes_gdf["shape_id"]) == ["shape_1", "shape_2"]
+        assert list(shapes_gdf.geometry.iloc[0].coords) == [(-84.09, 9.92), (-84.08, 9.93), (-84.07, 9.94)]
+        assert shapes_gdf.crs == "EPSG:4326"
+        assert processor.get_shapes(as_geodataframe=True) is shapes_gdf
     
     def test_get_shapes_empty(self, mock_gtfs_processor):
         """Test getting shapes when none exist."""
@@ -217,6 +314,33 @@ class TestGTFSProcessor:
         assert "unique_stops" in route_stats
         assert "directions" in route_stats
     
+    def test_stats_are_cached_per_feed(self, mock_gtfs_processor, sample_gtfs_data):
+        """Test that feed and route statistics are reused until the feed changes."""
+        processor = GTFSProcessor()
+        processor.feed = mock_gtfs_processor.feed
+        processor._is_loaded = True
+        
+        with patch.object(processor, '_compute_feed_stats', wraps=processor._compute_feed_stats) as mock_compute:
+            assert processor.get_feed_stats() == processor.get_feed_stats()
+        mock_compute.assert_called_once()
+        
+        # Callers get copies they may change freely
+        stats = processor.get_feed_stats()
+        routes_by_type = dict(stats["routes_by_type"])
+        stats["routes_by_type"].clear()
+        route_stats = processor.get_route_stats("route_1")
+        route_stats["total_trips"] = 0
+        assert processor.get_feed_stats()["routes_by_type"] == routes_by_type
+        assert processor.get_route_stats("route_1")["total_trips"] == 2
+        
+        # Replacing a single table invalidates the statistics
+        processor.feed.trips = processor.feed.trips.iloc[:1]
+        assert processor.get_feed_stats()["trips"] == 1
+        assert processor.get_route_stats("route_1")["total_trips"] == 1
+        
+        processor.feed = gk.Feed(dist_units="km", **dict(sample_gtfs_data, agency=None))
+        assert processor.get_feed_stats()["agencies"] == 0
+    
     def test_get_route_stats_invalid_route(self, mock_gtfs_processor):
         """Test getting statistics for non-existent route."""
         processor = GTFSProcessor()
@@ -226,28 +350,26 @@ class TestGTFSProcessor:
         with pytest.raises(GTFSProcessingError, match="Route nonexistent not found"):
             processor.get_route_stats("nonexistent")
     
-    @patch('databus.gtfs.processor.gk.filter_by_bounding_box')
-    def test_filter_by_bounding_box(self, mock_filter, mock_gtfs_processor):
+    def test_filter_by_bounding_box(self, mock_gtfs_processor):
         """Test filtering feed by bounding box."""
-        mock_filter.return_value = mock_gtfs_processor.feed
-        
         processor = GTFSProcessor()
         processor.feed = mock_gtfs_processor.feed
         processor._is_loaded = True
         
-        filtered = processor.filter_by_bounding_box(9.9, -84.1, 10.0, -84.0)
+        filtered = processor.filter_by_bounding_box(9.93, -84.085, 9.95, -84.07)
         
         assert isinstance(filtered, GTFSProcessor)
         assert filtered._is_loaded is True
-        mock_filter.assert_called_once_with(
-            mock_gtfs_processor.feed, -84.1, 9.9, -84.0, 10.0
-        )
+        assert filtered.feed.trips["trip_id"].tolist() == ["trip_1", "trip_2"]
+        assert set(filtered.feed.stop_times["trip_id"]) == {"trip_1", "trip_2"}
+        
+        # Nothing is left when the box contains no stops
+        empty = processor.filter_by_bounding_box(0.0, 0.0, 1.0, 1.0)
+        assert empty.feed.trips.empty
+        assert empty.feed.stop_times.empty
     
-    @patch('databus.gtfs.processor.gk.filter_by_dates')
-    def test_filter_by_dates(self, mock_filter, mock_gtfs_processor):
+    def test_filter_by_dates(self, mock_gtfs_processor):
         """Test filtering feed by date range."""
-        mock_filter.return_value = mock_gtfs_processor.feed
-        
         processor = GTFSProcessor()
         processor.feed = mock_gtfs_processor.feed
         processor._is_loaded = True
@@ -256,9 +378,35 @@ class TestGTFSProcessor:
         
         assert isinstance(filtered, GTFSProcessor)
         assert filtered._is_loaded is True
-        mock_filter.assert_called_once_with(
-            mock_gtfs_processor.feed, "20240101", "20241231"
+        assert filtered.feed.trips["trip_id"].tolist() == ["trip_1", "trip_2"]
+        assert set(filtered.feed.stop_times["trip_id"]) == {"trip_1", "trip_2"}
+        assert filtered.feed.routes["route_id"].tolist() == ["route_1"]
+        
+        # Same semantics as the date predicate of the fused filter
+        outside = processor.filter_by_dates("2025-03-01", "2025-03-31")
+        assert outside.feed.trips.empty
+        assert outside.feed.stop_times.empty
+    
+    def test_filter_bbox_and_dates(self, mock_gtfs_processor):
+        """Test filtering by bounding box and date range in one pass."""
+        processor = GTFSProcessor()
+        processor.feed = mock_gtfs_processor.feed
+        processor._is_loaded = True
+        
+        filtered = processor.filter(
+            bbox=(-84.085, 9.93, -84.07, 9.95),
+            dates=("2024-03-01", "2024-03-31"),
         )
+        
+        assert filtered._is_loaded is True
+        assert filtered.feed.trips["trip_id"].tolist() == ["trip_1", "trip_2"]
+        assert filtered.feed.routes["route_id"].tolist() == ["route_1"]
+        assert "stop_3" not in filtered.feed.stops["stop_id"].tolist()
+        
+        # No service runs outside the calendar period
+        outside = processor.filter(dates=("2025-03-01", "2025-03-31"))
+        assert outside.feed.trips.empty
+        assert outside.feed.stop_times.empty
     
     @patch('databus.gtfs.processor.gk.write_gtfs')
     def test_export_to_zip(self, mock_write, mock_gtfs_processor, temp_dir):
@@ -273,6 +421,26 @@ class TestGTFSProcessor:
         assert result_path == output_path
         mock_write.assert_called_once_with(mock_gtfs_processor.feed, str(output_path))
     
+    def test_feather_cache_roundtrip(self, sample_gtfs_data, temp_dir):
+        """Test caching a feed to Feather files and loading it back."""
+        processor = GTFSProcessor()
+        processor.feed = gk.Feed(dist_units="km", **sample_gtfs_data)
+        processor._is_loaded = True
+        
+        cache_dir = processor.cache_to_feather(temp_dir / "cache")
+        
+        assert (cache_dir / "stop_times.feather").exists()
+        assert processor.get_feather_cache_dir() == cache_dir
+        
+        cached = GTFSProcessor()
+        cached.load_from_feather(cache_dir)
+        
+        pd.testing.assert_frame_equal(cached.get_stop_times(), processor.get_stop_times())
+        assert cached.feed.dist_units == "km"
+        
+        with pytest.raises(GTFSProcessingError, match="No Feather cache found"):
+            GTFSProcessor().load_from_feather(temp_dir / "missing")
+    
     def test_to_dict(self, mock_gtfs_processor):
         """Test converting feed to dictionary."""
         processor = GTFSProcessor()
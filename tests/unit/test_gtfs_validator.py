@@ -0,0 +1,255 @@
+"""Unit tests for GTFSValidator class."""
+
+import threading
+import time
+
+import pytest
+import pandas as pd
+import gtfs_kit as gk
+
+from databus.gtfs import GTFSProcessor, GTFSValidator
+from databus.validation import StandardRules, ValidationRule
+
+
+@pytest.fixture
+def sample_processor(sample_gtfs_data):
+    """Create a processor over the sample feed."""
+    processor = GTFSProcessor()
+    processor.feed = gk.Feed(dist_units="km", **sample_gtfs_data)
+    processor._is_loaded = True
+    return processor
+
+
+@pytest.fixture
+def messy_stop_times_processor(sample_gtfs_data):
+    """Create a processor whose stop_times have nulls and malformed times.
+    
+    trip_3 goes back from +1:00:00 (one hour) to 00:30:00. trip_4 has two
+    stops without stop_sequence timed before its first stop. trip_5 repeats
+    stop_sequence 1 and has no usable times, and two stop times without a
+    trip_id share stop_sequence 1.
+    """
+    trips = pd.concat([sample_gtfs_data["trips"], pd.DataFrame([
+        {"route_id": "route_1", "service_id": "service_1", "trip_id": trip_id, "direction_id": 0}
+        for trip_id in ("trip_3", "trip_4", "trip_5")
+    ])], ignore_index=True)
+    rows = [
+        ("trip_3", "+1:00:00", "stop_1", 1),
+        ("trip_3", "00:30:00", "stop_2", 2),
+        ("trip_4", "07:00:00", "stop_1", 1),
+        ("trip_4", "06:00:00", "stop_2", None),
+        ("trip_4", "06:30:00", "stop_3", None),
+        ("trip_5", "", "stop_1", 1),
+        ("trip_5", None, "stop_2", 1),
+        ("trip_5", "8:5:00", "stop_3", 2),
+        (None, "09:00:00", "stop_1", 1),
+        (None, "09:00:00", "stop_missing", 1),
+    ]
+    stop_times = pd.concat([sample_gtfs_data["stop_times"], pd.DataFrame([
+        {"trip_id": trip_id, "arrival_time": arrival, "departure_time": arrival,
+         "stop_id": stop_id, "stop_sequence": sequence}
+        for trip_id, arrival, stop_id, sequence in rows
+    ])], ignore_index=True)
+    stop_times["stop_sequence"] = stop_times["stop_sequence"].astype("Int64")
+    
+    processor = GTFSProcessor()
+    processor.feed = gk.Feed(
+        dist_units="km",
+        **dict(sample_gtfs_data, trips=trips, stop_times=stop_times),
+    )
+    processor._is_loaded = True
+    return processor
+
+
+class TestGTFSValidator:
+    """Test cases for GTFSValidator class."""
+    
+    def test_custom_rules_are_not_thread_safe_by_default(self):
+        """Test that custom rules must opt in to concurrent execution."""
+        rule = ValidationRule("custom", "Custom rule", lambda feed: [])
+        
+        assert rule.thread_safe is False
+    
+    def test_unsafe_rules_run_before_pooled_rules(self, sample_processor):
+        """Test that unsafe rules never overlap with other rules."""
+        events = []
+        lock = threading.Lock()
+        
+        def safe_rule(feed):
+            with lock:
+                events.append("safe_start")
+            time.sleep(0.01)
+            with lock:
+                events.append("safe_end")
+            return [{"message": "safe"}]
+        
+        def unsafe_rule(name):
+            def validate(feed):
+                with lock:
+                    events.append(name)
+                return [{"message": name}]
+            return validate
+        
+        validator = GTFSValidator(sample_processor)
+        validator.add_custom_rule(ValidationRule("safe_a", "Safe", safe_rule, severity="info", thread_safe=True))
+        validator.add_custom_rule(ValidationRule("unsafe_a", "Unsafe", unsafe_rule("unsafe_a"), severity="info"))
+        validator.add_custom_rule(ValidationRule("safe_b", "Safe", safe_rule, severity="info", thread_safe=True))
+        validator.add_custom_rule(ValidationRule("unsafe_b", "Unsafe", unsafe_rule("unsafe_b"), severity="info"))
+        
+        report = validator.validate()
+        
+        # Unsafe rules ran one after the other before any pooled rule started
+        assert events[:2] == ["unsafe_a", "unsafe_b"]
+        assert events[2:].count("safe_start") == 2
+        
+        # Issues are still reported in rule order
+        custom = [issue["rule"] for issue in report.notices if issue["rule"] in {"safe_a", "safe_b", "unsafe_a", "unsafe_b"}]
+        assert custom == ["safe_a", "unsafe_a", "safe_b", "unsafe_b"]
+    
+    def test_failing_unsafe_rule_is_reported(self, sample_processor):
+        """Test that an exception in an unsafe rule becomes an error issue."""
+        def broken(feed):
+            raise RuntimeError("boom")
+        
+        validator = GTFSValidator(sample_processor)
+        validator.add_custom_rule(ValidationRule("broken", "Broken", broken))
+        
+        report = validator.validate()
+        
+        assert report.status == "invalid"
+        assert any(
+            issue["rule"] == "broken" and "boom" in issue["message"]
+            for issue in report.errors
+        )
+    
+    def test_missing_coordinates_are_not_out_of_range(self, sample_gtfs_data):
+        """Test that both rule sets only count present out-of-range coordinates."""
+        stops = pd.concat([sample_gtfs_data["stops"], pd.DataFrame([
+            {"stop_id": "node_1", "stop_name": "Generic node", "stop_lat": None, "stop_lon": None, "location_type": 3},
+            {"stop_id": "stop_far", "stop_name": "Far away", "stop_lat": 95.0, "stop_lon": -200.0},
+        ])], ignore_index=True)
+        feed = gk.Feed(dist_units="km", **dict(sample_gtfs_data, stops=stops))
+        processor = GTFSProcessor()
+        processor.feed = feed
+        processor._is_loaded = True
+        
+        report = GTFSValidator(processor).validate()
+        standard = StandardRules.coordinate_validity_rule().validate_func(feed)
+        
+        coordinate_issues = [
+            {'message': issue['message'], 'details': issue['details']}
+            for issue in report.get_issues_by_rule("coordinate_validity")
+        ]
+        assert coordinate_issues == standard == [
+            {'message': "Invalid latitudes found: 1 stops", 'details': {'count': 1}},
+            {'message': "Invalid longitudes found: 1 stops", 'details': {'count': 1}},
+        ]
+    
+    def test_stop_times_sequence_valid(self, sample_gtfs_data):
+        """Test that trips are checked in stop_sequence order, not row order."""
+        stop_times = pd.concat([sample_gtfs_data["stop_times"], pd.DataFrame([
+            {"trip_id": "trip_3", "arrival_time": "09:10:00", "departure_time": "09:10:00",
+             "stop_id": "stop_3", "stop_sequence": 3},
+            {"trip_id": "trip_3", "arrival_time": "", "departure_time": "",
+             "stop_id": "stop_2", "stop_sequence": 2},
+            {"trip_id": "trip_3", "arrival_time": "09:00:00", "departure_time": "09:00:00",
+             "stop_id": "stop_1", "stop_sequence": 1},
+        ])], ignore_index=True).iloc[::-1]
+        feed = gk.Feed(dist_units="km", **dict(sample_gtfs_data, stop_times=stop_times))
+        
+        # Rows are reversed and the untimed middle stop is skipped
+        assert GTFSValidator()._validate_stop_times_sequence(feed) == []
+    
+    def test_stop_times_sequence_issues(self, sample_gtfs_data):
+        """Test duplicate stop sequences and arrival times going backwards."""
+        stop_times = pd.concat([sample_gtfs_data["stop_times"], pd.DataFrame([
+            # Three rows share stop_sequence 1, which counts as one case
+            {"trip_id": "trip_3", "arrival_time": "09:00:00", "departure_time": "09:00:00",
+             "stop_id": "stop_1", "stop_sequence": 1},
+            {"trip_id": "trip_3", "arrival_time": "09:00:00", "departure_time": "09:00:00",
+             "stop_id": "stop_2", "stop_sequence": 1},
+            {"trip_id": "trip_3", "arrival_time": "09:00:00", "departure_time": "09:00:00",
+             "stop_id": "stop_3", "stop_sequence": 1},
+            # trip_4 goes back in time twice, which counts as one trip
+            {"trip_id": "trip_4", "arrival_time": "10:00:00", "departure_time": "10:00:00",
+             "stop_id": "stop_1", "stop_sequence": 1},
+            {"trip_id": "trip_4", "arrival_time": "09:50:00", "departure_time": "09:50:00",
+             "stop_id": "stop_2", "stop_sequence": 2},
+            {"trip_id": "trip_4", "arrival_time": "09:40:00", "departure_time": "09:40:00",
+             "stop_id": "stop_3", "stop_sequence": 3},
+            # trip_5 goes back across an untimed stop
+            {"trip_id": "trip_5", "arrival_time": "11:00:00", "departure_time": "11:00:00",
+             "stop_id": "stop_1", "stop_sequence": 1},
+            {"trip_id": "trip_5", "arrival_time": None, "departure_time": None,
+             "stop_id": "stop_2", "stop_sequence": 2},
+            {"trip_id": "trip_5", "arrival_time": "10:30:00", "departure_time": "10:30:00",
+             "stop_id": "stop_3", "stop_sequence": 3},
+        ])], ignore_index=True)
+        feed = gk.Feed(dist_units="km", **dict(sample_gtfs_data, stop_times=stop_times))
+        
+        assert GTFSValidator()._validate_stop_times_sequence(feed) == [
+            {'message': "Duplicate stop sequences found in 1 cases", 'details': {'count': 1}},
+            {'message': "Arrival times decrease along the stop sequence in 2 trips", 'details': {'count': 2}},
+        ]
+    
+    def test_foreign_keys(self, sample_gtfs_data):
+        """Test that missing references are listed in order of first use."""
+        trips = pd.concat([sample_gtfs_data["trips"], pd.DataFrame([
+            {"route_id": "route_9", "service_id": "service_1", "trip_id": "trip_3", "direction_id": 0},
+        ])], ignore_index=True)
+        stop_times = pd.concat([sample_gtfs_data["stop_times"], pd.DataFrame([
+            {"trip_id": "trip_3", "arrival_time": "09:00:00", "departure_time": "09:00:00",
+             "stop_id": stop_id, "stop_sequence": sequence}
+            for sequence, stop_id in enumerate(["stop_z", "stop_1", "stop_a", "stop_z", None], start=1)
+        ])], ignore_index=True)
+        feed = gk.Feed(dist_units="km", **dict(sample_gtfs_data, trips=trips, stop_times=stop_times))
+        
+        assert GTFSValidator()._validate_foreign_keys(feed) == [
+            {'message': "Trips reference non-existent routes: ['route_9']",
+             'details': {'missing_route_ids': ['route_9']}},
+            {'message': "Stop times reference non-existent stops: ['stop_z', 'stop_a']",
+             'details': {'missing_stop_ids': ['stop_z', 'stop_a']}},
+        ]
+    
+    def test_service_dates(self, sample_gtfs_data):
+        """Test past and overly long service periods."""
+        calendar = pd.concat([sample_gtfs_data["calendar"]] * 3, ignore_index=True)
+        calendar["service_id"] = ["service_1", "service_2", "service_3"]
+        # Just over two years, exactly two years and a current period
+        calendar["start_date"] = ["20200101", "20200101", "20990101"]
+        calendar["end_date"] = ["20220102", "20211231", "20991231"]
+        feed = gk.Feed(dist_units="km", **dict(sample_gtfs_data, calendar=calendar))
+        
+        assert GTFSValidator()._validate_service_dates(feed) == [
+            {'message': "Service periods ending more than 30 days ago: 2", 'details': {'count': 2}},
+            {'message': "Service periods longer than 2 years: 1", 'details': {'count': 1}},
+        ]
+    
+    def test_route_names(self, sample_gtfs_data):
+        """Test that routes with only missing or blank names are reported."""
+        routes = pd.concat([sample_gtfs_data["routes"], pd.DataFrame([
+            {"route_id": "route_3", "route_short_name": "  ", "route_long_name": None, "route_type": 3},
+            {"route_id": "route_4", "route_short_name": "", "route_long_name": "Named", "route_type": 3},
+        ])], ignore_index=True)
+        feed = gk.Feed(dist_units="km", **dict(sample_gtfs_data, routes=routes))
+        
+        assert GTFSValidator()._validate_route_names(feed) == [
+            {'message': "Routes without names: 1", 'details': {'count': 1, 'route_ids': ['route_3']}},
+        ]
+    
+    def test_polars_backend_matches_pandas(self, messy_stop_times_processor):
+        """Test that both backends agree on nulls and malformed times."""
+        pytest.importorskip("polars")
+        stop_times = messy_stop_times_processor.feed.stop_times
+        pandas_validator = GTFSValidator(messy_stop_times_processor)
+        polars_validator = GTFSValidator(messy_stop_times_processor, backend="polars")
+        
+        # Duplicates: trip_5 and the stop times without trip_id; backwards
+        # arrivals: trip_3 and trip_4, whose unsequenced stops sort last
+        assert pandas_validator._count_sequence_issues(stop_times) == (2, 2)
+        assert polars_validator._count_sequence_issues_polars(stop_times) == (2, 2)
+        
+        pandas_report = pandas_validator.validate()
+        polars_report = polars_validator.validate()
+        for rule in ("foreign_keys", "stop_times_sequence"):
+            assert polars_report.get_issues_by_rule(rule) == pandas_report.get_issues_by_rule(rule)
@@ -1,5 +1,7 @@
 """Unit tests for helper functions."""
 
+import numpy as np
+import pandas as pd
 import pytest
 from datetime import timedelta
 
@@ -7,15 +9,18 @@ from databus.utils.helpers import (
     format_file_size,
     format_duration,
     calculate_distance,
+    calculate_distance_batch,
     parse_gtfs_time,
     format_gtfs_time,
     validate_coordinate,
+    validate_coordinates_batch,
     parse_gtfs_color,
     clean_gtfs_text,
     get_route_type_name,
     generate_unique_id,
     safe_divide,
     truncate_text,
+    truncate_series,
 )
 
 
@@ -53,6 +58,21 @@ class TestHelperFunctions:
         distance = calculate_distance(san_jose_lat, san_jose_lon, cartago_lat, cartago_lon)
         assert 15 < distance < 25  # Approximately 20 km
     
+    def test_calculate_distance_batch(self):
+        """Test vectorized distance calculation against the scalar version."""
+        lat1 = np.array([0.0, 9.9281, 9.9281])
+        lon1 = np.array([0.0, -84.0907, -84.0907])
+        lat2 = np.array([0.0, 9.8644, 10.0])
+        lon2 = np.array([0.0, -83.9173, -84.2])
+        
+        distances = calculate_distance_batch(lat1, lon1, lat2, lon2)
+        
+        expected = [calculate_distance(*point) for point in zip(lat1, lon1, lat2, lon2)]
+        np.testing.assert_allclose(distances, expected)
+        
+        # A single point broadcasts against many
+        assert calculate_distance_batch(9.9281, -84.0907, lat2, lon2).shape == (3,)
+    
     def test_parse_gtfs_time_valid(self):
         """Test parsing valid GTFS time formats."""
         assert parse_gtfs_time("08:30:00") == timedelta(hours=8, minutes=30)
@@ -113,6 +133,18 @@ class TestHelperFunctions:
         is_valid, error = validate_coordinate("invalid", 0)
         assert is_valid is False
         assert "numeric" in error
+        
+        # Missing coordinates
+        is_valid, error = validate_coordinate(float("nan"), 0)
+        assert is_valid is False
+        assert "finite" in error
+    
+    def test_validate_coordinates_batch(self):
+        """Test vectorized coordinate validation."""
+        lats = np.array([9.9281, 90, 91, 0, np.nan])
+        lons = np.array([-84.0907, -180, 0, 181, 0])
+        
+        assert validate_coordinates_batch(lats, lons).tolist() == [True, True, False, False, False]
     
     def test_parse_gtfs_color_valid(self):
         """Test parsing valid GTFS color formats."""
@@ -191,3 +223,13 @@ class TestHelperFunctions:
         short_truncated = truncate_text(text, 5, suffix="[...]")
         assert len(short_truncated) == 5
         assert not short_truncated.endswith("[...]")
+    
+    def test_truncate_series(self):
+        """Test vectorized text truncation against the scalar version."""
+        texts = pd.Series(["This is a long text", "Short", None], dtype="string")
+        
+        truncated = truncate_series(texts, 10)
+        
+        assert truncated.tolist()[:2] == [truncate_text(text, 10) for text in texts[:2]]
+        assert pd.isna(truncated.iloc[2])
+        assert truncate_series(texts, 5, suffix="[...]").tolist()[:2] == ["This ", "Short"]